@@ -0,0 +1,159 @@
+"""Scaling benchmarks for the Schedulix scheduling engine.
+
+    python bench.py run --output before.json
+    python bench.py run --sizes 100 10000 --ratios 1 8 --output after.json
+    python bench.py compare before.json after.json
+
+Every algorithm runs headlessly on generated workloads for each size and
+burst/quantum ratio. Wall time, peak traced memory and scheduling decisions
+per second are written to JSON, and compare flags cases that got slower.
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import engine
+import workload
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+DEFAULT_RATIOS = (1, 4, 16)
+QUANTUM = 4
+LOAD = 0.9  # Target CPU load of the generated workloads
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def bench_case(algorithm, table, quantum, repeat=3, memory=True):
+    wall = float("inf")
+    for _ in range(repeat):
+        # Like timeit, keep the cyclic GC out of the timed region
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = engine.run(algorithm, table, quantum)
+            wall = min(wall, time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    # Each non-idle segment is one dispatch decision
+    decisions = sum(1 for seg in result.segments if seg.pid is not None)
+    case = {
+        "wall_s": wall,
+        "decisions": decisions,
+        "decisions_per_s": decisions / wall if wall > 0 else None,
+        "segments": len(result.segments),
+        "peak_mb": None,
+    }
+    del result
+
+    if memory:
+        # Separate pass, since tracing slows the run down
+        tracemalloc.start()
+        engine.run(algorithm, table, quantum)
+        case["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return case
+
+
+def run_suite(sizes, ratios, algorithms, quantum=QUANTUM, seed=0, repeat=3, memory=True, log=print):
+    results = []
+    for size in sizes:
+        for ratio in ratios:
+            mean_burst = ratio * quantum
+            table = workload.generate(size, seed=seed, arrival_rate=LOAD / mean_burst, mean_burst=mean_burst)
+            table.arrival_order()  # Sorting is shared setup, not part of any one algorithm
+            for algorithm in algorithms:
+                case = {"algorithm": algorithm, "size": size, "ratio": ratio, "quantum": quantum}
+                case.update(bench_case(algorithm, table, quantum, repeat, memory))
+                results.append(case)
+                log(f"{algorithm:<22} n={size:<8} ratio={ratio:<3} {case['wall_s']:9.4f} s "
+                    f"{case['decisions_per_s'] or 0:12.0f} dec/s "
+                    + (f"{case['peak_mb']:8.1f} MB" if case["peak_mb"] is not None else ""))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare_results(base, new, tolerance=0.10):
+    # Returns (rows, regressions); a regression is a case slower by more than tolerance
+    def key(case):
+        return (case["algorithm"], case["size"], case["ratio"], case["quantum"])
+
+    base_cases = {key(c): c for c in base["results"]}
+    rows = []
+    regressions = []
+    for case in new["results"]:
+        old = base_cases.get(key(case))
+        if old is None or not old["wall_s"]:
+            continue
+        change = case["wall_s"] / old["wall_s"] - 1
+        rows.append((key(case), old["wall_s"], case["wall_s"], change))
+        if change > tolerance:
+            regressions.append(key(case))
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Schedulix schedulers.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the benchmark suite")
+    run.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run.add_argument("--ratios", type=int, nargs="+", default=DEFAULT_RATIOS,
+                     help="mean burst / quantum ratios to generate")
+    run.add_argument("--algorithms", nargs="+", default=list(engine.ALGORITHMS), choices=list(engine.ALGORITHMS))
+    run.add_argument("--quantum", type=int, default=QUANTUM)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeat", type=int, default=3, help="best-of repeats for wall time")
+    run.add_argument("--no-memory", action="store_true", help="skip the traced peak memory pass")
+    run.add_argument("--output", help="write results to this JSON file")
+
+    cmp = sub.add_parser("compare", help="compare two result files")
+    cmp.add_argument("base")
+    cmp.add_argument("new")
+    cmp.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown before failing (0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_suite(args.sizes, args.ratios, args.algorithms, args.quantum, args.seed,
+                           args.repeat, not args.no_memory)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows, regressions = compare_results(base, new, args.tolerance)
+    for (algorithm, size, ratio, quantum), old_s, new_s, change in rows:
+        flag = "  REGRESSION" if (algorithm, size, ratio, quantum) in regressions else ""
+        print(f"{algorithm:<22} n={size:<8} ratio={ratio:<3} {old_s:9.4f} s -> {new_s:9.4f} s {change:+7.1%}{flag}")
+    print(f"{len(regressions)} regression(s) over {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
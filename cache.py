@@ -0,0 +1,209 @@
+"""Content-addressed cache of schedule results.
+
+Entries are keyed by the workload fingerprint, the algorithm and (for
+algorithms that use one, such as Round Robin) the quantum, so an unchanged
+workload never has to be rescheduled. Every key also carries CODE_VERSION,
+a hash of the scheduling sources, so results from another build never hit.
+
+The in-memory tier is an LRU bounded by the approximate size of its
+entries: once over max_bytes, the oldest full results are cut down to their
+summaries. The optional disk tier only keeps summaries across restarts. A
+pickled million-process schedule takes longer to load than to recompute,
+and summaries are all comparisons and sweeps need. It is bounded in bytes
+too. Both tiers are safe to use from worker threads.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+
+from engine import uses_quantum
+from process_table import as_table
+
+# result is a ScheduleResult or None when only the summary was kept (comparisons)
+CacheEntry = namedtuple("CacheEntry", ["result", "summary"])
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "schedulix")
+
+CACHE_VERSION = 2  # Bump when entries change shape
+# Changes to any of these can change a schedule or its summary
+_VERSIONED_SOURCES = ("engine.py", "schedulers.py", "smp.py", "metrics.py")
+
+# Rough in-memory cost of a Segment and of a metrics row, with their ints
+SEGMENT_BYTES = 150
+METRIC_BYTES = 300
+SUMMARY_BYTES = 4096
+
+
+def _code_version():
+    digest = hashlib.sha1(str(CACHE_VERSION).encode())
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in _VERSIONED_SOURCES:
+        try:
+            with open(os.path.join(here, name), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(name.encode())
+    return digest.hexdigest()[:12]
+
+
+CODE_VERSION = _code_version()
+
+
+def cache_key(processes, algorithm, quantum=None):
+    quantum = quantum if uses_quantum(algorithm) else None
+    return (CODE_VERSION, as_table(processes).fingerprint(), algorithm, quantum)
+
+
+def entry_size(entry):
+    # Approximate bytes held by an entry; SMP results have lanes instead of segments
+    size = SUMMARY_BYTES
+    result = entry.result
+    if result is not None:
+        lanes = getattr(result, "lanes", None) or [result.segments]
+        size += SEGMENT_BYTES * sum(map(len, lanes)) + METRIC_BYTES * len(result.metrics)
+    return size
+
+
+class ResultCache:
+    def __init__(self, max_entries=256, directory=None, max_bytes=512 * 2 ** 20, max_disk_bytes=32 * 2 ** 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                self.directory = None  # Fall back to memory only
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _path(self, key):
+        name = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{CODE_VERSION}-{name}.pickle")
+
+    def get(self, key, need_result=False):
+        # need_result skips summary-only entries, which can't be replayed
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self.directory:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None or (need_result and entry.result is None):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key, result=None, summary=None):
+        # Never downgrade a full entry to a summary-only one
+        with self._lock:
+            old = self._entries.get(key)
+        if old is not None:
+            result = result if result is not None else old.result
+            summary = summary if summary is not None else old.summary
+        entry = CacheEntry(result, summary)
+        self._remember(key, entry)
+        if self.directory and summary is not None and (old is None or old.summary is None):
+            self._store(key, CacheEntry(None, summary))
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._bytes -= self._sizes.pop(key, 0)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._sizes[key] = entry_size(entry)
+            self._bytes += self._sizes[key]
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_key)
+            if self._bytes > self.max_bytes:
+                self._shrink(key)
+
+    def _shrink(self, newest):
+        # Oldest first: keep the summary of a full result, drop what has none.
+        # The newest entry stays whole even if it alone is over the limit.
+        for key in list(self._entries):
+            if self._bytes <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if key == newest or entry.result is None:
+                continue
+            self._bytes -= self._sizes.pop(key)
+            if entry.summary is None:
+                del self._entries[key]
+                continue
+            self._entries[key] = CacheEntry(None, entry.summary)
+            self._sizes[key] = entry_size(self._entries[key])
+            self._bytes += self._sizes[key]
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                stored_key, entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            return None
+        # Guard against a hash collision on the file name
+        if stored_key != key:
+            return None
+        try:
+            os.utime(self._path(key))  # Disk trimming drops the least recently used files
+        except OSError:
+            pass
+        return entry
+
+    def _store(self, key, entry):
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, entry), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+            self._trim_disk()
+        except OSError:
+            pass  # The disk tier is best effort
+
+    def _trim_disk(self):
+        # Files of other builds go first, then the least recently used
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pickle"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if not name.startswith(CODE_VERSION + "-"):
+                    os.remove(path)
+                    continue
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
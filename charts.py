@@ -0,0 +1,241 @@
+"""Chart windows for Schedulix.
+
+Each chart builds its Toplevel and matplotlib Figure the first time it is
+shown and keeps them: closing only hides the window, and a new result
+updates the existing bars and lines in place. Figures are created directly
+rather than through pyplot, so nothing piles up in pyplot's figure registry
+over a long session. matplotlib and numpy are only imported when the first
+chart is shown.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+SUMMARY_METRICS = ("TAT", "WT", "RT", "Throughput")
+BAR_COLORS = ["#4caf50", "#2196f3", "#ff9800", "#9c27b0"]
+SWEEP_SERIES = (("WT", "-"), ("WT p99", "--"), ("RT", "-"), ("RT p99", "--"))
+
+
+class ChartWindow:
+    title = ""
+    geometry = "800x600"
+    figsize = (10, 6)
+
+    def __init__(self, root):
+        self.root = root
+        self.window = None
+        self.figure = None
+        self.canvas = None
+
+    def show(self, *data):
+        if self.window is None or not self.window.winfo_exists():
+            self._create()
+        self.update(*data)
+        self.canvas.draw_idle()
+        self.window.deiconify()
+        self.window.lift()
+
+    def _create(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.window = tk.Toplevel(self.root)
+        self.window.title(self.title)
+        self.window.geometry(self.geometry)
+        self.window.configure(bg="#0f111a")
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+
+        self.figure = Figure(figsize=self.figsize, dpi=100, tight_layout=True)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.window)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        ttk.Button(self.window, text="Close", command=self.hide).pack(pady=10)
+        self.build(self.figure)
+
+    def hide(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.withdraw()
+
+    def destroy(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.destroy()
+        if self.figure is not None:
+            self.figure.clear()
+        self.window = self.figure = self.canvas = None
+
+    def build(self, figure):
+        raise NotImplementedError
+
+    def update(self, *data):
+        raise NotImplementedError
+
+
+class AlgorithmChart(ChartWindow):
+    geometry = "600x500"
+    figsize = (8, 5)
+
+    def build(self, figure):
+        self.ax = figure.add_subplot()
+        self.bars = self.ax.bar(SUMMARY_METRICS, [0] * len(SUMMARY_METRICS), color=BAR_COLORS)
+        self.ax.set_ylabel("Units", fontsize=12)
+        # Value labels on top of the bars, moved with them on every update
+        self.labels = [
+            self.ax.annotate("", xy=(bar.get_x() + bar.get_width() / 2, 0), xytext=(0, 3),
+                             textcoords="offset points", ha="center", va="bottom", fontsize=9)
+            for bar in self.bars
+        ]
+
+    def update(self, algorithm_name, summary):
+        title = f"{algorithm_name} Performance"
+        self.window.title(title)
+        self.ax.set_title(title, fontsize=14)
+        for bar, label, metric in zip(self.bars, self.labels, SUMMARY_METRICS):
+            height = summary[metric]
+            bar.set_height(height)
+            label.xy = (bar.get_x() + bar.get_width() / 2, height)
+            label.set_text(f"{height:.2f}")
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+
+class SweepChart(ChartWindow):
+    title = "Round Robin Quantum Sweep"
+    figsize = (10, 7)
+
+    def build(self, figure):
+        self.ax_time = figure.add_subplot(2, 1, 1)
+        self.ax_switch = figure.add_subplot(2, 1, 2, sharex=self.ax_time)
+        self.lines = {key: self.ax_time.plot([], [], style, label=key)[0] for key, style in SWEEP_SERIES}
+        self.best_time = self.ax_time.axvline(0, color="#00b894", linestyle=":", label="Best quantum")
+        self.ax_time.set_ylabel("Time Units", fontsize=12)
+        self.ax_time.set_title("Waiting and Response Time vs Quantum", fontsize=14)
+        self.legend = self.ax_time.legend(fontsize=9)
+
+        self.switches = self.ax_switch.plot([], [], color="#9c27b0")[0]
+        self.best_switch = self.ax_switch.axvline(0, color="#00b894", linestyle=":")
+        self.ax_switch.set_xlabel("Quantum", fontsize=12)
+        self.ax_switch.set_ylabel("Context Switches", fontsize=12)
+
+    def update(self, sweep, best):
+        quanta = [q for q, _ in sweep]
+        for key, line in self.lines.items():
+            line.set_data(quanta, [summary[key] for _, summary in sweep])
+        self.switches.set_data(quanta, [summary["Context Switches"] for _, summary in sweep])
+        for line in (self.best_time, self.best_switch):
+            line.set_xdata([best, best])
+        self.legend.get_texts()[-1].set_text(f"Best quantum = {best}")
+        for ax in (self.ax_time, self.ax_switch):
+            ax.relim()
+            ax.autoscale_view()
+
+
+class ComparisonChart(ChartWindow):
+    title = "Algorithm Comparison"
+
+    def build(self, figure):
+        self.ax = figure.add_subplot()
+        self.groups = []  # Bar containers, one per algorithm
+        self.algorithms = None
+
+    def update(self, results):
+        algorithms = list(results)
+        if algorithms != self.algorithms:
+            # A different set of schedules changes the bar layout, so lay it out again
+            self._layout(algorithms)
+        for group, algo in zip(self.groups, algorithms):
+            for bar, metric in zip(group, SUMMARY_METRICS):
+                bar.set_height(results[algo][metric])
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+    def _layout(self, algorithms):
+        import numpy as np
+
+        self.ax.clear()
+        self.algorithms = algorithms
+        x = np.arange(len(SUMMARY_METRICS))
+        width = 0.8 / max(1, len(algorithms))
+        self.groups = []
+        for i, algo in enumerate(algorithms):
+            offset = width * i - width * (len(algorithms) - 1) / 2
+            self.groups.append(self.ax.bar(x + offset, [0] * len(SUMMARY_METRICS), width, label=algo))
+
+        self.ax.set_xlabel("Metrics", fontsize=12)
+        self.ax.set_ylabel("Values", fontsize=12)
+        self.ax.set_title("Algorithm Comparison", fontsize=16)
+        self.ax.set_xticks(x)
+        self.ax.set_xticklabels(SUMMARY_METRICS, fontsize=10)
+        self.ax.legend(fontsize=10)
+
+
+class ReadyQueueChart(ChartWindow):
+    title = "Ready Queue Length"
+    geometry = "800x450"
+    figsize = (10, 4)
+
+    def build(self, figure):
+        self.ax = figure.add_subplot()
+        self.line = self.ax.step([], [], where="post", color="#2196f3")[0]
+        self.ax.set_xlabel("Time", fontsize=12)
+        self.ax.set_ylabel("Waiting Processes", fontsize=12)
+
+    def update(self, stats):
+        # stats is an instrument.RunStats; its samples are one per stride decisions
+        self.line.set_data(stats.sample_times, stats.sample_lengths)
+        self.ax.set_title(f"Ready Queue Length ({stats.decisions} decisions, every {stats.stride} sampled)",
+                          fontsize=14)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+
+class MonteCarloChart(ChartWindow):
+    title = "Monte Carlo Ranking"
+    figsize = (11, 6)
+
+    def build(self, figure):
+        self.ax_metric = figure.add_subplot(1, 2, 1)
+        self.ax_rank = figure.add_subplot(1, 2, 2, sharey=self.ax_metric)
+
+    def update(self, result):
+        # result is a montecarlo.MonteCarloResult. Error bars can't be moved in
+        # place, so both axes are redrawn; there is one bar per algorithm
+        from montecarlo import RANK, ranking
+
+        rows = ranking(result)
+        algorithms = [algorithm for algorithm, _, _ in rows]
+        ranks = {algorithm: (mean, half) for algorithm, mean, half in ranking(result, RANK)}
+        y = range(len(rows))
+        self.ax_metric.clear()
+        self.ax_rank.clear()
+        self.ax_metric.barh(y, [mean for _, mean, _ in rows], xerr=[half for _, _, half in rows],
+                            color="#2196f3", capsize=4)
+        self.ax_rank.barh(y, [ranks[a][0] for a in algorithms], xerr=[ranks[a][1] for a in algorithms],
+                          color="#ff9800", capsize=4)
+        self.ax_metric.set_yticks(list(y))
+        self.ax_metric.set_yticklabels(algorithms, fontsize=10)
+        self.ax_metric.invert_yaxis()  # Best at the top
+        self.ax_metric.set_xlabel(f"Mean {result.objective}", fontsize=12)
+        self.ax_rank.set_xlabel("Mean Rank (1 = best)", fontsize=12)
+        self.ax_rank.tick_params(labelleft=False)
+        self.ax_metric.set_title(f"{result.objective} over {result.trials} workloads "
+                                 f"({result.confidence:.0%} CI)", fontsize=13)
+        self.ax_rank.set_title(f"Rank by {result.objective}", fontsize=13)
+
+
+class ChartManager:
+    # The GUI's charts; each window is created on first use and then reused
+    def __init__(self, root):
+        self.algorithm = AlgorithmChart(root)
+        self.sweep = SweepChart(root)
+        self.comparison = ComparisonChart(root)
+        self.ready_queue = ReadyQueueChart(root)
+        self.monte_carlo = MonteCarloChart(root)
+
+    def all(self):
+        return (self.algorithm, self.sweep, self.comparison, self.ready_queue, self.monte_carlo)
+
+    def hide_all(self):
+        for chart in self.all():
+            chart.hide()
+
+    def destroy_all(self):
+        for chart in self.all():
+            chart.destroy()
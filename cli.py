@@ -0,0 +1,242 @@
+"""Command-line batch mode for Schedulix.
+
+    python main.py run --algo srtf --quantum 4 --input trace.csv --output result.json
+    python main.py run --algo all --input a.csv b.jsonl --jobs 4 --output metrics.csv
+    python main.py run --algo rr --cpus 8 --queues stealing --input trace.csv
+    python main.py run --algo srtf --input big.trace --output schedule.trace
+    python main.py montecarlo --trials 5000 --processes 200 --burst pareto --output ranking.json
+
+Every algorithm runs on every input file. With --jobs > 1 the runs are
+spread over worker processes. A .json output holds each run's summary,
+per-process metrics and (unless --summary-only) its schedule; a .csv output
+holds one row per process and run; a .trace output is the binary schedule
+trace of a single single-CPU run (see tracefile.py). --stats adds each
+run's decision counts and phase timings (see instrument.py). montecarlo
+ranks the algorithms over many seeded random workloads (see montecarlo.py).
+Nothing here imports Tk or matplotlib, so it works on headless machines.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import engine
+import montecarlo
+import smp
+import tracefile
+import workload
+from instrument import RunStats, format_stats, timed
+from metrics import summarize, format_summary
+
+# Short names for --algo, next to the full names used in the GUI
+ALIASES = {
+    "fcfs": "FCFS",
+    "sjf": "SJF (Non-preemptive)",
+    "srtf": "SJF (Preemptive)",
+    "priority": "Priority",
+    "rr": "Round Robin",
+    "ppriority": "Priority (Preemptive)",
+    "aging": "Priority (Aging)",
+    "mlfq": "MLFQ",
+}
+
+QUEUES = {
+    "global": "Global",
+    "per-cpu": "Per-CPU",
+    "stealing": "Per-CPU + Stealing",
+    "balancing": "Per-CPU + Balancing",
+}
+
+METRIC_FIELDS = ("pid", "arrival", "burst", "ct", "tat", "wt", "rt")
+
+_tables = None  # Input path -> table, set once per worker process by _init_worker
+
+
+def resolve_algorithms(names):
+    algorithms = []
+    for name in names:
+        if name.lower() == "all":
+            algorithms.extend(engine.ALGORITHMS)
+            continue
+        algorithm = ALIASES.get(name.lower())
+        if algorithm is None:
+            algorithm = next((a for a in engine.ALGORITHMS if a.lower() == name.lower()), None)
+        if algorithm is None:
+            raise ValueError(f"Unknown algorithm: {name} (use {', '.join(ALIASES)} or all)")
+        algorithms.append(algorithm)
+    return list(dict.fromkeys(algorithms))  # Drop duplicates, keep order
+
+
+def run_job(job, table):
+    # One (input, algorithm) run on the table loaded from the input; returns a JSON-ready dict
+    path, algorithm, quantum, cpus, queues, with_schedule, with_stats = job
+    run = {"input": path, "algorithm": algorithm,
+           "quantum": quantum if engine.uses_quantum(algorithm) else None}
+    stats = RunStats() if with_stats else None
+    if cpus > 1:
+        with timed(stats, "schedule"):
+            result = smp.run(algorithm, table, cpus, quantum, stats=stats, **smp.QUEUE_POLICIES[QUEUES[queues]])
+        with timed(stats, "metrics"):
+            summary = smp.summarize_smp(result)
+        run.update(cpus=cpus, queues=queues, summary=summary)
+        if with_schedule:
+            run["schedule"] = [[[seg.pid, seg.start, seg.end] for seg in lane] for lane in result.lanes]
+    else:
+        with timed(stats, "schedule"):
+            result = engine.run(algorithm, table, quantum, stats=stats)
+        with timed(stats, "metrics"):
+            run["summary"] = summarize(result.metrics, result.segments)
+        if with_schedule:
+            run["schedule"] = [[seg.pid, seg.start, seg.end] for seg in result.segments]
+    run["metrics"] = result.metrics
+    if stats is not None:
+        stats.context_switches = run["summary"]["Context Switches"]
+        run["stats"] = stats
+    return run
+
+
+def _init_worker(tables):
+    # Every input is shipped once per worker instead of once per algorithm
+    global _tables
+    _tables = tables
+
+
+def _run_job(job):
+    return run_job(job, _tables[job[0]])
+
+
+def run_batch(paths, algorithms, quantum=4, cpus=1, queues="global", jobs=1, with_schedule=True,
+              with_stats=False):
+    tables = {path: workload.load(path) for path in paths}
+    for table in tables.values():
+        table.arrival_order()  # Sorted once and shipped with the table
+    work = [(path, algorithm, quantum, cpus, queues, with_schedule, with_stats)
+            for path in paths for algorithm in algorithms]
+    if jobs <= 1 or len(work) == 1:
+        return [run_job(job, tables[job[0]]) for job in work]
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(jobs, len(work)), mp_context=ctx,
+                             initializer=_init_worker, initargs=(tables,)) as pool:
+        return list(pool.map(_run_job, work))
+
+
+def write_json(runs, f):
+    for run in runs:
+        run["metrics"] = {"columns": list(METRIC_FIELDS), "rows": [list(row) for row in run["metrics"]]}
+        if "stats" in run:
+            run["stats"] = run["stats"].as_dict()
+    json.dump({"runs": runs}, f)
+    f.write("\n")
+
+
+def write_csv(runs, f):
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(("input", "algorithm", "quantum", "cpus") + METRIC_FIELDS)
+    for run in runs:
+        prefix = (run["input"], run["algorithm"], run["quantum"] or "", run.get("cpus", 1))
+        writer.writerows(prefix + tuple(row) for row in run["metrics"])
+
+
+def write_trace(runs, path):
+    run = runs[0]
+    segments = [engine.Segment(*seg) for seg in run["schedule"]]
+    tracefile.write_schedule(engine.ScheduleResult(run["algorithm"], segments, run["metrics"]), path)
+
+
+def run_montecarlo(args):
+    spec = {"n": args.processes, "arrival_rate": args.arrival_rate, "burst": args.burst,
+            "mean_burst": args.mean_burst, "priority_levels": args.priority_levels, "priority": args.priority}
+    try:
+        result = montecarlo.evaluate(args.trials, spec, resolve_algorithms(args.algo), args.quantum, args.seed,
+                                     args.objective, args.confidence, args.jobs)
+    except (ValueError, workload.WorkloadError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(montecarlo.format_ranking(result))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(montecarlo.as_dict(result), f)
+            f.write("\n")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py", description="Run Schedulix without the GUI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="schedule workload files and write the results")
+    run.add_argument("--algo", nargs="+", default=["all"],
+                     help=f"algorithms to run: {', '.join(ALIASES)}, a full name, or all")
+    run.add_argument("--quantum", type=int, default=4, help="time quantum (Round Robin, MLFQ)")
+    run.add_argument("--input", nargs="+", required=True, help="workload files (.csv, .jsonl or .trace)")
+    run.add_argument("--output", help="write results to this .json, .csv or .trace file")
+    run.add_argument("--jobs", type=int, default=1, help="runs to execute in parallel")
+    run.add_argument("--cpus", type=int, default=1, help="simulate this many CPUs")
+    run.add_argument("--queues", choices=list(QUEUES), default="global", help="run queues when --cpus > 1")
+    run.add_argument("--summary-only", action="store_true", help="leave schedules out of JSON output")
+    run.add_argument("--quiet", action="store_true", help="don't print summaries")
+    run.add_argument("--stats", action="store_true", help="record decision counts and phase timings")
+
+    mc = sub.add_parser("montecarlo", help="rank the algorithms over many random workloads")
+    mc.add_argument("--trials", type=int, default=1000, help="random workloads to generate")
+    mc.add_argument("--seed", type=int, default=0, help="seed of the first workload; trial i uses seed + i")
+    mc.add_argument("--processes", type=int, default=montecarlo.DEFAULT_WORKLOAD["n"], help="processes per workload")
+    mc.add_argument("--arrival-rate", type=float, default=montecarlo.DEFAULT_WORKLOAD["arrival_rate"],
+                    help="Poisson arrivals per time unit")
+    mc.add_argument("--burst", choices=workload.BURST_DISTRIBUTIONS, default=montecarlo.DEFAULT_WORKLOAD["burst"])
+    mc.add_argument("--mean-burst", type=float, default=montecarlo.DEFAULT_WORKLOAD["mean_burst"])
+    mc.add_argument("--priority", choices=workload.PRIORITY_DISTRIBUTIONS, default="uniform")
+    mc.add_argument("--priority-levels", type=int, default=10)
+    mc.add_argument("--algo", nargs="+", default=["all"], help="algorithms to compare (as for run)")
+    mc.add_argument("--quantum", type=int, default=4, help="time quantum (Round Robin, MLFQ)")
+    mc.add_argument("--objective", choices=montecarlo.METRICS, default="WT", help="metric the ranking uses")
+    mc.add_argument("--confidence", type=float, default=0.95, help="confidence level of the intervals")
+    mc.add_argument("--jobs", type=int, help="worker processes (default: one per core)")
+    mc.add_argument("--output", help="write means and intervals to this .json file")
+    mc.add_argument("--quiet", action="store_true", help="don't print the ranking")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "montecarlo":
+        if args.output and not args.output.endswith(".json"):
+            parser.error("--output must end in .json")
+        if args.quantum <= 0 or (args.jobs is not None and args.jobs <= 0):
+            parser.error("--quantum and --jobs must be positive")
+        return run_montecarlo(args)
+
+    if args.output and not args.output.endswith((".json", ".csv", ".trace")):
+        parser.error("--output must end in .json, .csv or .trace")
+    if args.quantum <= 0 or args.cpus <= 0 or args.jobs <= 0:
+        parser.error("--quantum, --cpus and --jobs must be positive")
+    try:
+        algorithms = resolve_algorithms(args.algo)
+        if args.output and args.output.endswith(".trace"):
+            if len(algorithms) * len(args.input) != 1 or args.cpus > 1 or args.summary_only:
+                parser.error(".trace output holds the schedule of one single-CPU run")
+        runs = run_batch(args.input, algorithms, args.quantum, args.cpus, args.queues, args.jobs,
+                         with_schedule=not args.summary_only, with_stats=args.stats)
+    except (ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        for run in runs:
+            name = run["algorithm"] if run["quantum"] is None else f"{run['algorithm']} (q={run['quantum']})"
+            print(f"{run['input']}: {format_summary(name, run['summary'])}")
+            if "cpus" in run:
+                print(smp.format_smp(run["summary"]))
+            if "stats" in run:
+                print(format_stats(run["stats"]))
+
+    if args.output and args.output.endswith(".trace"):
+        write_trace(runs, args.output)
+    elif args.output:
+        with open(args.output, "w", newline="") as f:
+            if args.output.endswith(".csv"):
+                write_csv(runs, f)
+            else:
+                write_json(runs, f)
+    return 0
@@ -0,0 +1,136 @@
+"""Run many schedules of one workload in parallel.
+
+run_all compares every scheduling algorithm (those with a quantum at each
+of RR_QUANTA) and sweep_quanta evaluates Round Robin across a range of
+quanta. Each schedule runs headlessly in a worker process (one per core)
+and only its metrics summary comes back, so the whole batch takes about as
+long as its slowest schedule.
+"""
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import engine
+from cache import cache_key
+from metrics import summarize
+from process_table import as_table
+
+RR_QUANTA = (2, 4, 8)
+MAX_QUANTA = 1000  # Most quanta one sweep may try
+CANCEL_POLL = 0.2  # Seconds between checks of the cancel token while the pool works
+
+_workload = None  # Set once per worker process by _init_worker
+
+
+def comparison_jobs(quanta=RR_QUANTA):
+    # Algorithms with a quantum run once per quantum
+    jobs = [(name, None) for name in engine.ALGORITHMS if not engine.uses_quantum(name)]
+    jobs += [(name, q) for name in engine.ALGORITHMS if engine.uses_quantum(name) for q in quanta]
+    return jobs
+
+
+def job_label(algorithm, quantum):
+    return algorithm if quantum is None else f"{algorithm} (q={quantum})"
+
+
+def _init_worker(processes):
+    # The workload is shipped once per worker instead of once per job
+    global _workload
+    _workload = processes
+
+
+def _run_job(job):
+    algorithm, quantum = job
+    result = engine.run(algorithm, _workload, quantum or 1)
+    return summarize(result.metrics, result.segments)
+
+
+def _run_jobs(jobs):
+    return [_run_job(job) for job in jobs]
+
+
+def _map_jobs(processes, jobs, max_workers=None, cache=None, cancel=None):
+    # Returns one summary per job; cached jobs never reach the pool.
+    # cancel, a CancelToken, is polled while waiting: pending jobs are then
+    # dropped and SimulationCancelled raised once the running ones are done
+    table = as_table(processes)
+    summaries = {}
+    if cache is not None:
+        for job in jobs:
+            entry = cache.get(cache_key(table, *job))
+            if entry is not None:
+                summary = entry.summary or summarize(entry.result.metrics, entry.result.segments)
+                summaries[job] = summary
+
+    misses = [job for job in jobs if job not in summaries]
+    if misses:
+        table.arrival_order()  # Sort once here so every worker and every job reuses it
+        workers = min(max_workers or os.cpu_count() or 1, len(misses))
+        chunksize = max(1, len(misses) // (workers * 4))
+        chunks = [misses[i:i + chunksize] for i in range(0, len(misses), chunksize)]
+
+        # spawn keeps the workers clear of the parent's Tk state
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(table,))
+        try:
+            pending = {pool.submit(_run_jobs, chunk): chunk for chunk in chunks}
+            while pending:
+                finished, _ = wait(pending, timeout=CANCEL_POLL, return_when=FIRST_COMPLETED)
+                if cancel is not None and cancel.cancelled:
+                    raise engine.SimulationCancelled()
+                for future in finished:
+                    for job, summary in zip(pending.pop(future), future.result()):
+                        summaries[job] = summary
+                        if cache is not None:
+                            cache.put(cache_key(table, *job), summary=summary)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    return [summaries[job] for job in jobs]
+
+
+def run_all(processes, quanta=RR_QUANTA, max_workers=None, cache=None, cancel=None):
+    # Returns {label: summary} in job order
+    jobs = comparison_jobs(quanta)
+    return dict(zip((job_label(*job) for job in jobs), _map_jobs(processes, jobs, max_workers, cache, cancel)))
+
+
+def parse_quanta(text):
+    # "1-50", "1-50:5" (with step) or "2,4,8" -> sorted list of positive quanta
+    quanta = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        bounds, _, step = part.partition(":")
+        low, _, high = bounds.partition("-") if "-" in bounds else (bounds, "", bounds)
+        try:
+            low, high, step = int(low), int(high), int(step or 1)
+        except ValueError:
+            raise ValueError(f"Can't read quanta '{part}'; use e.g. 1-50, 1-100:5 or 2,4,8.") from None
+        if step <= 0:
+            raise ValueError(f"The step in '{part}' must be a positive integer.")
+        span = range(low, high + 1, step)
+        if not span:
+            raise ValueError(f"The range '{part}' is empty; write the lower bound first.")
+        if len(span) + len(quanta) > MAX_QUANTA:
+            raise ValueError(f"A sweep can try at most {MAX_QUANTA} quanta; use a step, e.g. 1-10000:10.")
+        quanta.update(span)
+    if not quanta or min(quanta) <= 0:
+        raise ValueError("Quanta must be positive integers, e.g. 1-50 or 2,4,8.")
+    return sorted(quanta)
+
+
+def sweep_quanta(processes, quanta, max_workers=None, cache=None, cancel=None):
+    # Returns [(quantum, summary)] in quantum order
+    table = as_table(processes)
+    # Every quantum >= the longest burst gives the same schedule, so run it once
+    longest = max(table.burst, default=1) or 1
+    distinct = sorted({min(q, longest) for q in quanta})
+    jobs = [("Round Robin", q) for q in distinct]
+    summaries = dict(zip(distinct, _map_jobs(table, jobs, max_workers, cache, cancel)))
+    return [(q, summaries[min(q, longest)]) for q in quanta]
+
+
+def best_quantum(sweep, objective="WT"):
+    # Lowest objective wins; fewer context switches breaks ties
+    return min(sweep, key=lambda item: (item[1][objective], item[1]["Context Switches"]))[0]
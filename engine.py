@@ -0,0 +1,168 @@
+"""Headless scheduling engine for Schedulix.
+
+run() takes a ProcessTable (or a list of process dicts, which is converted)
+and returns a ScheduleResult. The algorithms are the Scheduler policies
+registered in schedulers.py, all driven by the one loop in simulate().
+Nothing in here touches Tk, so schedules can be computed in batch jobs and
+tests and then replayed by the GUI.
+
+Given a checkpoints list, a run also records its state every so often
+as a Checkpoint, and given resume it continues from one of them. The
+state names processes by arrival rank rather than table row, so it stays
+valid for a table whose changes all arrive after the checkpoint (see
+incremental.py).
+"""
+from array import array
+from collections import namedtuple
+
+from process_table import as_table
+from schedulers import REGISTRY
+
+# pid is None for CPU idle time
+Segment = namedtuple("Segment", ["pid", "start", "end"])
+
+# metrics rows are (pid, arrival, burst, completion, tat, wt, rt) in completion order
+ScheduleResult = namedtuple("ScheduleResult", ["algorithm", "segments", "metrics"])
+
+# A resumable point in a run: the clock, how many segments and metrics rows
+# were final, and the scheduler's own state keyed by arrival rank
+Checkpoint = namedtuple("Checkpoint", ["time", "segments", "metrics", "state"])
+
+# Algorithm name -> Scheduler class; schedulers.register adds to it
+ALGORITHMS = REGISTRY
+
+PROGRESS_INTERVAL = 1024  # Completed processes between progress callbacks
+CHECKPOINT_INTERVAL = 1024  # Minimum segments between checkpoints
+
+
+class SimulationCancelled(Exception):
+    pass
+
+
+class CancelToken:
+    # Shared between the GUI and a worker; simulate() polls it once per decision
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+_NEVER_CANCELLED = CancelToken()
+
+
+def _resume(resume):
+    # resume is (checkpoint, segments, metrics); the two lists are the earlier
+    # run's output up to the checkpoint and are extended in place
+    if resume is None:
+        return 0, [], [], None
+    checkpoint, segments, metrics = resume
+    return checkpoint.time, segments, metrics, checkpoint.state
+
+
+def _next_checkpoint(segments, scheduler):
+    # Copying the ready queue into a checkpoint costs O(len(ready)), so bigger
+    # queues are checkpointed less often and the cost per decision stays O(1)
+    return len(segments) + max(CHECKPOINT_INTERVAL, len(scheduler))
+
+
+def _metric(table, idx, completion_time, response_time):
+    arrival = table.arrival[idx]
+    burst = table.burst[idx]
+    tat = completion_time - arrival
+    return (table.pid[idx], arrival, burst, completion_time, tat, tat - burst, response_time)
+
+
+def simulate(scheduler_class, processes, quantum=None, cancel=_NEVER_CANCELLED, progress=None, stats=None,
+             checkpoints=None, resume=None):
+    # The one scheduling loop: the policy keeps the ready queue (see
+    # schedulers.py), this keeps the clock and everything the run outputs
+    table = as_table(processes)
+    arrival, pid = table.arrival, table.pid
+    order = table.arrival_order()
+    n = len(order)
+    scheduler = scheduler_class(table, order, quantum)
+    preemptive = scheduler.preemptive
+    admit, pick, time_slice_of, requeue = scheduler.admit, scheduler.pick, scheduler.time_slice, scheduler.requeue
+    current_time, segments, metrics, state = _resume(resume)
+    cursor = 0
+    remaining = array("q", table.burst)  # Per-run copy, the table itself is never written
+    first_run = [None] * len(table)
+    if state:
+        cursor, saved, waiting = state
+        scheduler.restore(saved)
+        for rank, left, started in waiting:
+            remaining[order[rank]] = left
+            first_run[order[rank]] = started
+    next_checkpoint = _next_checkpoint(segments, scheduler)
+
+    while True:
+        if cancel.cancelled:
+            raise SimulationCancelled()
+        if checkpoints is not None and len(segments) >= next_checkpoint:
+            waiting = [(rank, remaining[order[rank]], first_run[order[rank]]) for rank in scheduler.waiting()]
+            state = (cursor, scheduler.save(), waiting)
+            checkpoints.append(Checkpoint(current_time, len(segments), len(metrics), state))
+            next_checkpoint = _next_checkpoint(segments, scheduler)
+        # Admit every process that has arrived by now
+        while cursor < n and arrival[order[cursor]] <= current_time:
+            admit(cursor, current_time)
+            cursor += 1
+
+        if not len(scheduler):
+            if cursor == n:
+                break
+            # No process available, idle CPU until next arrival
+            next_arrival = arrival[order[cursor]]
+            segments.append(Segment(None, current_time, next_arrival))
+            current_time = next_arrival
+            continue
+
+        rank = pick(current_time)
+        idx = order[rank]
+        if stats is not None:
+            stats.decision(current_time, len(scheduler), pid[idx])
+        if first_run[idx] is None:
+            first_run[idx] = current_time
+
+        time_slice = time_slice_of(rank, remaining[idx])
+        if preemptive and cursor < n:
+            # Preemptive policies decide again when the next process arrives
+            time_slice = min(time_slice, arrival[order[cursor]] - current_time)
+        segments.append(Segment(pid[idx], current_time, current_time + time_slice))
+        current_time += time_slice
+        remaining[idx] -= time_slice
+
+        # New arrivals during this slice queue up ahead of the preempted process
+        while cursor < n and arrival[order[cursor]] <= current_time:
+            admit(cursor, current_time)
+            cursor += 1
+
+        if remaining[idx] > 0:
+            requeue(rank, current_time, remaining[idx])
+            if stats is not None:
+                stats.requeue(pid[idx])
+        else:
+            metrics.append(_metric(table, idx, current_time, first_run[idx] - arrival[idx]))
+            if progress and len(metrics) % PROGRESS_INTERVAL == 0:
+                progress(len(metrics), n)
+
+    return ScheduleResult(scheduler.name, segments, metrics)
+
+
+def uses_quantum(algorithm):
+    return ALGORITHMS[algorithm].uses_quantum
+
+
+def run(algorithm, processes, quantum=4, cancel=None, progress=None, stats=None, checkpoints=None,
+        resume=None):
+    # progress(completed, total) is called every PROGRESS_INTERVAL completions;
+    # stats, an instrument.RunStats, records every decision when given;
+    # checkpoints, a list, collects Checkpoints for a later resume
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    scheduler_class = ALGORITHMS[algorithm]
+    if scheduler_class.uses_quantum and quantum <= 0:
+        raise ValueError("Quantum must be a positive integer.")
+    return simulate(scheduler_class, processes, quantum, cancel or _NEVER_CANCELLED, progress, stats,
+                    checkpoints, resume)
@@ -0,0 +1,110 @@
+"""Bounded, batched execution log for the Schedulix GUI.
+
+write() only appends to a bounded queue; the Text widget is updated by one
+flush per FLUSH_MS with a single insert, and is trimmed to the newest
+capacity lines, so a long simulation costs neither UI time nor memory per
+line. Messages above the chosen verbosity are dropped on arrival, and
+callers can check enabled() to skip formatting them at all. stream_to()
+additionally writes every message, at every level, to a file, which is
+flushed on its own timer and every FILE_FLUSH_LINES lines whether or not
+anything reaches the widget.
+"""
+from collections import deque
+
+# Verbosity levels; a message is shown when its level is at most the verbosity
+WARNING, INFO, DETAIL = 0, 1, 2
+VERBOSITY = {"Quiet": WARNING, "Normal": INFO, "Verbose": DETAIL}
+
+FLUSH_MS = 100  # Widget refresh interval
+CAPACITY = 2000  # Lines kept in the widget
+FILE_FLUSH_MS = 1000  # Longest a streamed line waits before it reaches the disk
+FILE_FLUSH_LINES = 1000  # Streamed lines that trigger an immediate flush
+
+
+class ExecutionLog:
+    def __init__(self, root, text, capacity=CAPACITY, flush_ms=FLUSH_MS, verbosity=DETAIL):
+        self.root = root
+        self.text = text
+        self.capacity = capacity
+        self.flush_ms = flush_ms
+        self.verbosity = verbosity
+        self.pending = deque(maxlen=capacity)  # Ring buffer of lines waiting for the next flush
+        self.dropped = 0  # Lines pushed out of pending before they were shown
+        self.widget_lines = 0
+        self.file = None
+        self._file_lines = 0  # Lines written to file since its last flush
+        self._after_id = None
+        self._file_after_id = None
+
+    def enabled(self, level):
+        return level <= self.verbosity or self.file is not None
+
+    def write(self, message, level=INFO):
+        if self.file is not None:
+            self.file.write(message + "\n")
+            self._file_lines += 1
+            if self._file_lines >= FILE_FLUSH_LINES:
+                self.flush_file()
+            elif self._file_after_id is None:
+                self._file_after_id = self.root.after(FILE_FLUSH_MS, self.flush_file)
+        if level > self.verbosity:
+            return
+        if len(self.pending) == self.capacity:
+            self.dropped += 1
+        self.pending.append(message)
+        if self._after_id is None:
+            self._after_id = self.root.after(self.flush_ms, self.flush)
+
+    def flush(self):
+        self._after_id = None
+        if not self.pending:
+            return
+        lines = list(self.pending)
+        self.pending.clear()
+        if self.dropped:
+            # pending was full, so the notice takes the oldest line's place
+            # rather than pushing capacity + 1 lines and being trimmed itself
+            lines[0] = f"... {self.dropped + 1} lines skipped ..."
+            self.dropped = 0
+        self.text.insert("end", "\n".join(lines) + "\n")
+        self.widget_lines += len(lines)
+        if self.widget_lines > self.capacity:
+            excess = self.widget_lines - self.capacity
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self.widget_lines = self.capacity
+        self.text.see("end")
+
+    def flush_file(self):
+        if self._file_after_id is not None:
+            self.root.after_cancel(self._file_after_id)
+            self._file_after_id = None
+        self._file_lines = 0
+        if self.file is not None:
+            self.file.flush()
+
+    def clear(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.pending.clear()
+        self.dropped = 0
+        self.text.delete("1.0", "end")
+        self.widget_lines = 0
+
+    def set_verbosity(self, verbosity):
+        self.verbosity = verbosity
+
+    def stream_to(self, path):
+        # Streams the full, unfiltered log to path until stop_streaming()
+        self.stop_streaming()
+        self.file = open(path, "w", encoding="utf-8")
+
+    def stop_streaming(self):
+        if self.file is not None:
+            self.flush_file()
+            self.file.close()
+            self.file = None
+
+    @property
+    def streaming(self):
+        return self.file is not None
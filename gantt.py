@@ -0,0 +1,442 @@
+"""Gantt chart rendering for Schedulix.
+
+The chart is a viewport onto the schedule: view_start and time_unit (pixels
+per time unit) decide what is on screen, and the canvas only ever holds
+items for the visible time window. Each lane's segments live in a LaneIndex
+so the window is found by bisection, and runs of slices narrower than a few
+pixels are merged into one bar, so even schedules with millions of segments
+pan and zoom smoothly. Multi-CPU schedules get one lane per CPU.
+
+Animation stretches the rectangles of the running segments and follows the
+clock across the timeline. Frames are scheduled with root.after, so every
+canvas call happens on the Tk main thread and the UI stays responsive while
+a schedule plays. render_time adds up the time spent in those frames, for
+the run statistics.
+
+A finished schedule can also be shown up to a cursor time: seek() jumps
+there and replay() moves the cursor forward at any speed until pause().
+Each frame only redraws the visible window, so scrubbing costs the same at
+any point of a long schedule.
+"""
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import count, islice, repeat
+from operator import itemgetter
+from time import perf_counter
+
+# Milliseconds of animation per simulated time unit; 0 draws everything at once
+SPEEDS = {"Slow": 250, "Normal": 100, "Fast": 20, "Instant": 0}
+
+FRAME_MS = 16  # Never schedule frames faster than ~60 fps
+
+LANE_AREA = 140   # Pixels shared by the lanes of a multi-CPU chart
+MIN_LABEL_HEIGHT = 14  # Thinner lanes are drawn without PID labels
+MIN_LABEL_WIDTH = 24   # Narrower bars are drawn without PID labels
+MIN_BAR_WIDTH = 3      # Runs of slices narrower than this merge into one bar
+AGGREGATE_COLOR = "#8a8fa8"
+
+ZOOM_STEP = 1.5
+MIN_TIME_UNIT = 1e-6  # Pixels per time unit at the furthest zoom out
+MAX_TIME_UNIT = 400
+MARKER_SPACING = 60   # Aim for a time marker about every 60 pixels
+SCROLL_UNIT = 40      # Pixels per scrollbar arrow click
+
+
+class LaneIndex:
+    # The segments of one lane are sorted and never overlap, so both their
+    # starts and their ends are monotonic and a time window is two bisections.
+    def __init__(self, segments):
+        self.segments = segments
+        self.starts = array("d", map(itemgetter(1), segments))
+        self.ends = array("d", map(itemgetter(2), segments))
+
+    def __len__(self):
+        return len(self.segments)
+
+    def window(self, t0, t1):
+        # Index range of the segments overlapping (t0, t1)
+        return bisect_right(self.ends, t0), bisect_left(self.starts, t1)
+
+    @property
+    def end(self):
+        return self.ends[-1] if self.segments else 0
+
+
+class GanttRenderer:
+    def __init__(self, root, canvas, time_unit=30, x_origin=10, y_pos=100, height=50,
+                 xscrollcommand=None, default_width=1150):
+        self.root = root
+        self.canvas = canvas
+        self.time_unit = time_unit
+        self.x_origin = x_origin
+        self.y_pos = y_pos
+        self.height = height
+        self.xscrollcommand = xscrollcommand  # Usually a ttk.Scrollbar's set method
+        self.default_width = default_width    # Used until the canvas has been mapped
+        self.timeline = None
+        self.lanes = 1
+        self.lane_height = height
+        self.timeline_y = y_pos + height // 2
+        self.view_start = 0.0
+        self.index = []  # LaneIndex per lane
+        self.extent = 0
+        self.color_of = None  # Kept after playback for redraws on pan and zoom
+        self.render_time = 0.0  # Seconds spent drawing the current or last playback
+        self.cursor = None  # Time the chart is shown up to while scrubbing; None shows it all
+        self._after_id = None
+        self._reset_state()
+
+    def _reset_state(self):
+        self.pending = iter(())  # (segment, lane) not yet started, in start order
+        self.head = None  # Look-ahead into pending
+        self.on_segment = None
+        self.on_done = None
+        self.clock = None  # Animation clock; None once everything is drawn
+        self.on_time = None  # Replay callbacks
+        self.on_replayed = None
+        self.step = 0.0
+        self.interval = 0
+        self._active = {}  # id -> (segment, lane, rectangle being stretched)
+        self._ids = count()
+
+    def clear(self):
+        self.cancel()
+        self.canvas.delete("all")
+        self.lanes = 1
+        self.lane_height = self.height
+        self.timeline_y = self.y_pos + self.height // 2
+        self.timeline = self.canvas.create_line(0, self.timeline_y, 0, self.timeline_y, fill="#00ffcc", width=4)
+        self.view_start = 0.0
+        self.index = []
+        self.extent = 0
+        self.cursor = None
+        self._update_scrollbar()
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._reset_state()
+
+    # Viewport
+
+    def width(self):
+        width = self.canvas.winfo_width()
+        return width if width > 1 else self.default_width
+
+    def span(self):
+        return (self.width() - self.x_origin) / self.time_unit
+
+    def x_of(self, t):
+        return self.x_origin + (t - self.view_start) * self.time_unit
+
+    def time_at(self, x):
+        return self.view_start + (x - self.x_origin) / self.time_unit
+
+    def _clamp_view(self):
+        self.view_start = max(0.0, min(self.view_start, self.extent - self.span() * 0.9))
+
+    def zoom(self, factor, x=None):
+        # Zooms around canvas x (default: the middle), keeping that time in place
+        if x is None:
+            x = (self.x_origin + self.width()) / 2
+        anchor = self.time_at(x)
+        self.time_unit = max(MIN_TIME_UNIT, min(MAX_TIME_UNIT, self.time_unit * factor))
+        self.view_start = anchor - (x - self.x_origin) / self.time_unit
+        self._clamp_view()
+        self.redraw()
+
+    def zoom_to_fit(self):
+        if self.extent > 0:
+            fit = (self.width() - 2 * self.x_origin) / self.extent
+            self.time_unit = max(MIN_TIME_UNIT, min(MAX_TIME_UNIT, fit))
+        self.view_start = 0.0
+        self.redraw()
+
+    def xview(self, *args):
+        # Tk scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self.view_start = float(args[1]) * self.extent
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                self.view_start += amount * self.span() * 0.9
+            else:
+                self.view_start += amount * SCROLL_UNIT / self.time_unit
+        self._clamp_view()
+        self.redraw()
+
+    def _fractions(self):
+        if self.extent <= 0:
+            return 0.0, 1.0
+        first = self.view_start / self.extent
+        return max(0.0, first), min(1.0, first + self.span() / self.extent)
+
+    def _update_scrollbar(self):
+        if self.xscrollcommand:
+            self.xscrollcommand(*self._fractions())
+
+    # Drawing
+
+    def play(self, segments, color_of, ms_per_unit=100, on_segment=None, on_done=None, start_time=0):
+        self.play_lanes([segments], color_of, ms_per_unit, on_segment, on_done, start_time)
+
+    def play_lanes(self, lanes, color_of, ms_per_unit=100, on_segment=None, on_done=None, start_time=0):
+        # color_of(pid) -> fill color, pid is None for idle segments.
+        # on_segment(segment, lane) is called as each segment finishes drawing.
+        # Segments that end by start_time are shown at once, without on_segment.
+        self.render_time = 0.0
+        started = perf_counter()
+        self.load(lanes, color_of)
+        self.on_segment = on_segment
+        self.on_done = on_done
+        if start_time:
+            lanes = [islice(segs, bisect_right(index.ends, start_time), None) for segs, index in zip(lanes, self.index)]
+        if len(lanes) == 1:
+            self.pending = zip(lanes[0], repeat(0))
+        else:
+            self.pending = heapq.merge(*(zip(segs, repeat(lane)) for lane, segs in enumerate(lanes)),
+                                       key=lambda item: item[0].start)
+
+        if ms_per_unit <= 0:
+            if on_segment:
+                for seg, lane in self.pending:
+                    on_segment(seg, lane)
+            self.render_time += perf_counter() - started
+            self._finish()
+            return
+
+        self.head = next(self.pending, None)
+        self.interval = max(FRAME_MS, ms_per_unit)
+        self.step = self.interval / ms_per_unit
+        self.clock = self.head[0].start if self.head else 0
+        if not self.view_start <= self.clock < self.view_start + self.span():
+            self.view_start = self.clock
+        self.redraw()
+        self.render_time += perf_counter() - started
+        self._tick()
+
+    def load(self, lanes, color_of):
+        # Takes over a schedule without drawing it
+        self.clear()
+        self.lanes = max(1, len(lanes))
+        if self.lanes > 1:
+            self.lane_height = max(1, min(self.height, LANE_AREA // self.lanes))
+            self.timeline_y = self.y_pos + self.lanes * self.lane_height + 4
+        self.index = [LaneIndex(segs) for segs in lanes]
+        self.extent = max((lane.end for lane in self.index), default=0)
+        self.color_of = color_of
+
+    # Scrubbing and replay of a loaded schedule
+
+    def seek(self, t):
+        self.pause()
+        self._show_until(t)
+
+    def replay(self, ms_per_unit, on_time=None, on_done=None):
+        # Moves the cursor from where it is (the start, once at the end) at
+        # ms_per_unit; on_time(t) follows every frame, on_done() the end
+        self.pause()
+        if self.cursor is None or self.cursor >= self.extent:
+            self._show_until(0)
+        self.on_time = on_time
+        self.on_replayed = on_done
+        self.step = FRAME_MS / max(ms_per_unit, 1e-9)
+        self._after_id = self.root.after(FRAME_MS, self._replay_tick)
+
+    def pause(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.on_time = self.on_replayed = None
+
+    @property
+    def replaying(self):
+        # A live animation runs on the clock instead
+        return self._after_id is not None and self.clock is None
+
+    def _replay_tick(self):
+        self._after_id = None
+        self._show_until(min(self.extent, self.cursor + self.step))
+        if self.on_time:
+            self.on_time(self.cursor)
+        if self.cursor < self.extent:
+            self._after_id = self.root.after(FRAME_MS, self._replay_tick)
+            return
+        on_done = self.on_replayed
+        self.on_time = self.on_replayed = None
+        if on_done:
+            on_done()
+
+    def _show_until(self, t):
+        self.cursor = max(0, min(t, self.extent))
+        # Keep the cursor in view, near the left edge when the view has to move
+        if not self.view_start <= self.cursor <= self.view_start + self.span():
+            self.view_start = self.cursor - self.span() * 0.1
+            self._clamp_view()
+        self.redraw()
+
+    def redraw(self):
+        # Rebuilds the canvas items for the visible window
+        self.canvas.delete("bar")
+        self.canvas.delete("marker")
+        t0, t1 = self.view_start, self.view_start + self.span()
+        self._draw_markers(t0, t1)
+
+        for lane, index in enumerate(self.index):
+            i, j = index.window(t0, t1)
+            if self.clock is not None:
+                # Mid-animation, only finished segments; _tick redraws the running ones
+                j = max(i, min(j, bisect_right(index.ends, self.clock, i)))
+            elif self.cursor is not None:
+                # Scrubbing: finished segments, then the one running at the cursor cut short
+                k = max(i, min(j, bisect_right(index.ends, self.cursor, i)))
+                if k < j and index.starts[k] < self.cursor:
+                    self._draw_bar(index.segments[k], lane, end=self.cursor)
+                j = k
+            self._draw_range(index, lane, i, j)
+
+        for key, (seg, lane, _) in self._active.items():
+            self._active[key] = (seg, lane, None)
+        if self.clock is not None:
+            self._move_timeline(self.clock)
+        else:
+            self._move_timeline(self.extent if self.cursor is None else self.cursor)
+        self._update_scrollbar()
+
+    def _draw_range(self, index, lane, i, j):
+        starts, ends, segments = index.starts, index.ends, index.segments
+        min_span = MIN_BAR_WIDTH / self.time_unit
+        while i < j:
+            start = starts[i]
+            if ends[i] - start >= min_span:
+                self._draw_bar(segments[i], lane)
+                i += 1
+                continue
+            # Merge the run of short slices starting within min_span; only the
+            # last slice of the run can be wide, and that one is kept separate.
+            k = bisect_left(starts, start + min_span, i + 1, j)
+            if k - 1 > i and ends[k - 1] - starts[k - 1] >= min_span:
+                k -= 1
+            if k == i + 1:
+                self._draw_bar(segments[i], lane)
+            else:
+                self._draw_aggregate(start, ends[k - 1], lane)
+            i = k
+
+    def _bar_coords(self, start, end, lane=0):
+        # Clipped to the canvas, so far-off segments never make huge coordinates
+        width = self.width()
+        y0 = self.y_pos + lane * self.lane_height
+        x0 = max(-10, min(width + 10, self.x_of(start)))
+        x1 = max(-10, min(width + 10, self.x_of(end)))
+        return (x0, y0, x1, y0 + self.lane_height)
+
+    def _outline(self):
+        return 2 if self.lane_height >= MIN_LABEL_HEIGHT else 0
+
+    def _draw_bar(self, seg, lane, end=None):
+        x0, y0, x1, y1 = self._bar_coords(seg.start, seg.end if end is None else end, lane)
+        rect = self.canvas.create_rectangle(x0, y0, x1, y1, fill=self.color_of(seg.pid), outline="white",
+                                            width=self._outline(), tags="bar")
+        if end is None:
+            self._draw_label(seg, x0, x1, y0)
+        return rect
+
+    def _draw_label(self, seg, x0, x1, y0):
+        if x1 - x0 >= MIN_LABEL_WIDTH and self.lane_height >= MIN_LABEL_HEIGHT:
+            label = "IDLE" if seg.pid is None else f"P{seg.pid}"
+            self.canvas.create_text((x0 + x1) / 2, y0 + self.lane_height / 2, text=label,
+                                    fill="white", font=("Helvetica", 10, "bold"), tags="bar")
+
+    def _draw_aggregate(self, start, end, lane):
+        x0, y0, x1, y1 = self._bar_coords(start, end, lane)
+        self.canvas.create_rectangle(x0, y0, x1, y1, fill=AGGREGATE_COLOR, outline="", tags="bar")
+
+    def _draw_markers(self, t0, t1):
+        # A 1/2/5 x 10^k step keeps markers about MARKER_SPACING pixels apart
+        target = MARKER_SPACING / self.time_unit
+        step = 1
+        while step < target:
+            for factor in (2, 5, 10):
+                if step * factor >= target:
+                    step *= factor
+                    break
+            else:
+                step *= 10
+        t = int(t0 // step) * step
+        while t <= t1:
+            x = self.x_of(t)
+            if x >= self.x_origin - 1:
+                self.canvas.create_line(x, 85, x, 95, fill="white", width=2, tags="marker")
+                self.canvas.create_text(x, 75, text=str(t), fill="white", font=("Helvetica", 8), tags="marker")
+            t += step
+
+    def _move_timeline(self, t):
+        x = max(0, min(self.width(), self.x_of(t)))
+        self.canvas.coords(self.timeline, 0, self.timeline_y, x, self.timeline_y)
+
+    def _visible(self, start, end):
+        return end >= self.view_start and start <= self.view_start + self.span()
+
+    def _tick(self):
+        self._after_id = None
+        started = perf_counter()
+        previous = self.clock
+        self.clock += self.step
+
+        # Follow the clock when it runs off the right edge of the view
+        view_end = self.view_start + self.span()
+        if previous <= view_end < self.clock:
+            self.view_start = self.clock - self.span() * 0.1
+            self.redraw()
+
+        while self.head is not None:
+            seg, lane = self.head
+            if seg.start >= self.clock and seg.end > self.clock:
+                break
+            self._active[next(self._ids)] = (seg, lane, None)
+            self.head = next(self.pending, None)
+
+        for key, (seg, lane, rect) in list(self._active.items()):
+            if seg.end <= self.clock:
+                del self._active[key]
+                self._draw_segment(seg, lane, rect)
+                continue
+            if not self._visible(seg.start, self.clock):
+                continue
+            # Stretch the running segment up to the animation clock
+            if rect is None:
+                self._active[key] = (seg, lane, self._draw_bar(seg, lane, end=self.clock))
+            else:
+                self.canvas.coords(rect, *self._bar_coords(seg.start, self.clock, lane))
+        self._move_timeline(self.clock)
+        self.render_time += perf_counter() - started
+
+        if self.head is not None or self._active:
+            self._after_id = self.root.after(self.interval, self._tick)
+        else:
+            self._finish()
+
+    def _draw_segment(self, seg, lane, rect):
+        if self._visible(seg.start, seg.end):
+            x0, y0, x1, y1 = self._bar_coords(seg.start, seg.end, lane)
+            if rect is not None:
+                self.canvas.coords(rect, x0, y0, x1, y1)
+                self._draw_label(seg, x0, x1, y0)
+            elif seg.end > seg.start:
+                self._draw_bar(seg, lane)
+        if self.on_segment:
+            self.on_segment(seg, lane)
+
+    def _finish(self):
+        on_done = self.on_done
+        started = perf_counter()
+        self._reset_state()
+        self.redraw()  # Replaces the animated bars with the merged view
+        self.render_time += perf_counter() - started
+        if on_done:
+            on_done()
@@ -0,0 +1,50 @@
+"""Incremental re-simulation for Schedulix.
+
+A Resimulator remembers the last schedule it computed along with the
+checkpoints the engine took during it. When the next run uses the same
+algorithm on a later snapshot of the same process table, it asks the table
+for the earliest arrival any edit since then has touched, resumes the
+engine from the last checkpoint before that time and keeps the segments
+and metrics up to it. Adding, editing or removing a process late in a large
+workload then reschedules only the tail.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+
+import engine
+from process_table import as_table, earliest_change
+
+_Run = namedtuple("_Run", ["algorithm", "quantum", "table", "result", "checkpoints"])
+
+
+class Resimulator:
+    def __init__(self):
+        self.last = None
+        self.resumed_at = None  # Checkpoint time the last run resumed from, None for a full run
+
+    def run(self, algorithm, processes, quantum=4, cancel=None, progress=None, stats=None):
+        table = as_table(processes)
+        checkpoints, resume = self._resume_point(algorithm, quantum, table)
+        self.resumed_at = resume[0].time if resume else None
+        result = engine.run(algorithm, table, quantum, cancel, progress, stats, checkpoints, resume)
+        self.last = _Run(algorithm, quantum, table, result, checkpoints)
+        return result
+
+    def _resume_point(self, algorithm, quantum, table):
+        last = self.last
+        if last is None or last.algorithm != algorithm or (engine.uses_quantum(algorithm) and last.quantum != quantum):
+            return [], None
+        changed = earliest_change(last.table, table)
+        if changed is None:
+            return [], None
+        # A checkpoint holds if every edit arrives strictly after it
+        i = bisect_left(last.checkpoints, changed, key=lambda checkpoint: checkpoint.time)
+        if i == 0:
+            return [], None
+        checkpoint = last.checkpoints[i - 1]
+        resume = (checkpoint, last.result.segments[:checkpoint.segments], last.result.metrics[:checkpoint.metrics])
+        return last.checkpoints[:i], resume
+
+    def forget(self):
+        self.last = None
+        self.resumed_at = None
@@ -0,0 +1,129 @@
+"""Run instrumentation for Schedulix.
+
+A RunStats is handed to a scheduler and to the phases of one run. The
+schedulers only call into it when one is given, so an uninstrumented run
+pays one None check per decision. It counts decisions and preemptions,
+samples the ready-queue length at each decision (thinned out to at most
+MAX_SAMPLES points however long the run is) and times named phases such as
+copy, schedule, metrics and render. Results export as JSON, and with
+profile=True the timed phases also run under cProfile and can be saved as
+a .prof file for pstats, snakeviz and similar tools.
+"""
+import cProfile
+import json
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+
+MAX_SAMPLES = 4096  # Ready-queue samples kept per run
+PHASES = ("copy", "schedule", "metrics", "render")  # Display order in the stats panel
+
+
+class RunStats:
+    def __init__(self, profile=False):
+        self.decisions = 0
+        self.preemptions = 0
+        self.context_switches = 0
+        self.max_ready = 0
+        self.phases = {}  # name -> seconds
+        self.sample_times = array("d")
+        self.sample_lengths = array("q")
+        self.stride = 1  # Decisions per kept sample; doubles each time the samples fill up
+        self._countdown = 1
+        self._requeued = None  # pid put back with work left by the last slice
+        self.profiler = cProfile.Profile() if profile else None
+
+    def decision(self, now, ready_length, pid):
+        # Called once per dispatch with the number of processes left waiting
+        self.decisions += 1
+        if self._requeued is not None:
+            if pid != self._requeued:
+                self.preemptions += 1
+            self._requeued = None
+        if ready_length > self.max_ready:
+            self.max_ready = ready_length
+        self._countdown -= 1
+        if self._countdown:
+            return
+        if len(self.sample_times) == MAX_SAMPLES:
+            # Keep every other sample and sample half as often from now on
+            self.sample_times = self.sample_times[::2]
+            self.sample_lengths = self.sample_lengths[::2]
+            self.stride *= 2
+        self.sample_times.append(now)
+        self.sample_lengths.append(ready_length)
+        self._countdown = self.stride
+
+    def requeue(self, pid):
+        # The slice ended with work left; a preemption if someone else runs next
+        self._requeued = pid
+
+    def preempt(self):
+        self.preemptions += 1
+
+    @contextmanager
+    def phase(self, name):
+        if self.profiler is not None:
+            self.profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+            if self.profiler is not None:
+                self.profiler.disable()
+
+    def add_time(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def time_per_decision(self):
+        if not self.decisions:
+            return 0.0
+        return self.phases.get("schedule", 0.0) / self.decisions
+
+    def as_dict(self):
+        return {
+            "decisions": self.decisions,
+            "time_per_decision_us": self.time_per_decision() * 1e6,
+            "preemptions": self.preemptions,
+            "context_switches": self.context_switches,
+            "max_ready": self.max_ready,
+            "phases": dict(self.phases),
+            "ready_queue": {"stride": self.stride, "time": self.sample_times.tolist(),
+                            "length": self.sample_lengths.tolist()},
+        }
+
+    def save_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f)
+            f.write("\n")
+
+    def save_profile(self, path):
+        # pstats/cProfile format, e.g. python -m pstats run.prof
+        if self.profiler is None:
+            raise ValueError("This run was not profiled.")
+        self.profiler.dump_stats(path)
+
+
+def format_stats(stats):
+    lines = [
+        f"Decisions: {stats.decisions} ({stats.time_per_decision() * 1e6:.2f} us each)",
+        f"Preemptions: {stats.preemptions} | Context switches: {stats.context_switches}",
+        f"Ready queue: max {stats.max_ready}",
+    ]
+    if len(stats.sample_lengths):
+        mean = sum(stats.sample_lengths) / len(stats.sample_lengths)
+        lines[-1] += f", mean {mean:.1f} over {len(stats.sample_lengths)} samples"
+    total = sum(stats.phases.values())
+    names = [name for name in PHASES if name in stats.phases]
+    names += [name for name in stats.phases if name not in PHASES]
+    for name in names:
+        seconds = stats.phases[name]
+        share = seconds / total if total else 0.0
+        lines.append(f"{name.capitalize():<10}{seconds * 1000:10.1f} ms  {share:6.1%}")
+    return "\n".join(lines)
+
+
+def timed(stats, name):
+    # stats.phase(name), or a no-op when the run isn't instrumented
+    return nullcontext() if stats is None else stats.phase(name)
@@ -1,11 +1,148 @@
+import sys
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Command-line batch mode; returns before Tk is ever imported. cli stands
+    # in as __main__ so that --jobs worker processes don't re-run this file.
+    import cli
+    sys.modules["__main__"] = cli
+    sys.exit(cli.main())
+
 import tkinter as tk
-from tkinter import ttk, messagebox
-import time
+from tkinter import ttk, messagebox, filedialog, simpledialog
+import queue
 import threading
 from collections import defaultdict
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from copy import deepcopy
+from cache import ResultCache, cache_key, DEFAULT_DIRECTORY as CACHE_DIRECTORY
+from charts import ChartManager
+import compare
+import engine
+from execlog import ExecutionLog, VERBOSITY, DETAIL
+from metrics import summarize, format_summary
+from metrics_view import COLUMNS as METRIC_COLUMNS, MetricsView
+import montecarlo
+from process_table import ProcessTable
+from replay import Recording, MAX_RECORDINGS
+import smp
+import workload
+from gantt import GanttRenderer, SPEEDS, ZOOM_STEP
+from incremental import Resimulator
+from instrument import RunStats, format_stats, timed
+
+COLORS = ["#ff6b6b", "#6bc1ff", "#51ff90", "#ffc75f", "#c26bff", "#f06595", "#f2a154"]
+IDLE_COLOR = "#44475a"
+
+READY_SHOWN = 20  # Ready processes listed while scrubbing
+
+WORKLOAD_FILETYPES = [("CSV files", "*.csv"), ("JSON lines", "*.jsonl"), ("JSON files", "*.json"), ("Binary traces", "*.trace"), ("All files", "*.*")]
+
+EVENT_POLL_MS = 50  # How often the Tk loop drains worker events
+EVENT_BATCH = 256   # Max events handled per drain so the UI never stalls
+
+
+def color_of(pid):
+    # Fill color of a Gantt bar; a process keeps its color in every run and recording
+    return IDLE_COLOR if pid is None else COLORS[(pid - 1) % len(COLORS)]
+
+
+def run_name(result):
+    # How a run is labelled in the results, the metrics table and the replay menu
+    if isinstance(result, smp.SmpResult):
+        return f"{result.algorithm} ({result.cpus} CPUs)"
+    return result.algorithm
+
+
+def simulation_worker(run_id, algorithm, processes, quantum, cancel, cache, resimulator, stats, events):
+    # Runs off the Tk thread and only talks to the GUI through the events queue
+    def progress(completed, total):
+        events.put((run_id, "progress", (completed, total)))
+
+    key = cache_key(processes, algorithm, quantum)
+    # An instrumented run always schedules, so there is something to measure
+    entry = cache.get(key, need_result=True) if stats is None else None
+    if entry is not None:
+        events.put((run_id, "cached", algorithm))
+        events.put((run_id, "done", (entry, Recording.of(entry.result, run_name(entry.result)))))
+        return
+
+    try:
+        with timed(stats, "schedule"):
+            # Picks up from a checkpoint of the previous run when only later arrivals changed
+            result = resimulator.run(algorithm, processes, quantum, cancel, progress, stats)
+        if resimulator.resumed_at is not None:
+            events.put((run_id, "resumed", resimulator.resumed_at))
+        with timed(stats, "metrics"):
+            summary = summarize(result.metrics, result.segments)
+        entry = cache.put(key, result, summary)
+        # Built here rather than on the Tk thread, which only has to store it
+        recording = Recording.of(result, run_name(result))
+    except engine.SimulationCancelled:
+        return
+    except Exception as e:
+        events.put((run_id, "error", e))
+    else:
+        events.put((run_id, "done", (entry, recording)))
+
+
+def smp_worker(run_id, algorithm, processes, quantum, cpus, policy, cancel, cache, stats, events):
+    key = cache_key(processes, algorithm, quantum) + (cpus, policy)
+    entry = cache.get(key, need_result=True) if stats is None else None
+    if entry is not None:
+        events.put((run_id, "cached", algorithm))
+        events.put((run_id, "done", (entry, Recording.of(entry.result, run_name(entry.result)))))
+        return
+
+    try:
+        with timed(stats, "schedule"):
+            result = smp.run(algorithm, processes, cpus, quantum, cancel=cancel, stats=stats,
+                             **smp.QUEUE_POLICIES[policy])
+        with timed(stats, "metrics"):
+            summary = smp.summarize_smp(result)
+        entry = cache.put(key, result, summary)
+        recording = Recording.of(result, run_name(result))
+    except engine.SimulationCancelled:
+        return
+    except Exception as e:
+        events.put((run_id, "error", e))
+    else:
+        events.put((run_id, "done", (entry, recording)))
+
+
+def comparison_worker(run_id, processes, cache, cancel, events):
+    # Blocks on the process pool, so it gets its own thread like a simulation
+    try:
+        results = compare.run_all(processes, cache=cache, cancel=cancel)
+    except engine.SimulationCancelled:
+        return
+    except Exception as e:
+        events.put((run_id, "error", e))
+    else:
+        events.put((run_id, "compared", results))
+
+
+def sweep_worker(run_id, processes, quanta, cache, cancel, events):
+    try:
+        sweep = compare.sweep_quanta(processes, quanta, cache=cache, cancel=cancel)
+    except engine.SimulationCancelled:
+        return
+    except Exception as e:
+        events.put((run_id, "error", e))
+    else:
+        events.put((run_id, "swept", sweep))
+
+
+def montecarlo_worker(run_id, trials, spec, quantum, cancel, events):
+    def progress(done, total):
+        events.put((run_id, "trials", (done, total)))
+
+    try:
+        result = montecarlo.evaluate(trials, spec, quantum=quantum, cancel=cancel, progress=progress)
+    except engine.SimulationCancelled:
+        return
+    except Exception as e:
+        events.put((run_id, "error", e))
+    else:
+        events.put((run_id, "evaluated", result))
+
 
 class SchedulixSimulator:
     def __init__(self, root):
@@ -14,12 +151,33 @@ class SchedulixSimulator:
         self.root.geometry("1200x800")
         self.root.configure(bg="#0f111a")
 
-        self.processes = []
+        self.processes = ProcessTable()
         self.selected_algorithm = tk.StringVar(value="FCFS")
         self.quantum = tk.IntVar(value=4)
+        self.speed = tk.StringVar(value="Normal")
+        self.cpus = tk.IntVar(value=1)
+        self.queue_policy = tk.StringVar(value="Global")
+        self.log_level = tk.StringVar(value="Verbose")
+        self.collect_stats = tk.BooleanVar(value=False)
+        self.profile_runs = tk.BooleanVar(value=False)
+        self.run_stats = None  # RunStats of the last instrumented run
+        self.stats_window = None
         self.metrics = []
         self.simulation_running = False
         self.algorithm_results = {}
+        self.cache = ResultCache(directory=CACHE_DIRECTORY)
+        self.events = queue.Queue()
+        self.run_id = 0
+        self.worker = None
+        self.drain_after_id = None  # Pending drain_events call; one loop serves every worker
+        self.cancel_token = None
+        self.resimulator = Resimulator()
+        self.replay_from = 0  # Time the last run was rescheduled from; earlier segments show at once
+        self.recordings = {}  # name -> Recording of the last MAX_RECORDINGS completed runs
+        self.replay_choice = tk.StringVar(value="")
+        self.replay_time = tk.DoubleVar(value=0.0)
+        self.replay_speed = tk.DoubleVar(value=20.0)  # Time units per second
+        self.charts = ChartManager(self.root)
         self.build_ui()
 
     def build_ui(self):
@@ -48,36 +206,119 @@ class SchedulixSimulator:
 
         ttk.Button(frame, text="Add", command=self.add_process).grid(row=1, column=4, padx=5)
         ttk.Button(frame, text="Start Simulation", command=self.start_simulation).grid(row=1, column=5, padx=5)
-        ttk.Button(frame, text="Reset", command=self.reset).grid(row=1, column=6)
-
-        ttk.Label(frame, text="Algorithm:").grid(row=1, column=7, padx=10)
-        algo_menu = ttk.OptionMenu(frame, self.selected_algorithm, "FCFS", "FCFS", "SJF (Non-preemptive)", "SJF (Preemptive)", "Priority", "Round Robin")
-        algo_menu.grid(row=1, column=8)
-
-        ttk.Label(frame, text="Quantum:").grid(row=1, column=9)
-        ttk.Entry(frame, textvariable=self.quantum, width=5).grid(row=1, column=10)
-
-        self.canvas = tk.Canvas(self.root, bg="#1a1c29", height=250, width=1150, highlightthickness=0)
-        self.canvas.pack(pady=15)
-        self.timeline = self.canvas.create_line(0, 125, 0, 125, fill="#00ffcc", width=4)
-
-        # Add time markers
-        self.time_labels = []
-
-        self.metrics_table = ttk.Treeview(self.root, columns=("PID", "Arrival", "Burst", "CT", "TAT", "WT", "RT"), show="headings", height=6)
-        for col in self.metrics_table["columns"]:
-            self.metrics_table.heading(col, text=col)
-            self.metrics_table.column(col, anchor="center", width=100)
-        self.metrics_table.pack(pady=10)
+        ttk.Button(frame, text="Stop", command=self.stop_simulation).grid(row=1, column=6)
+        ttk.Button(frame, text="Reset", command=self.reset).grid(row=1, column=7, padx=5)
+
+        ttk.Label(frame, text="Algorithm:").grid(row=1, column=8, padx=10)
+        algo_menu = ttk.OptionMenu(frame, self.selected_algorithm, "FCFS", *engine.ALGORITHMS)
+        algo_menu.grid(row=1, column=9)
+
+        ttk.Label(frame, text="Quantum:").grid(row=1, column=10)
+        ttk.Entry(frame, textvariable=self.quantum, width=5).grid(row=1, column=11)
+
+        ttk.Label(frame, text="Speed:").grid(row=1, column=12, padx=(10, 0))
+        ttk.OptionMenu(frame, self.speed, "Normal", *SPEEDS).grid(row=1, column=13)
+
+        ttk.Button(frame, text="Update", command=self.update_process).grid(row=2, column=1, pady=(5, 0))
+        ttk.Button(frame, text="Remove", command=self.remove_process).grid(row=2, column=2, pady=(5, 0))
+        ttk.Button(frame, text="Import...", command=self.import_workload).grid(row=2, column=4, padx=5, pady=(5, 0))
+        ttk.Button(frame, text="Export...", command=self.export_workload).grid(row=2, column=5, padx=5, pady=(5, 0))
+        ttk.Button(frame, text="Generate...", command=self.generate_workload).grid(row=2, column=6, pady=(5, 0))
+
+        # Multi-core settings; more than one CPU runs the SMP simulation
+        ttk.Label(frame, text="CPUs:").grid(row=2, column=8, padx=10, pady=(5, 0))
+        ttk.Entry(frame, textvariable=self.cpus, width=5).grid(row=2, column=9, pady=(5, 0))
+        ttk.Label(frame, text="Run Queues:").grid(row=2, column=10, pady=(5, 0))
+        ttk.OptionMenu(frame, self.queue_policy, "Global", *smp.QUEUE_POLICIES).grid(row=2, column=11, columnspan=3, pady=(5, 0))
+
+        # Gantt chart: a scrollable, zoomable viewport onto the schedule
+        zoom_bar = ttk.Frame(self.root)
+        zoom_bar.pack(pady=(10, 0))
+        ttk.Button(zoom_bar, text="Zoom In", command=lambda: self.gantt.zoom(ZOOM_STEP)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(zoom_bar, text="Zoom Out", command=lambda: self.gantt.zoom(1 / ZOOM_STEP)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(zoom_bar, text="Fit", command=lambda: self.gantt.zoom_to_fit()).pack(side=tk.LEFT, padx=5)
+
+        # Replay of completed runs: pick one, play it at any speed or drag the slider to a time
+        ttk.Label(zoom_bar, text="Replay:").pack(side=tk.LEFT, padx=(20, 0))
+        self.replay_menu = ttk.OptionMenu(zoom_bar, self.replay_choice, "", command=self.select_recording)
+        self.replay_menu.pack(side=tk.LEFT, padx=5)
+        self.replay_button = ttk.Button(zoom_bar, text="Play", command=self.toggle_replay)
+        self.replay_button.pack(side=tk.LEFT, padx=5)
+        self.replay_scale = ttk.Scale(zoom_bar, from_=0, to=1, variable=self.replay_time, length=300,
+                                      command=self.scrub)
+        self.replay_scale.pack(side=tk.LEFT, padx=5)
+        ttk.Entry(zoom_bar, textvariable=self.replay_speed, width=6).pack(side=tk.LEFT)
+        ttk.Label(zoom_bar, text="units/s").pack(side=tk.LEFT, padx=(2, 0))
+        self.replay_status = tk.Label(self.root, text="", fg="white", bg="#0f111a", font=("Helvetica", 9))
+        self.replay_status.pack()
+
+        self.canvas = tk.Canvas(self.root, bg="#1a1c29", height=250, highlightthickness=0)
+        self.canvas.pack(fill=tk.X, padx=25, pady=(5, 0))
+        gantt_scroll = ttk.Scrollbar(self.root, orient=tk.HORIZONTAL)
+        gantt_scroll.pack(fill=tk.X, padx=25, pady=(0, 10))
+        self.gantt = GanttRenderer(self.root, self.canvas, xscrollcommand=gantt_scroll.set)
+        gantt_scroll.config(command=self.gantt.xview)
+        self.gantt.clear()
+
+        self.canvas.bind("<Configure>", lambda event: self.gantt.redraw())
+        # Wheel pans, Ctrl+wheel zooms around the pointer (Button-4/5 on X11)
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll_gantt(event, -event.delta))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_gantt(event, -1))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_gantt(event, 1))
+        self.canvas.bind("<Control-MouseWheel>", lambda event: self.zoom_gantt(event, event.delta))
+        self.canvas.bind("<Control-Button-4>", lambda event: self.zoom_gantt(event, 1))
+        self.canvas.bind("<Control-Button-5>", lambda event: self.zoom_gantt(event, -1))
+
+        # Metrics table: only the visible rows exist as Treeview items
+        table = ttk.Frame(self.root)
+        table.pack(pady=(10, 0))
+        self.metrics_table = ttk.Treeview(table, columns=METRIC_COLUMNS, show="headings", height=6)
+        self.metrics_table.pack(side=tk.LEFT)
+        table_scroll = ttk.Scrollbar(table, orient=tk.VERTICAL)
+        table_scroll.pack(side=tk.LEFT, fill=tk.Y)
+        self.metrics_view = MetricsView(self.metrics_table, yscrollcommand=table_scroll.set,
+                                        on_change=lambda: self.table_status.config(text=self.metrics_view.status()))
+        table_scroll.config(command=self.metrics_view.yview)
+        self.metrics_table.bind("<MouseWheel>", lambda event: self.metrics_view.scroll(-1 if event.delta > 0 else 1))
+        self.metrics_table.bind("<Button-4>", lambda event: self.metrics_view.scroll(-1))
+        self.metrics_table.bind("<Button-5>", lambda event: self.metrics_view.scroll(1))
+
+        table_filter = ttk.Frame(self.root)
+        table_filter.pack(pady=(2, 5))
+        self.top_n = tk.IntVar(value=10)
+        self.top_column = tk.StringVar(value="WT")
+        ttk.Label(table_filter, text="Top").pack(side=tk.LEFT)
+        ttk.Entry(table_filter, textvariable=self.top_n, width=6).pack(side=tk.LEFT, padx=5)
+        ttk.Label(table_filter, text="worst by").pack(side=tk.LEFT)
+        ttk.OptionMenu(table_filter, self.top_column, "WT", *METRIC_COLUMNS[3:]).pack(side=tk.LEFT, padx=5)
+        ttk.Button(table_filter, text="Show", command=self.show_top_metrics).pack(side=tk.LEFT, padx=5)
+        ttk.Button(table_filter, text="Show All", command=self.metrics_view.show_all).pack(side=tk.LEFT)
+        self.table_status = tk.Label(table_filter, text="", fg="white", bg="#0f111a", font=("Helvetica", 9))
+        self.table_status.pack(side=tk.LEFT, padx=10)
 
         self.summary_label = tk.Label(self.root, text="", fg="white", bg="#0f111a", font=("Helvetica", 10, "bold"))
         self.summary_label.pack(pady=5)
 
         self.log_output = tk.Text(self.root, height=6, width=140, bg="#0e0f1c", fg="#00ffcc", font=("Consolas", 10))
         self.log_output.pack(pady=5)
-
-        # Add comparison button
-        ttk.Button(self.root, text="Compare All Algorithms", command=self.compare_all_algorithms).pack(pady=5)
+        self.log = ExecutionLog(self.root, self.log_output)
+
+        # Add comparison and quantum sweep buttons
+        buttons = ttk.Frame(self.root)
+        buttons.pack(pady=5)
+        ttk.Button(buttons, text="Compare All Algorithms", command=self.compare_all_algorithms).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Quantum Sweep...", command=self.sweep_quantum).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Monte Carlo...", command=self.evaluate_monte_carlo).pack(side=tk.LEFT, padx=5)
+        ttk.Label(buttons, text="Log:").pack(side=tk.LEFT, padx=(15, 0))
+        ttk.OptionMenu(buttons, self.log_level, "Verbose", *VERBOSITY,
+                       command=lambda name: self.log.set_verbosity(VERBOSITY[name])).pack(side=tk.LEFT, padx=5)
+        self.log_file_button = ttk.Button(buttons, text="Log to File...", command=self.toggle_log_file)
+        self.log_file_button.pack(side=tk.LEFT, padx=5)
+
+        # Run instrumentation, off unless asked for
+        ttk.Checkbutton(buttons, text="Stats", variable=self.collect_stats).pack(side=tk.LEFT, padx=(15, 0))
+        ttk.Checkbutton(buttons, text="cProfile", variable=self.profile_runs).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons, text="Stats...", command=self.show_stats).pack(side=tk.LEFT, padx=5)
 
     def add_process(self):
         try:
@@ -87,12 +328,12 @@ class SchedulixSimulator:
             priority = int(self.priority_entry.get()) if self.priority_entry.get() else 0
             
             # Check for existing PID
-            if any(p["pid"] == pid for p in self.processes):
+            if self.processes.has_pid(pid):
                 messagebox.showerror("Duplicate PID", f"Process with PID {pid} already exists.")
                 return
                 
-            self.processes.append({"pid": pid, "arrival": arrival, "burst": burst, "priority": priority, "remaining": burst})
-            self.log_output.insert(tk.END, f"Added Process - PID: {pid}, Arrival: {arrival}, Burst: {burst}, Priority: {priority}\n")
+            self.processes.append(pid, arrival, burst, priority)
+            self.log.write(f"Added Process - PID: {pid}, Arrival: {arrival}, Burst: {burst}, Priority: {priority}")
             self.pid_entry.delete(0, tk.END)
             self.arrival_entry.delete(0, tk.END)
             self.burst_entry.delete(0, tk.END)
@@ -100,30 +341,94 @@ class SchedulixSimulator:
         except ValueError:
             messagebox.showerror("Invalid Input", "Enter valid numbers only.")
 
-    def reset(self):
+    def update_process(self):
+        try:
+            pid = int(self.pid_entry.get())
+            arrival = int(self.arrival_entry.get())
+            burst = int(self.burst_entry.get())
+            priority = int(self.priority_entry.get()) if self.priority_entry.get() else 0
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Enter valid numbers only.")
+            return
+        if not self.processes.has_pid(pid):
+            messagebox.showerror("Unknown PID", f"No process with PID {pid}.")
+            return
+        self.processes.update(pid, arrival, burst, priority)
+        self.log.write(f"Updated Process - PID: {pid}, Arrival: {arrival}, Burst: {burst}, Priority: {priority}")
+
+    def remove_process(self):
+        try:
+            pid = int(self.pid_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Enter the PID to remove.")
+            return
+        if not self.processes.has_pid(pid):
+            messagebox.showerror("Unknown PID", f"No process with PID {pid}.")
+            return
+        self.processes.remove(pid)
+        self.log.write(f"Removed Process - PID: {pid}")
+        self.pid_entry.delete(0, tk.END)
+
+    def import_workload(self):
         if self.simulation_running:
-            messagebox.showinfo("Simulation Running", "Please wait for simulation to complete before resetting.")
+            messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
+            return
+        path = filedialog.askopenfilename(title="Import Workload", filetypes=WORKLOAD_FILETYPES)
+        if not path:
+            return
+        try:
+            self.processes = workload.load(path)
+        except (OSError, workload.WorkloadError) as e:
+            messagebox.showerror("Import Failed", str(e))
+            return
+        self.log.write(f"Imported {len(self.processes)} processes from {path}")
+
+    def export_workload(self):
+        if not self.processes:
+            messagebox.showwarning("No Data", "Please add processes before exporting.")
+            return
+        path = filedialog.asksaveasfilename(title="Export Workload", defaultextension=".csv", filetypes=WORKLOAD_FILETYPES)
+        if not path:
             return
+        try:
+            workload.save(self.processes, path)
+        except (OSError, workload.WorkloadError) as e:
+            messagebox.showerror("Export Failed", str(e))
+            return
+        self.log.write(f"Exported {len(self.processes)} processes to {path}")
+
+    def generate_workload(self):
+        if self.simulation_running:
+            messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
+            return
+        n = simpledialog.askinteger("Generate Workload", "Number of processes:", parent=self.root, minvalue=1, initialvalue=1000)
+        if n is None:
+            return
+        seed = simpledialog.askinteger("Generate Workload", "Random seed:", parent=self.root, initialvalue=0)
+        if seed is None:
+            return
+        # Poisson arrivals at a load of ~0.8 with heavy-tailed bursts
+        self.processes = workload.generate(n, seed=seed, arrival_rate=0.16, burst="pareto", mean_burst=5.0)
+        self.log.write(f"Generated {n} processes (seed {seed})")
+
+    def reset(self):
+        self.stop_simulation()
             
         self.processes.clear()
         self.metrics.clear()
         self.algorithm_results.clear()
-        self.canvas.delete("all")
-        self.timeline = self.canvas.create_line(0, 125, 0, 125, fill="#00ffcc", width=4)
-        
-        # Clear time labels
-        for label in self.time_labels:
-            self.canvas.delete(label)
-        self.time_labels.clear()
-        
-        self.metrics_table.delete(*self.metrics_table.get_children())
+        self.resimulator.forget()
+        self.stop_replay()
+        self.recordings.clear()
+        self.replay_menu.set_menu("")
+        self.replay_status.config(text="")
+        self.gantt.clear()
+        
+        self.metrics_view.clear()
         self.summary_label.config(text="")
-        self.log_output.delete("1.0", tk.END)
+        self.log.clear()
         
-        # Remove graph if exists
-        for widget in self.root.pack_slaves():
-            if isinstance(widget, FigureCanvasTkAgg):
-                widget.get_tk_widget().destroy()
+        self.charts.hide_all()
 
     def start_simulation(self):
         if not self.processes:
@@ -135,445 +440,333 @@ class SchedulixSimulator:
             return
             
         # Clear previous results
-        self.canvas.delete("all")
-        self.timeline = self.canvas.create_line(0, 125, 0, 125, fill="#00ffcc", width=4)
-        for label in self.time_labels:
-            self.canvas.delete(label)
-        self.time_labels.clear()
-        self.metrics_table.delete(*self.metrics_table.get_children())
+        self.gantt.clear()
+        self.metrics_view.clear()
         
-        # Create deep copy of processes to prevent modifying original data
-        processes_copy = deepcopy(self.processes)
+        stats = None
+        if self.collect_stats.get() or self.profile_runs.get():
+            stats = RunStats(profile=self.profile_runs.get())
+
+        # Copy-on-write snapshot, so edits during the run don't touch its data
+        with timed(stats, "copy"):
+            processes_copy = self.processes.snapshot()
         
         algorithm = self.selected_algorithm.get()
+        try:
+            quantum = self.quantum.get()
+        except tk.TclError:
+            quantum = 0
+        if engine.uses_quantum(algorithm) and quantum <= 0:
+            messagebox.showerror("Invalid Quantum", "Quantum must be a positive integer.")
+            return
+        try:
+            cpus = self.cpus.get()
+        except tk.TclError:
+            cpus = 0
+        if cpus <= 0:
+            messagebox.showerror("Invalid CPU Count", "CPUs must be a positive integer.")
+            return
         
-        # Start appropriate algorithm in a thread
+        self.run_algorithm(algorithm, processes_copy, quantum, cpus, self.queue_policy.get(), stats)
+
+    def run_algorithm(self, algorithm, processes, quantum, cpus=1, policy="Global", stats=None):
+        # Schedule on a worker thread; results come back through self.events
+        self.stop_replay()
+        self.run_stats = stats
+        self.replay_from = 0
+        if cpus > 1:
+            self.start_worker(smp_worker, algorithm, processes, quantum, cpus, policy, self.next_cancel_token(), self.cache, stats)
+        else:
+            self.start_worker(simulation_worker, algorithm, processes, quantum, self.next_cancel_token(), self.cache,
+                              self.resimulator, stats)
+
+    def next_cancel_token(self):
+        self.run_id += 1
+        self.cancel_token = engine.CancelToken()
+        return self.cancel_token
+
+    def start_worker(self, target, *args):
         self.simulation_running = True
-        thread = threading.Thread(target=self.run_algorithm, args=(algorithm, processes_copy))
-        thread.start()
+        self.worker = threading.Thread(target=target, args=(self.run_id, *args, self.events), daemon=True)
+        self.worker.start()
+        # After a quick Stop and restart the previous loop may still be pending
+        if self.drain_after_id is None:
+            self.drain_after_id = self.root.after(EVENT_POLL_MS, self.drain_events)
+
+    def drain_events(self):
+        self.drain_after_id = None
+        for _ in range(EVENT_BATCH):
+            try:
+                run_id, kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if run_id != self.run_id:
+                continue  # Late event from a stopped run
+
+            if kind == "progress":
+                completed, total = payload
+                self.summary_label.config(text=f"Scheduling... {completed}/{total} processes completed")
+            elif kind == "cached":
+                self.log.write(f"Reusing cached {payload} schedule for this workload")
+            elif kind == "resumed":
+                self.replay_from = payload
+                self.log.write(f"Rescheduled from checkpoint at time {payload}; the schedule before it is unchanged")
+            elif kind == "done":
+                self.worker = None
+                entry, recording = payload
+                self.replay(entry.result, entry.summary, recording)
+            elif kind == "compared":
+                self.worker = None
+                self.simulation_running = False
+                self.algorithm_results.update(payload)
+                self.summary_label.config(text=f"Compared {len(payload)} schedules")
+                self.draw_comparison_graph(payload)
+            elif kind == "swept":
+                self.worker = None
+                self.simulation_running = False
+                best = compare.best_quantum(payload)
+                self.quantum.set(best)
+                self.summary_label.config(text=f"Quantum sweep over {len(payload)} values | Best quantum (lowest avg WT): {best}")
+                self.draw_sweep_graph(payload, best)
+            elif kind == "trials":
+                done, total = payload
+                self.summary_label.config(text=f"Monte Carlo... {done}/{total} workloads evaluated")
+            elif kind == "evaluated":
+                self.worker = None
+                self.simulation_running = False
+                best = montecarlo.ranking(payload)[0][0]
+                self.summary_label.config(text=f"Monte Carlo over {payload.trials} workloads | Best {payload.objective}: {best}")
+                for line in montecarlo.format_ranking(payload).splitlines():
+                    self.log.write(line)
+                self.charts.monte_carlo.show(payload)
+            elif kind == "error":
+                self.worker = None
+                self.simulation_running = False
+                messagebox.showerror("Simulation Error", str(payload))
+
+        if self.worker is not None:
+            self.drain_after_id = self.root.after(EVENT_POLL_MS, self.drain_events)
+
+    def stop_simulation(self):
+        if not self.simulation_running:
+            return
+        # The worker gives up at its next scheduling decision
+        self.cancel_token.cancel()
+        self.run_id += 1
+        self.worker = None
+        self.gantt.cancel()
+        self.simulation_running = False
+        self.log.write("Simulation stopped")
+
+    def replay(self, result, summary=None, recording=None):
+        on_done = lambda: self.finish_run(result, summary, recording)
+        if isinstance(result, smp.SmpResult):
+            self.gantt.play_lanes(result.lanes, color_of, SPEEDS[self.speed.get()],
+                                  on_segment=self.log_segment, on_done=on_done)
+        else:
+            self.gantt.play(result.segments, color_of, SPEEDS[self.speed.get()],
+                            on_segment=self.log_segment, on_done=on_done, start_time=self.replay_from)
+
+    def log_segment(self, seg, lane=0):
+        if not self.log.enabled(DETAIL):
+            return
+        label = "IDLE" if seg.pid is None else f"P{seg.pid}"
+        where = f" on CPU {lane}" if self.gantt.lanes > 1 else ""
+        self.log.write(f"{label} executed{where} from time {seg.start} to {seg.end}", DETAIL)
+
+    def finish_run(self, result, summary=None, recording=None):
+        self.metrics = result.metrics
+        stats = self.run_stats
+        name = run_name(result)
+        with timed(stats, "metrics"):
+            if isinstance(result, smp.SmpResult):
+                for cpu, utilization in enumerate(summary["Per-CPU Utilization"]):
+                    self.log.write(f"CPU {cpu} utilization: {utilization:.1%}")
+                self.show_metrics(name, summary=summary)
+            else:
+                self.show_metrics(name, result.segments, summary)
+        self.simulation_running = False
+        if recording is not None:
+            self.record_run(recording)
+
+        if stats is not None:
+            stats.add_time("render", self.gantt.render_time)
+            stats.context_switches = self.algorithm_results[name]["Context Switches"]
+            self.log.write(f"Run stats: {stats.decisions} decisions, {stats.preemptions} preemptions, "
+                           f"{sum(stats.phases.values()) * 1000:.1f} ms measured")
+            if self.stats_window is not None and self.stats_window.winfo_exists():
+                self.show_stats()
+
+    def record_run(self, recording):
+        # Keeps the finished schedule, recorded by the worker, for replay
+        name = recording.name
+        self.recordings.pop(name, None)
+        self.recordings[name] = recording
+        while len(self.recordings) > MAX_RECORDINGS:
+            del self.recordings[next(iter(self.recordings))]
+        self.replay_menu.set_menu(name, *self.recordings)
+        self.replay_scale.config(to=max(1, recording.end))
+        self.replay_time.set(recording.end)
+        self.replay_status.config(text="")
+
+    def select_recording(self, name):
+        if self.simulation_running:
+            messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
+            return
+        self.stop_replay()
+        recording = self.recordings[name]
+        self.gantt.load(recording.lanes, color_of)
+        self.gantt.redraw()
+        self.replay_scale.config(to=max(1, recording.end))
+        self.replay_time.set(recording.end)
+        self.show_replay_state(recording.end)
+
+    def toggle_replay(self):
+        if self.simulation_running:
+            messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
+            return
+        if self.replay_choice.get() not in self.recordings:
+            messagebox.showwarning("No Run", "Run a simulation before replaying it.")
+            return
+        if self.gantt.replaying:
+            self.stop_replay()
+            return
+        try:
+            speed = self.replay_speed.get()
+        except tk.TclError:
+            speed = 0
+        if speed <= 0:
+            messagebox.showerror("Invalid Speed", "Replay speed must be a positive number of time units per second.")
+            return
+        t = self.replay_time.get()
+        self.gantt.seek(0 if t >= self.gantt.extent else t)
+        self.replay_button.config(text="Pause")
+        self.gantt.replay(1000 / speed, on_time=self.on_replay_time, on_done=self.stop_replay)
+
+    def stop_replay(self):
+        self.gantt.pause()
+        self.replay_button.config(text="Play")
+
+    def scrub(self, value):
+        # Slider moved by hand: pause there
+        if self.simulation_running or self.replay_choice.get() not in self.recordings:
+            return
+        self.stop_replay()
+        self.gantt.seek(float(value))
+        self.show_replay_state(float(value))
+
+    def on_replay_time(self, t):
+        self.replay_time.set(t)
+        self.show_replay_state(t)
+
+    def show_replay_state(self, t):
+        # Running and ready processes at t, looked up in the recording's time index
+        recording = self.recordings[self.replay_choice.get()]
+        running = [seg for seg in recording.running(t) if seg is not None]
+        ready = recording.ready(t)
+        shown = " ".join(f"P{pid}" for pid in ready[:READY_SHOWN])
+        if len(ready) > READY_SHOWN:
+            shown += f" ... (+{len(ready) - READY_SHOWN} more)"
+        running_text = ", ".join(f"P{seg.pid}" for seg in running) or "idle"
+        self.replay_status.config(text=f"t = {t:.1f} | Running: {running_text} | Ready ({len(ready)}): {shown}")
+
+    def toggle_log_file(self):
+        if self.log.streaming:
+            self.log.stop_streaming()
+            self.log_file_button.config(text="Log to File...")
+            return
+        path = filedialog.asksaveasfilename(title="Stream Log To", defaultextension=".log",
+                                            filetypes=[("Log files", "*.log"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.log.stream_to(path)
+        except OSError as e:
+            messagebox.showerror("Log Error", str(e))
+            return
+        self.log_file_button.config(text="Stop Log File")
+        self.log.write(f"Streaming the full log to {path}")
 
-    def run_algorithm(self, algorithm, processes):
+    def show_stats(self):
+        if self.run_stats is None:
+            messagebox.showinfo("No Stats", "Tick Stats or cProfile and run a simulation first.")
+            return
+        if self.stats_window is None or not self.stats_window.winfo_exists():
+            self.stats_window = tk.Toplevel(self.root)
+            self.stats_window.title("Run Statistics")
+            self.stats_window.configure(bg="#0f111a")
+            self.stats_text = tk.Label(self.stats_window, justify=tk.LEFT, fg="#00ffcc", bg="#0f111a", font=("Consolas", 10))
+            self.stats_text.pack(padx=20, pady=10)
+            buttons = ttk.Frame(self.stats_window)
+            buttons.pack(pady=10)
+            ttk.Button(buttons, text="Ready Queue Chart",
+                       command=lambda: self.charts.ready_queue.show(self.run_stats)).pack(side=tk.LEFT, padx=5)
+            ttk.Button(buttons, text="Export JSON...", command=self.export_stats).pack(side=tk.LEFT, padx=5)
+            ttk.Button(buttons, text="Export Profile...", command=self.export_profile).pack(side=tk.LEFT, padx=5)
+            ttk.Button(buttons, text="Close", command=self.stats_window.destroy).pack(side=tk.LEFT, padx=5)
+        self.stats_text.config(text=format_stats(self.run_stats))
+        self.stats_window.lift()
+
+    def export_stats(self):
+        path = filedialog.asksaveasfilename(title="Export Run Statistics", defaultextension=".json",
+                                            filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
         try:
-            if algorithm == "FCFS":
-                self.run_fcfs(processes)
-            elif algorithm == "SJF (Non-preemptive)":
-                self.run_sjf_non_preemptive(processes)
-            elif algorithm == "SJF (Preemptive)":
-                self.run_sjf_preemptive(processes)
-            elif algorithm == "Priority":
-                self.run_priority(processes)
-            elif algorithm == "Round Robin":
-                self.run_round_robin(processes)
-        finally:
-            self.simulation_running = False
-
-    def run_fcfs(self, processes):
-        time_unit = 30
-        processes.sort(key=lambda x: x["arrival"])
-        current_time = 0
-        x_start = 10
-        y_pos = 100
-        colors = ["#ff6b6b", "#6bc1ff", "#51ff90", "#ffc75f", "#c26bff", "#f06595", "#f2a154"]
-        self.metrics = []
-        
-        for i, p in enumerate(processes):
-            pid = p["pid"]
-            at = p["arrival"]
-            bt = p["burst"]
-            color = colors[i % len(colors)]
-            
-            if at > current_time:
-                idle_time = at - current_time
-                self.draw_bar("IDLE", current_time, idle_time, x_start, y_pos, "#44475a", time_unit)
-                x_start += idle_time * time_unit
-                current_time = at
-
-            start_time = current_time
-            self.draw_bar(f"P{pid}", current_time, bt, x_start, y_pos, color, time_unit)
-            completion_time = current_time + bt
-            tat = completion_time - at
-            wt = tat - bt
-            rt = start_time - at
-            self.metrics.append((pid, at, bt, completion_time, tat, wt, rt))
-            x_start += bt * time_unit
-            current_time += bt
-            
-        self.draw_time_markers(time_unit)
-        self.show_metrics("FCFS")
-
-    def run_sjf_non_preemptive(self, processes):
-        time_unit = 30
-        processes.sort(key=lambda x: x["arrival"])
-        current_time = 0
-        x_start = 10
-        y_pos = 100
-        colors = ["#ff6b6b", "#6bc1ff", "#51ff90", "#ffc75f", "#c26bff", "#f06595", "#f2a154"]
-        self.metrics = []
-        
-        # Make a copy to track completion
-        remaining_processes = deepcopy(processes)
-        color_map = {p["pid"]: colors[i % len(colors)] for i, p in enumerate(processes)}
-        
-        while remaining_processes:
-            # Find ready processes
-            ready_processes = [p for p in remaining_processes if p["arrival"] <= current_time]
-            
-            if not ready_processes:
-                # No process available, idle CPU
-                next_process = min(remaining_processes, key=lambda x: x["arrival"])
-                idle_time = next_process["arrival"] - current_time
-                self.draw_bar("IDLE", current_time, idle_time, x_start, y_pos, "#44475a", time_unit)
-                x_start += idle_time * time_unit
-                current_time = next_process["arrival"]
-                continue
-                
-            # Find shortest job
-            next_process = min(ready_processes, key=lambda x: x["burst"])
-            pid = next_process["pid"]
-            at = next_process["arrival"]
-            bt = next_process["burst"]
-            color = color_map[pid]
-            
-            # Execute process
-            start_time = current_time
-            self.draw_bar(f"P{pid}", current_time, bt, x_start, y_pos, color, time_unit)
-            completion_time = current_time + bt
-            tat = completion_time - at
-            wt = tat - bt
-            rt = start_time - at
-            self.metrics.append((pid, at, bt, completion_time, tat, wt, rt))
-            
-            # Update time and x_start
-            x_start += bt * time_unit
-            current_time += bt
-            
-            # Remove completed process
-            remaining_processes = [p for p in remaining_processes if p["pid"] != pid]
-            
-        self.draw_time_markers(time_unit)
-        self.show_metrics("SJF (Non-preemptive)")
-
-    def run_sjf_preemptive(self, processes):
-        time_unit = 30
-        processes.sort(key=lambda x: x["arrival"])
-        current_time = 0
-        x_start = 10
-        y_pos = 100
-        colors = ["#ff6b6b", "#6bc1ff", "#51ff90", "#ffc75f", "#c26bff", "#f06595", "#f2a154"]
-        self.metrics = []
-        
-        # Make a copy to track completion and start times
-        remaining_processes = deepcopy(processes)
-        color_map = {p["pid"]: colors[i % len(colors)] for i, p in enumerate(processes)}
-        response_times = {}  # Track first time a process gets CPU
-        start_times = {}     # Track when a process starts execution
-        
-        # Find all unique arrival times and completion possibilities
-        events = set()
-        for p in processes:
-            events.add(p["arrival"])
-        
-        # Add events when processes might complete
-        while remaining_processes:
-            ready_processes = [p for p in remaining_processes if p["arrival"] <= current_time]
-            
-            if not ready_processes:
-                # No process available, idle until next arrival
-                next_arrival = min([p["arrival"] for p in remaining_processes])
-                idle_time = next_arrival - current_time
-                self.draw_bar("IDLE", current_time, idle_time, x_start, y_pos, "#44475a", time_unit)
-                x_start += idle_time * time_unit
-                current_time = next_arrival
-                continue
-                
-            # Find shortest remaining time process
-            next_process = min(ready_processes, key=lambda x: x["remaining"])
-            pid = next_process["pid"]
-            
-            # Calculate how long until next event (new process arrival or current process completion)
-            next_event_time = float('inf')
-            for p in remaining_processes:
-                if p["arrival"] > current_time and p["arrival"] < next_event_time:
-                    next_event_time = p["arrival"]
-            
-            # Process could complete before next arrival
-            time_slice = min(next_process["remaining"], 
-                             next_event_time - current_time if next_event_time != float('inf') else next_process["remaining"])
-            
-            # Track response time the first time a process gets CPU
-            if pid not in response_times:
-                response_times[pid] = current_time - next_process["arrival"]
-            
-            # Execute the process for the time slice
-            color = color_map[pid]
-            self.draw_bar(f"P{pid}", current_time, time_slice, x_start, y_pos, color, time_unit)
-            
-            # Update time and x_start
-            x_start += time_slice * time_unit
-            current_time += time_slice
-            
-            # Update remaining time for the process
-            next_process["remaining"] -= time_slice
-            
-            # If process is complete, remove it
-            if next_process["remaining"] <= 0:
-                # Record metrics
-                completion_time = current_time
-                arrival_time = next_process["arrival"]
-                burst_time = next_process["burst"]
-                tat = completion_time - arrival_time
-                wt = tat - burst_time
-                rt = response_times[pid]
-                self.metrics.append((pid, arrival_time, burst_time, completion_time, tat, wt, rt))
-                
-                # Remove from remaining processes
-                remaining_processes = [p for p in remaining_processes if p["pid"] != pid]
-        
-        self.draw_time_markers(time_unit)
-        self.show_metrics("SJF (Preemptive)")
-
-    def run_priority(self, processes):
-        time_unit = 30
-        processes.sort(key=lambda x: x["arrival"])
-        current_time = 0
-        x_start = 10
-        y_pos = 100
-        colors = ["#ff6b6b", "#6bc1ff", "#51ff90", "#ffc75f", "#c26bff", "#f06595", "#f2a154"]
-        self.metrics = []
-        
-        # Make a copy to track completion
-        remaining_processes = deepcopy(processes)
-        color_map = {p["pid"]: colors[i % len(colors)] for i, p in enumerate(processes)}
-        response_times = {}  # Track first time a process gets CPU
-        
-        while remaining_processes:
-            # Find ready processes
-            ready_processes = [p for p in remaining_processes if p["arrival"] <= current_time]
-            
-            if not ready_processes:
-                # No process available, idle CPU
-                next_process = min(remaining_processes, key=lambda x: x["arrival"])
-                idle_time = next_process["arrival"] - current_time
-                self.draw_bar("IDLE", current_time, idle_time, x_start, y_pos, "#44475a", time_unit)
-                x_start += idle_time * time_unit
-                current_time = next_process["arrival"]
-                continue
-                
-            # Find highest priority process (lower number = higher priority)
-            next_process = min(ready_processes, key=lambda x: x["priority"])
-            pid = next_process["pid"]
-            at = next_process["arrival"]
-            bt = next_process["burst"]
-            color = color_map[pid]
-            
-            # Track response time
-            if pid not in response_times:
-                response_times[pid] = current_time - at
-            
-            # Execute process
-            self.draw_bar(f"P{pid}", current_time, bt, x_start, y_pos, color, time_unit)
-            completion_time = current_time + bt
-            tat = completion_time - at
-            wt = tat - bt
-            rt = response_times[pid]
-            self.metrics.append((pid, at, bt, completion_time, tat, wt, rt))
-            
-            # Update time and x_start
-            x_start += bt * time_unit
-            current_time += bt
-            
-            # Remove completed process
-            remaining_processes = [p for p in remaining_processes if p["pid"] != pid]
-            
-        self.draw_time_markers(time_unit)
-        self.show_metrics("Priority")
-
-    def run_round_robin(self, processes):
-        time_unit = 30
-        processes.sort(key=lambda x: x["arrival"])
-        current_time = 0
-        x_start = 10
-        y_pos = 100
-        colors = ["#ff6b6b", "#6bc1ff", "#51ff90", "#ffc75f", "#c26bff", "#f06595", "#f2a154"]
-        self.metrics = []
-        quantum = self.quantum.get()
-        
-        # Make a copy to track completion
-        remaining_processes = deepcopy(processes)
-        color_map = {p["pid"]: colors[i % len(colors)] for i, p in enumerate(processes)}
-        response_times = {}  # Track first time a process gets CPU
-        completion_records = {p["pid"]: {"completion": 0, "first_response": -1} for p in processes}
-        
-        # Queue for ready processes
-        ready_queue = []
-        
-        while remaining_processes or ready_queue:
-            # Check if any new processes have arrived
-            new_arrivals = [p for p in remaining_processes if p["arrival"] <= current_time]
-            for p in new_arrivals:
-                ready_queue.append(p)
-                remaining_processes.remove(p)
-            
-            if not ready_queue:
-                # No process in ready queue, idle CPU until next arrival
-                if remaining_processes:
-                    next_arrival = min([p["arrival"] for p in remaining_processes])
-                    idle_time = next_arrival - current_time
-                    self.draw_bar("IDLE", current_time, idle_time, x_start, y_pos, "#44475a", time_unit)
-                    x_start += idle_time * time_unit
-                    current_time = next_arrival
-                    continue
-                else:
-                    break  # No more processes to execute
-            
-            # Get next process from ready queue
-            current_process = ready_queue.pop(0)
-            pid = current_process["pid"]
-            
-            # Track response time (first time getting CPU)
-            if completion_records[pid]["first_response"] == -1:
-                completion_records[pid]["first_response"] = current_time - current_process["arrival"]
-            
-            # Calculate time slice (minimum of quantum and remaining burst)
-            time_slice = min(quantum, current_process["remaining"])
-            
-            # Execute the process for the time slice
-            color = color_map[pid]
-            self.draw_bar(f"P{pid}", current_time, time_slice, x_start, y_pos, color, time_unit)
-            
-            # Update time and x_start
-            x_start += time_slice * time_unit
-            current_time += time_slice
-            
-            # Update remaining time for the process
-            current_process["remaining"] -= time_slice
-            
-            # Check for new arrivals during this execution
-            new_arrivals = [p for p in remaining_processes if p["arrival"] <= current_time]
-            for p in new_arrivals:
-                ready_queue.append(p)
-                remaining_processes.remove(p)
-            
-            # If process is not complete, put it back in the ready queue
-            if current_process["remaining"] > 0:
-                ready_queue.append(current_process)
-            else:
-                # Record completion metrics
-                completion_time = current_time
-                arrival_time = current_process["arrival"]
-                burst_time = current_process["burst"]
-                tat = completion_time - arrival_time
-                wt = tat - burst_time
-                rt = completion_records[pid]["first_response"]
-                self.metrics.append((pid, arrival_time, burst_time, completion_time, tat, wt, rt))
-                completion_records[pid]["completion"] = completion_time
-        
-        self.draw_time_markers(time_unit)
-        self.show_metrics("Round Robin")
-
-    def draw_bar(self, label, start, duration, x_start, y_pos, color, unit):
-        for t in range(duration):
-            rect = self.canvas.create_rectangle(
-                x_start + t * unit, y_pos,
-                x_start + (t + 1) * unit, y_pos + 50,
-                fill=color, outline="white", width=2
-            )
-            self.canvas.create_text(
-                x_start + t * unit + unit // 2, y_pos + 25,
-                text=label if t == duration // 2 else "",
-                fill="white", font=("Helvetica", 10, "bold")
-            )
-            self.canvas.update()
-            self.canvas.coords(self.timeline, 0, 125, x_start + (t + 1) * unit, 125)
-            time.sleep(0.1)  # Slightly faster animation
-
-        self.log_output.insert(tk.END, f"{label} executed from time {start} to {start + duration}\n")
-        self.log_output.see(tk.END)
-    
-    def draw_time_markers(self, time_unit):
-        # Clear previous time markers
-        for label in self.time_labels:
-            self.canvas.delete(label)
-        self.time_labels.clear()
-        
-        # Get canvas width
-        canvas_width = self.canvas.winfo_width()
-        
-        # Calculate maximum time that fits on canvas
-        max_time = int((canvas_width - 10) / time_unit)
-        
-        # Draw time markers every 5 units
-        for t in range(0, max_time + 1, 5):
-            x_pos = 10 + t * time_unit
-            # Draw marker line
-            line = self.canvas.create_line(x_pos, 85, x_pos, 95, fill="white", width=2)
-            self.time_labels.append(line)
-            # Draw time label
-            text = self.canvas.create_text(x_pos, 75, text=str(t), fill="white", font=("Helvetica", 8))
-            self.time_labels.append(text)
-
-    def show_metrics(self, algorithm_name):
-        self.metrics_table.delete(*self.metrics_table.get_children())
-        for metric in self.metrics:
-            self.metrics_table.insert("", tk.END, values=metric)
-
-        n = len(self.metrics)
-        avg_tat = sum(m[4] for m in self.metrics) / n if n > 0 else 0
-        avg_wt = sum(m[5] for m in self.metrics) / n if n > 0 else 0
-        avg_rt = sum(m[6] for m in self.metrics) / n if n > 0 else 0
-        total_time = max(m[3] for m in self.metrics) if n > 0 else 0
-        throughput = n / total_time if total_time > 0 else 0
-
-        summary = f"{algorithm_name} | Avg TAT: {avg_tat:.2f} | Avg WT: {avg_wt:.2f} | Avg RT: {avg_rt:.2f} | Throughput: {throughput:.2f} processes/unit"
-        self.summary_label.config(text=summary)
+            self.run_stats.save_json(path)
+        except OSError as e:
+            messagebox.showerror("Export Failed", str(e))
+            return
+        self.log.write(f"Exported run statistics to {path}")
+
+    def export_profile(self):
+        if self.run_stats.profiler is None:
+            messagebox.showinfo("Not Profiled", "Tick cProfile before running to record a profile.")
+            return
+        path = filedialog.asksaveasfilename(title="Export Profile", defaultextension=".prof",
+                                            filetypes=[("Profile files", "*.prof"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.run_stats.save_profile(path)
+        except OSError as e:
+            messagebox.showerror("Export Failed", str(e))
+            return
+        self.log.write(f"Exported cProfile data to {path} (open with python -m pstats)")
+
+    def scroll_gantt(self, event, direction):
+        self.gantt.xview("scroll", 1 if direction > 0 else -1, "units")
+
+    def zoom_gantt(self, event, direction):
+        self.gantt.zoom(ZOOM_STEP if direction > 0 else 1 / ZOOM_STEP, event.x)
+
+    def show_metrics(self, algorithm_name, segments=(), summary=None):
+        self.metrics_view.show(self.metrics)
+
+        if summary is None:
+            summary = summarize(self.metrics, segments)
+        text = format_summary(algorithm_name, summary)
+        if "CPUs" in summary:
+            text += "\n" + smp.format_smp(summary)
+        self.summary_label.config(text=text)
 
         # Store results for comparison
-        self.algorithm_results[algorithm_name] = {
-            "TAT": avg_tat,
-            "WT": avg_wt,
-            "RT": avg_rt,
-            "Throughput": throughput
-        }
+        self.algorithm_results[algorithm_name] = summary
         
         self.draw_algorithm_graph(algorithm_name)
 
+    def show_top_metrics(self):
+        try:
+            n = self.top_n.get()
+        except tk.TclError:
+            n = 0
+        if n <= 0:
+            messagebox.showerror("Invalid Count", "The number of rows must be a positive integer.")
+            return
+        self.metrics_view.top(self.top_column.get(), n)
+
     def draw_algorithm_graph(self, algorithm_name):
-        # Create a popup window for the algorithm graph
-        popup = tk.Toplevel(self.root)
-        popup.title(f"{algorithm_name} Performance")
-        popup.geometry("600x500")
-        popup.configure(bg="#0f111a")
-        
-        fig, ax = plt.subplots(figsize=(8, 5), dpi=100)
-        metrics = ["TAT", "WT", "RT", "Throughput"]
-        values = [
-            self.algorithm_results[algorithm_name]["TAT"],
-            self.algorithm_results[algorithm_name]["WT"],
-            self.algorithm_results[algorithm_name]["RT"],
-            self.algorithm_results[algorithm_name]["Throughput"]
-        ]
-        
-        bars = ax.bar(metrics, values, color=["#4caf50", "#2196f3", "#ff9800", "#9c27b0"])
-        ax.set_title(f"{algorithm_name} Performance", fontsize=14)
-        ax.set_ylabel("Units", fontsize=12)
-        
-        # Add value labels on top of the bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.annotate(f'{height:.2f}',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),  # 3 points vertical offset
-                        textcoords="offset points",
-                        ha='center', va='bottom',
-                        fontsize=9)
-
-        # Create the canvas in the popup window
-        canvas = FigureCanvasTkAgg(fig, master=popup)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Add a close button
-        ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=10)
+        self.charts.algorithm.show(algorithm_name, self.algorithm_results[algorithm_name])
 
     def compare_all_algorithms(self):
         if not self.processes:
@@ -583,57 +776,74 @@ class SchedulixSimulator:
         if self.simulation_running:
             messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
             return
-            
-        if len(self.algorithm_results) < 2:
-            messagebox.showinfo("Insufficient Data", "Run at least two different algorithms to compare.")
+
+        # Every algorithm and Round Robin quantum runs headlessly in a process pool
+        self.next_cancel_token()
+        self.summary_label.config(text=f"Comparing {len(compare.comparison_jobs())} schedules in parallel...")
+        self.start_worker(comparison_worker, self.processes.snapshot(), self.cache, self.cancel_token)
+
+    def sweep_quantum(self):
+        if not self.processes:
+            messagebox.showwarning("No Data", "Please add processes before sweeping.")
             return
-            
-        # Create a popup window for the comparison graph
-        popup = tk.Toplevel(self.root)
-        popup.title("Algorithm Comparison")
-        popup.geometry("800x600")
-        popup.configure(bg="#0f111a")
-        
-        # Create the figure with larger size
-        fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
-        
-        algorithms = list(self.algorithm_results.keys())
-        metrics = ["TAT", "WT", "RT", "Throughput"]
-        
-        x = np.arange(len(metrics))
-        width = 0.8 / len(algorithms)
-        
-        for i, algo in enumerate(algorithms):
-            values = [
-                self.algorithm_results[algo]["TAT"],
-                self.algorithm_results[algo]["WT"],
-                self.algorithm_results[algo]["RT"],
-                self.algorithm_results[algo]["Throughput"]
-            ]
-            offset = width * i - width * (len(algorithms) - 1) / 2
-            ax.bar(x + offset, values, width, label=algo)
-        
-        ax.set_xlabel('Metrics', fontsize=12)
-        ax.set_ylabel('Values', fontsize=12)
-        ax.set_title('Algorithm Comparison', fontsize=16)
-        ax.set_xticks(x)
-        ax.set_xticklabels(metrics, fontsize=10)
-        ax.legend(fontsize=10)
-        
-        plt.tight_layout()
-        
-        # Create the canvas in the popup window
-        canvas = FigureCanvasTkAgg(fig, master=popup)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Add a close button
-        ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=10)
+
+        if self.simulation_running:
+            messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
+            return
+
+        text = simpledialog.askstring("Quantum Sweep", "Quanta to try (e.g. 1-50, 1-100:5 or 2,4,8):", parent=self.root, initialvalue="1-20")
+        if not text:
+            return
+        try:
+            quanta = compare.parse_quanta(text)
+        except ValueError as e:
+            messagebox.showerror("Invalid Quanta", str(e))
+            return
+
+        self.next_cancel_token()
+        self.summary_label.config(text=f"Sweeping {len(quanta)} Round Robin quanta in parallel...")
+        self.start_worker(sweep_worker, self.processes.snapshot(), quanta, self.cache, self.cancel_token)
+
+    def evaluate_monte_carlo(self):
+        # Ranks every algorithm over many random workloads instead of the one in the table
+        if self.simulation_running:
+            messagebox.showinfo("Simulation Running", "Please wait for current simulation to complete.")
+            return
+        trials = simpledialog.askinteger("Monte Carlo", "Number of random workloads:", parent=self.root, minvalue=1, initialvalue=1000)
+        if trials is None:
+            return
+        n = simpledialog.askinteger("Monte Carlo", "Processes per workload:", parent=self.root, minvalue=1,
+                                    initialvalue=montecarlo.DEFAULT_WORKLOAD["n"])
+        if n is None:
+            return
+        burst = simpledialog.askstring("Monte Carlo", "Burst distribution (exponential, pareto or uniform):",
+                                       parent=self.root, initialvalue=montecarlo.DEFAULT_WORKLOAD["burst"])
+        if not burst:
+            return
+        try:
+            quantum = self.quantum.get()
+        except tk.TclError:
+            quantum = 0
+        if quantum <= 0:
+            messagebox.showerror("Invalid Quantum", "Quantum must be a positive integer.")
+            return
+        if burst.strip().lower() not in workload.BURST_DISTRIBUTIONS:
+            messagebox.showerror("Invalid Distribution", f"Burst distribution must be one of {', '.join(workload.BURST_DISTRIBUTIONS)}.")
+            return
+
+        spec = dict(montecarlo.DEFAULT_WORKLOAD, n=n, burst=burst.strip().lower())
+        self.next_cancel_token()
+        self.summary_label.config(text=f"Evaluating {len(engine.ALGORITHMS)} algorithms on {trials} random workloads...")
+        self.start_worker(montecarlo_worker, trials, spec, quantum, self.cancel_token)
+
+    def draw_sweep_graph(self, sweep, best):
+        self.charts.sweep.show(sweep, best)
+
+    def draw_comparison_graph(self, results):
+        self.charts.comparison.show(results)
+
 
 if __name__ == "__main__":
-    # Fix missing numpy import
-    import numpy as np
-    
     root = tk.Tk()
     app = SchedulixSimulator(root)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""Summary statistics for a completed schedule.
+
+summarize() turns the per-process metric rows and the schedule segments of a
+ScheduleResult into one flat dict. The per-process columns are loaded into a
+single NumPy array, so every statistic is computed in C even for
+million-process runs. NumPy is imported on first use, so importing this
+module (as the GUI does at startup) stays cheap.
+
+RunningSummary builds the same dict incrementally in constant memory for
+streams that never end; its percentiles are P-square estimates.
+"""
+from itertools import chain
+
+# Column positions in a metric row (pid, arrival, burst, ct, tat, wt, rt)
+BURST, COMPLETION, TAT, WT, RT = 2, 3, 4, 5, 6
+
+TIME_METRICS = ("TAT", "WT", "RT")
+STATS = ("median", "p95", "p99", "max")
+
+
+def empty_summary():
+    summary = {name: 0.0 for name in TIME_METRICS}
+    for name in TIME_METRICS:
+        for stat in STATS:
+            summary[f"{name} {stat}"] = 0.0
+    summary.update({"Throughput": 0.0, "CPU Utilization": 0.0, "Idle Time": 0,
+                    "Context Switches": 0, "Fairness": 0.0, "Makespan": 0, "Processes": 0})
+    return summary
+
+
+def as_matrix(metrics):
+    # Metric rows as one (n, 7) int64 array; mapped trace metrics already have one
+    matrix = getattr(metrics, "matrix", None)
+    if matrix is not None:
+        return matrix
+    import numpy as np
+    n = len(metrics)
+    return np.fromiter(chain.from_iterable(metrics), dtype=np.int64, count=n * 7).reshape(n, 7)
+
+
+def summarize(metrics, segments=()):
+    # "TAT", "WT" and "RT" hold the means so older result dicts keep working
+    summary = empty_summary()
+    n = len(metrics)
+    if n == 0:
+        return summary
+
+    import numpy as np
+    rows = as_matrix(metrics)
+    for name, col in zip(TIME_METRICS, (TAT, WT, RT)):
+        values = rows[:, col]
+        median, p95, p99 = np.percentile(values, (50, 95, 99))
+        summary[name] = float(values.mean())
+        summary[f"{name} median"] = float(median)
+        summary[f"{name} p95"] = float(p95)
+        summary[f"{name} p99"] = float(p99)
+        summary[f"{name} max"] = float(values.max())
+
+    makespan = int(rows[:, COMPLETION].max())
+    busy = int(rows[:, BURST].sum())
+
+    idle_time = 0
+    switches = 0
+    last_pid = None
+    for pid, start, end in segments:
+        if pid is None:
+            idle_time += end - start
+        elif end > start:
+            # A switch is any dispatch of a different process than the last one run
+            if last_pid is not None and pid != last_pid:
+                switches += 1
+            last_pid = pid
+
+    # Jain's index over each process's share of service, burst / turnaround
+    tat = rows[:, TAT].astype(np.float64)
+    share = np.divide(rows[:, BURST], tat, out=np.ones(n), where=tat > 0)
+    fairness = float(share.sum() ** 2 / (n * np.square(share).sum())) if share.any() else 1.0
+
+    summary.update({
+        "Throughput": n / makespan if makespan > 0 else 0.0,
+        "CPU Utilization": busy / makespan if makespan > 0 else 0.0,
+        "Idle Time": idle_time,
+        "Context Switches": switches,
+        "Fairness": fairness,
+        "Makespan": makespan,
+        "Processes": n,
+    })
+    return summary
+
+
+def format_summary(algorithm_name, summary):
+    return (
+        f"{algorithm_name} | Avg TAT: {summary['TAT']:.2f} | Avg WT: {summary['WT']:.2f} | "
+        f"Avg RT: {summary['RT']:.2f} | Throughput: {summary['Throughput']:.2f} processes/unit\n"
+        f"WT p50/p95/p99/max: {summary['WT median']:.1f}/{summary['WT p95']:.1f}/"
+        f"{summary['WT p99']:.1f}/{summary['WT max']:.0f} | "
+        f"RT p95/p99: {summary['RT p95']:.1f}/{summary['RT p99']:.1f} | "
+        f"CPU: {summary['CPU Utilization']:.0%} | Idle: {summary['Idle Time']} | "
+        f"Switches: {summary['Context Switches']} | Fairness: {summary['Fairness']:.3f}"
+    )
+
+
+class P2Quantile:
+    # Jain & Chlamtac's P-square estimator: five markers, O(1) memory per quantile
+    def __init__(self, p):
+        self.p = p
+        self.q = []
+        self.n = [0, 1, 2, 3, 4]
+        self.np = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.dn = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x):
+        q = self.q
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        n, desired, dn = self.n, self.np, self.dn
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        elif x < q[1]:
+            k = 0
+        elif x < q[2]:
+            k = 1
+        elif x < q[3]:
+            k = 2
+        else:
+            k = 3
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired[1] += dn[1]
+        desired[2] += dn[2]
+        desired[3] += dn[3]
+        desired[4] += 1
+
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                # Piecewise-parabolic update, falling back to linear if it would cross a neighbour
+                qp = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = qp
+                n[i] += d
+
+    def value(self):
+        q = self.q
+        if not q:
+            return 0.0
+        if len(q) < 5:
+            import numpy as np
+            return float(np.percentile(q, self.p * 100))
+        return float(q[2])
+
+
+class RunningSummary:
+    # Incremental counterpart of summarize(); feed it every segment and metric row
+    def __init__(self):
+        self.count = 0
+        self.sums = [0, 0, 0]
+        self.maxima = [0, 0, 0]
+        self.quantiles = [tuple(P2Quantile(p) for p in (0.5, 0.95, 0.99)) for _ in TIME_METRICS]
+        self.busy = 0
+        self.makespan = 0
+        self.idle_time = 0
+        self.switches = 0
+        self.last_pid = None
+        self.share_sum = 0.0
+        self.share_sq_sum = 0.0
+
+    def add_segment(self, seg):
+        if seg.pid is None:
+            self.idle_time += seg.end - seg.start
+        elif seg.end > seg.start:
+            if self.last_pid is not None and seg.pid != self.last_pid:
+                self.switches += 1
+            self.last_pid = seg.pid
+
+    def add_metric(self, row):
+        self.count += 1
+        for i, col in enumerate((TAT, WT, RT)):
+            value = row[col]
+            self.sums[i] += value
+            if self.count == 1 or value > self.maxima[i]:
+                self.maxima[i] = value
+            for estimator in self.quantiles[i]:
+                estimator.add(value)
+        self.busy += row[BURST]
+        self.makespan = max(self.makespan, row[COMPLETION])
+        share = row[BURST] / row[TAT] if row[TAT] > 0 else 1.0
+        self.share_sum += share
+        self.share_sq_sum += share * share
+
+    def as_dict(self):
+        summary = empty_summary()
+        n = self.count
+        if n == 0:
+            return summary
+        for i, name in enumerate(TIME_METRICS):
+            median, p95, p99 = (estimator.value() for estimator in self.quantiles[i])
+            summary[name] = self.sums[i] / n
+            summary[f"{name} median"] = median
+            summary[f"{name} p95"] = p95
+            summary[f"{name} p99"] = p99
+            summary[f"{name} max"] = float(self.maxima[i])
+        makespan = self.makespan
+        summary.update({
+            "Throughput": n / makespan if makespan > 0 else 0.0,
+            "CPU Utilization": self.busy / makespan if makespan > 0 else 0.0,
+            "Idle Time": self.idle_time,
+            "Context Switches": self.switches,
+            "Fairness": self.share_sum ** 2 / (n * self.share_sq_sum) if self.share_sq_sum else 1.0,
+            "Makespan": makespan,
+            "Processes": n,
+        })
+        return summary
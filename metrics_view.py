@@ -0,0 +1,161 @@
+"""Virtualized metrics table for Schedulix.
+
+MetricsModel keeps the per-process metric rows as one NumPy array and
+answers sorted, filtered pages through cached argsort indices, so changing
+the sort order or showing the top-N worst rows never touches the rows
+themselves. MetricsView shows a page of the model in a ttk.Treeview that
+only ever holds as many items as it has visible rows; scrolling rewrites
+their values in place instead of inserting one item per process.
+"""
+from metrics import as_matrix
+
+COLUMNS = ("PID", "Arrival", "Burst", "CT", "TAT", "WT", "RT")
+
+
+class MetricsModel:
+    def __init__(self, metrics=()):
+        self.set_rows(metrics)
+
+    def set_rows(self, metrics):
+        # An empty table has no array, so the GUI doesn't load NumPy at startup
+        self.data = as_matrix(metrics) if len(metrics) else ()
+        self._orders = {}  # (column, descending) -> row indices
+        self.sort_column = None
+        self.descending = False
+        self.limit = None
+        self._view = None
+
+    def __len__(self):
+        n = len(self.data)
+        return n if self.limit is None else min(n, self.limit)
+
+    def order(self, column, descending=False):
+        # Stable argsort of one column, computed once per column and direction
+        key = (column, descending)
+        if key not in self._orders:
+            import numpy as np
+            values = self.data[:, COLUMNS.index(column)]
+            self._orders[key] = np.argsort(-values if descending else values, kind="stable")
+        return self._orders[key]
+
+    def sort(self, column, descending=False):
+        # Re-sorting drops any top-N limit
+        self.sort_column = column
+        self.descending = descending
+        self.limit = None
+        self._view = None
+
+    def top(self, column, n):
+        # The n largest values of column, e.g. the worst waiting times
+        self.sort(column, descending=True)
+        self.limit = n
+
+    def show_all(self):
+        self.limit = None
+
+    def page(self, offset, count):
+        # Rows offset..offset+count of the current view, as tuples of ints
+        end = min(len(self), offset + count)
+        if offset >= end:
+            return []
+        if self.sort_column is None:
+            rows = self.data[offset:end]
+        else:
+            if self._view is None:
+                self._view = self.order(self.sort_column, self.descending)
+            rows = self.data[self._view[offset:end]]
+        return [tuple(row) for row in rows.tolist()]
+
+
+class MetricsView:
+    # Binds a MetricsModel to a Treeview with show="headings" and the COLUMNS columns
+    def __init__(self, tree, yscrollcommand=None, on_change=None):
+        self.tree = tree
+        self.model = MetricsModel()
+        self.rows = int(tree["height"])
+        self.offset = 0
+        self.yscrollcommand = yscrollcommand  # Usually a ttk.Scrollbar's set method
+        self.on_change = on_change  # Called after every refresh, e.g. to update a status label
+        self._items = []  # Treeview items reused for the visible rows
+        for col in COLUMNS:
+            tree.heading(col, text=col, command=lambda c=col: self.toggle_sort(c))
+            tree.column(col, anchor="center", width=100)
+
+    def show(self, metrics):
+        self.model.set_rows(metrics)
+        self.offset = 0
+        self.refresh()
+
+    def clear(self):
+        self.show(())
+
+    def toggle_sort(self, column):
+        # First click sorts ascending, the next one descending
+        descending = self.model.sort_column == column and not self.model.descending
+        self.model.sort(column, descending)
+        self.offset = 0
+        self.refresh()
+
+    def top(self, column, n):
+        self.model.top(column, n)
+        self.offset = 0
+        self.refresh()
+
+    def show_all(self):
+        self.model.show_all()
+        self.refresh()
+
+    def yview(self, *args):
+        # Tk scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.model))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            self.offset += amount * (self.rows if args[2] == "pages" else 1)
+        self.refresh()
+
+    def scroll(self, units):
+        self.yview("scroll", units, "units")
+
+    def _fractions(self):
+        n = len(self.model)
+        if n == 0:
+            return 0.0, 1.0
+        return self.offset / n, min(1.0, (self.offset + self.rows) / n)
+
+    def refresh(self):
+        self.offset = max(0, min(self.offset, len(self.model) - self.rows))
+        page = self.model.page(self.offset, self.rows)
+        while len(self._items) < len(page):
+            self._items.append(self.tree.insert("", "end"))
+        for item, values in zip(self._items, page):
+            self.tree.item(item, values=values)
+        # Spare items are detached rather than deleted, ready for the next page
+        for i, item in enumerate(self._items):
+            if i < len(page):
+                self.tree.move(item, "", i)
+            else:
+                self.tree.detach(item)
+
+        for col in COLUMNS:
+            arrow = ""
+            if col == self.model.sort_column:
+                arrow = " ▼" if self.model.descending else " ▲"
+            self.tree.heading(col, text=col + arrow)
+        if self.yscrollcommand:
+            self.yscrollcommand(*self._fractions())
+        if self.on_change:
+            self.on_change()
+
+    def status(self):
+        n = len(self.model)
+        if n == 0:
+            return "No processes"
+        first = self.offset + 1
+        last = min(n, self.offset + self.rows)
+        text = f"Rows {first}-{last} of {n}"
+        if self.model.limit is not None:
+            text += f" (top {self.model.limit} by {self.model.sort_column})"
+        return text
@@ -0,0 +1,192 @@
+"""Monte Carlo evaluation of the scheduling algorithms.
+
+evaluate() generates many seeded random workloads (workload.generate with
+the same keyword arguments for each, trial i using seed + i), runs every
+algorithm on each one across a process pool and folds the summaries into
+running means. Workers aggregate a whole batch of trials before returning
+it, and batches are merged as they finish, so memory stays proportional to
+the number of algorithms and metrics however many trials run. The same
+seed gives the same workloads, and so the same result up to rounding, for
+any number of workers.
+
+Besides the metrics, each trial ranks the algorithms by an objective
+(average waiting time unless told otherwise), so the result also holds every
+algorithm's mean rank. Intervals use the normal approximation, which is
+sound for the hundreds or thousands of trials this is meant for.
+"""
+import math
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import NormalDist
+
+import engine
+import workload
+from metrics import summarize
+
+METRICS = ("TAT", "WT", "RT", "TAT p99", "WT p99", "Throughput", "CPU Utilization", "Context Switches",
+           "Fairness")
+HIGHER_IS_BETTER = ("Throughput", "CPU Utilization", "Fairness")
+RANK = "Rank"  # Pseudo-metric: the algorithm's place among all of them in a trial, 1 = best
+
+# Keyword arguments for workload.generate; arrival_rate 0.16 with a mean burst of 5 loads one CPU to ~0.8
+DEFAULT_WORKLOAD = {"n": 200, "arrival_rate": 0.16, "burst": "pareto", "mean_burst": 5.0}
+
+MAX_BATCH = 64  # Trials per worker task
+
+# trials actually run (fewer than asked for if cancelled), and
+# stats[algorithm][metric] -> RunningMean, including RANK
+MonteCarloResult = namedtuple("MonteCarloResult", ["trials", "confidence", "objective", "stats"])
+
+
+class RunningMean:
+    # Welford's running mean and variance; merge() combines two partial runs
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    def stdev(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def half_width(self, confidence=0.95):
+        # Half the width of the confidence interval for the mean
+        if self.count < 2:
+            return 0.0
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * self.stdev() / math.sqrt(self.count)
+
+
+def _ranks(values, higher_is_better=False):
+    # 1-based ranks of values; tied values share the average of their places
+    order = sorted(range(len(values)), key=values.__getitem__, reverse=higher_is_better)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def _run_batch(seeds, spec, algorithms, quantum, objective):
+    # One worker task: {algorithm: {metric: RunningMean}} over the trials in seeds
+    stats = {algorithm: {metric: RunningMean() for metric in METRICS + (RANK,)} for algorithm in algorithms}
+    for seed in seeds:
+        table = workload.generate(seed=seed, **spec)
+        table.arrival_order()
+        scores = []
+        for algorithm in algorithms:
+            result = engine.run(algorithm, table, quantum)
+            summary = summarize(result.metrics, result.segments)
+            for metric in METRICS:
+                stats[algorithm][metric].add(summary[metric])
+            scores.append(summary[objective])
+        for algorithm, rank in zip(algorithms, _ranks(scores, objective in HIGHER_IS_BETTER)):
+            stats[algorithm][RANK].add(rank)
+    return stats
+
+
+def evaluate(trials, spec=None, algorithms=None, quantum=4, seed=0, objective="WT", confidence=0.95,
+             max_workers=None, cancel=None, progress=None):
+    # progress(done, trials) is called as batches finish
+    spec = dict(DEFAULT_WORKLOAD if spec is None else spec)
+    algorithms = list(engine.ALGORITHMS if algorithms is None else algorithms)
+    if trials <= 0:
+        raise ValueError("The number of trials must be a positive integer.")
+    if objective not in METRICS:
+        raise ValueError(f"Objective must be one of {', '.join(METRICS)}")
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be between 0 and 1.")
+    if not algorithms:
+        raise ValueError("Choose at least one algorithm.")
+    for algorithm in algorithms:
+        if algorithm not in engine.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+    workload.generate(**dict(spec, n=0))  # Rejects a bad distribution here rather than in every worker
+    cancel = cancel or engine.CancelToken()
+
+    workers = min(max_workers or os.cpu_count() or 1, trials)
+    size = max(1, min(MAX_BATCH, trials // (workers * 4)))
+    batches = [range(seed + start, seed + min(start + size, trials)) for start in range(0, trials, size)]
+    stats = {algorithm: {metric: RunningMean() for metric in METRICS + (RANK,)} for algorithm in algorithms}
+    done = 0
+
+    def fold(part):
+        nonlocal done
+        for algorithm, means in part.items():
+            for metric, mean in means.items():
+                stats[algorithm][metric].merge(mean)
+        done += part[algorithms[0]][RANK].count
+        if progress:
+            progress(done, trials)
+
+    if workers == 1:
+        for batch in batches:
+            if cancel.cancelled:
+                raise engine.SimulationCancelled()
+            fold(_run_batch(batch, spec, algorithms, quantum, objective))
+    else:
+        # spawn keeps the workers clear of the parent's Tk state
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pending = {pool.submit(_run_batch, batch, spec, algorithms, quantum, objective) for batch in batches}
+            while pending:
+                finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                if cancel.cancelled:
+                    for future in pending:
+                        future.cancel()
+                    raise engine.SimulationCancelled()
+                for future in finished:
+                    fold(future.result())
+
+    return MonteCarloResult(done, confidence, objective, stats)
+
+
+def ranking(result, metric=None):
+    # [(algorithm, mean, half_width)], best first; metric defaults to the objective
+    metric = metric or result.objective
+    rows = [(algorithm, means[metric].mean, means[metric].half_width(result.confidence))
+            for algorithm, means in result.stats.items()]
+    return sorted(rows, key=lambda row: row[1], reverse=metric in HIGHER_IS_BETTER)
+
+
+def as_dict(result):
+    return {
+        "trials": result.trials,
+        "confidence": result.confidence,
+        "objective": result.objective,
+        "algorithms": {
+            algorithm: {metric: {"mean": mean.mean, "stdev": mean.stdev(),
+                                 "ci": mean.half_width(result.confidence)}
+                        for metric, mean in means.items()}
+            for algorithm, means in result.stats.items()
+        },
+    }
+
+
+def format_ranking(result):
+    lines = [f"{result.trials} workloads, {result.confidence:.0%} intervals, ranked by {result.objective}:"]
+    by_rank = {algorithm: mean for algorithm, mean, _ in ranking(result, RANK)}
+    for place, (algorithm, mean, half) in enumerate(ranking(result), 1):
+        lines.append(f"{place:>2}. {algorithm:<22} {result.objective} {mean:8.2f} ± {half:.2f}"
+                     f"   mean rank {by_rank[algorithm]:.2f}")
+    return "\n".join(lines)
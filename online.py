@@ -0,0 +1,192 @@
+"""Online (streaming) scheduling for Schedulix.
+
+stream() pulls processes lazily from any iterable in arrival order, such as
+a generator or workload.follow() on a file that is still being written. It
+yields ("segment", Segment) and ("completed", metric row) events as soon as
+they are final, and reads the next process only once a decision depends on
+it. Any policy registered in schedulers.py can be used: the
+Scheduler sees a table that holds only the processes that have arrived and
+not yet completed, so only those and one look-ahead arrival are kept in
+memory. Summary statistics are kept by a metrics.RunningSummary.
+
+For the same workload in arrival order the events match engine.run exactly.
+"""
+from collections import deque
+
+from engine import ALGORITHMS, Segment, SimulationCancelled, _NEVER_CANCELLED
+
+
+class _Window:
+    # Table columns keyed by arrival rank, for the processes still in the
+    # system; Scheduler classes index them through order, the identity here
+    def __init__(self):
+        self.pid = {}
+        self.arrival = {}
+        self.burst = {}
+        self.priority = {}
+
+    def add(self, rank, pid, arrival, burst, priority):
+        self.pid[rank] = pid
+        self.arrival[rank] = arrival
+        self.burst[rank] = burst
+        self.priority[rank] = priority
+
+    def remove(self, rank):
+        return self.pid.pop(rank), self.arrival.pop(rank), self.burst.pop(rank), self.priority.pop(rank)
+
+
+class _Ranks:
+    def __getitem__(self, rank):
+        return rank
+
+
+class _Arrivals:
+    # One-process look-ahead over the input stream, read only when asked for
+    def __init__(self, processes, window):
+        self._it = iter(processes)
+        self._window = window
+        self.rank = 0
+        self._head = None
+        self._read = False
+        self._last_arrival = None
+
+    def _advance(self):
+        self._read = True
+        item = next(self._it, None)
+        if item is None:
+            self._head = None
+            return
+        if isinstance(item, dict):
+            item = (item["pid"], item["arrival"], item["burst"], item.get("priority", 0))
+        pid, arrival, burst = item[0], item[1], item[2]
+        priority = item[3] if len(item) > 3 else 0
+        if self._last_arrival is not None and arrival < self._last_arrival:
+            raise ValueError(f"Online mode needs processes in arrival order (PID {pid} arrives at "
+                             f"{arrival}, after {self._last_arrival})")
+        self._last_arrival = arrival
+        self._head = (pid, arrival, burst, priority)
+
+    def peek(self):
+        # (pid, arrival, burst, priority) of the next process, or None at the end of
+        # the input; blocks on the input if it hasn't been read yet
+        if not self._read:
+            self._advance()
+        return self._head
+
+    def due(self, current_time):
+        head = self.peek()
+        return head is not None and head[1] <= current_time
+
+    def pop(self):
+        # Moves the next process into the window and returns its rank
+        rank = self.rank
+        self.rank += 1
+        self._window.add(rank, *self._head)
+        self._read = False
+        return rank
+
+
+def _schedule(scheduler, window, arrivals, cancel):
+    # engine.simulate over a stream: the same decisions, with processes
+    # leaving the window as they complete. A policy that runs_in_order
+    # without preemption works through its queue whatever arrives later, so
+    # it queues one process at a time, only once the queue runs dry, and
+    # holds a process with work left until the arrivals that queue up ahead
+    # of it are read.
+    preemptive = scheduler.preemptive
+    in_order = scheduler.runs_in_order and not preemptive
+    admit, pick, time_slice_of, requeue = scheduler.admit, scheduler.pick, scheduler.time_slice, scheduler.requeue
+    remaining = {}
+    first_run = {}
+    held = deque()  # (slice end, rank) still to be requeued, in order
+    current_time = 0
+
+    def admit_next(now):
+        rank = arrivals.pop()
+        remaining[rank] = window.burst[rank]
+        admit(rank, now)
+
+    def arrive():
+        while arrivals.due(current_time):
+            admit_next(current_time)
+
+    def refill():
+        # Queues whichever process the FIFO would run next
+        if held:
+            now, rank = held[0]
+            if arrivals.due(now):
+                admit_next(now)
+            else:
+                held.popleft()
+                requeue(rank, now, remaining[rank])
+        elif arrivals.due(current_time):
+            admit_next(current_time)
+
+    while True:
+        if cancel.cancelled:
+            raise SimulationCancelled()
+        if not in_order:
+            arrive()
+        elif not len(scheduler):
+            refill()
+
+        if not len(scheduler):
+            head = arrivals.peek()
+            if head is None:
+                return
+            yield ("segment", Segment(None, current_time, head[1]))
+            current_time = head[1]
+            continue
+
+        rank = pick(current_time)
+        if rank not in first_run:
+            first_run[rank] = current_time
+
+        time_slice = time_slice_of(rank, remaining[rank])
+        if preemptive:
+            # Preemptive policies decide again when the next process arrives
+            head = arrivals.peek()
+            if head is not None:
+                time_slice = min(time_slice, head[1] - current_time)
+        yield ("segment", Segment(window.pid[rank], current_time, current_time + time_slice))
+        current_time += time_slice
+        remaining[rank] -= time_slice
+
+        if remaining[rank] > 0:
+            # New arrivals during this slice queue up ahead of the preempted process
+            if in_order:
+                held.append((current_time, rank))
+            else:
+                arrive()
+                requeue(rank, current_time, remaining[rank])
+        else:
+            del remaining[rank]
+            pid, arrival, burst, _ = window.remove(rank)
+            tat = current_time - arrival
+            yield ("completed", (pid, arrival, burst, current_time, tat, tat - burst,
+                                 first_run.pop(rank) - arrival))
+
+
+def stream(algorithm, processes, quantum=4, cancel=None, summary=None):
+    # summary, if given, is a metrics.RunningSummary updated with every event
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    scheduler_class = ALGORITHMS[algorithm]
+    if scheduler_class.uses_quantum and quantum <= 0:
+        raise ValueError("Quantum must be a positive integer.")
+
+    window = _Window()
+    scheduler = scheduler_class(window, _Ranks(), quantum)
+    events = _schedule(scheduler, window, _Arrivals(processes, window), cancel or _NEVER_CANCELLED)
+    if summary is None:
+        return events
+    return _tracked(events, summary)
+
+
+def _tracked(events, summary):
+    for kind, payload in events:
+        if kind == "segment":
+            summary.add_segment(payload)
+        else:
+            summary.add_metric(payload)
+        yield kind, payload
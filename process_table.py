@@ -0,0 +1,209 @@
+"""Columnar process storage for Schedulix.
+
+A ProcessTable keeps one typed array per field instead of a dict per
+process. Schedulers address processes by row index, and snapshot() hands a
+run its own view of the table without copying anything until one side
+changes.
+
+Columns can also be read-only memoryviews over a mapped trace file (see
+tracefile.py); such a table pickles as the path of its trace, and the first
+write copies the columns into arrays.
+
+Once a table has been snapshotted it also logs the arrival time touched by
+every later edit, so earliest_change() can tell how much of an earlier
+run's schedule still holds for a newer snapshot.
+"""
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right
+
+FIELDS = ("pid", "arrival", "burst", "priority")
+
+
+class ProcessTable:
+    def __init__(self, pid=(), arrival=(), burst=(), priority=()):
+        self.pid = array("q", pid)
+        self.arrival = array("q", arrival)
+        self.burst = array("q", burst)
+        self.priority = array("q", priority)
+        if not len(self.pid) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("Process table columns must have the same length.")
+        self._shared = False    # Columns are shared with a snapshot
+        self._order = None      # Cached arrival order
+        self._pid_index = None  # pid -> row, built on first lookup
+        self._fingerprint = None
+        self._revision = 0
+        self._edits = None  # (revision, earliest arrival touched); a new list starts a new lineage
+        self._source = None  # Trace file the columns are mapped from
+
+    @classmethod
+    def wrap(cls, pid, arrival, burst, priority, order=None, source=None):
+        # Uses int64 buffers as the columns without copying them
+        if not len(pid) == len(arrival) == len(burst) == len(priority):
+            raise ValueError("Process table columns must have the same length.")
+        table = cls()
+        table.pid, table.arrival, table.burst, table.priority = pid, arrival, burst, priority
+        table._order = order
+        table._source = source
+        table._shared = True  # Never written in place
+        return table
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pid_index"] = None
+        if self._source is not None:
+            # Mapped columns travel as the trace path; the receiver maps the same file
+            for name in ("pid", "arrival", "burst", "priority", "_order"):
+                del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._source is not None:
+            from tracefile import load_processes
+
+            mapped = load_processes(self._source)
+            self.pid, self.arrival, self.burst, self.priority = mapped.pid, mapped.arrival, mapped.burst, mapped.priority
+            self._order = mapped._order
+
+    @classmethod
+    def from_dicts(cls, processes):
+        table = cls()
+        for p in processes:
+            table.append(p["pid"], p["arrival"], p["burst"], p.get("priority", 0))
+        return table
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __iter__(self):
+        for i in range(len(self.pid)):
+            yield self.row(i)
+
+    def row(self, i):
+        return {"pid": self.pid[i], "arrival": self.arrival[i], "burst": self.burst[i],
+                "priority": self.priority[i], "remaining": self.burst[i]}
+
+    def snapshot(self):
+        # Read-only copy for a run; the columns are only duplicated if this table changes later.
+        # The arrival order is sorted here, once, and then kept up to date by later edits.
+        self.arrival_order()
+        snap = ProcessTable.__new__(ProcessTable)
+        snap.pid, snap.arrival, snap.burst, snap.priority = self.pid, self.arrival, self.burst, self.priority
+        snap._order = self._order
+        snap._fingerprint = self._fingerprint
+        snap._pid_index = None
+        snap._source = self._source
+        snap._shared = self._shared = True
+        if self._edits is None:
+            self._edits = []
+        snap._edits, snap._revision = self._edits, self._revision
+        return snap
+
+    def _before_write(self, arrival):
+        # arrival is the earliest arrival time the edit touches
+        if self._shared:
+            self.pid = array("q", self.pid)
+            self.arrival = array("q", self.arrival)
+            self.burst = array("q", self.burst)
+            self.priority = array("q", self.priority)
+            if self._order is not None:
+                self._order = array("q", self._order)
+            self._shared = False
+            self._source = None
+        self._fingerprint = None
+        self._revision += 1
+        if self._edits is not None:
+            self._edits.append((self._revision, arrival))
+
+    def _order_position(self, row, arrival):
+        # Where row sits, or would sit, in the cached arrival order
+        return bisect_left(self._order, (arrival, row), key=lambda i: (self.arrival[i], i))
+
+    def index_of(self, pid):
+        # Row of pid or None, in constant time once the index exists
+        if self._pid_index is None:
+            self._pid_index = {p: i for i, p in enumerate(self.pid)}
+        return self._pid_index.get(pid)
+
+    def has_pid(self, pid):
+        return self.index_of(pid) is not None
+
+    def append(self, pid, arrival, burst, priority=0):
+        self._before_write(arrival)
+        if self._order is not None:
+            # The new row is last, so it goes after every equal arrival
+            self._order.insert(bisect_right(self._order, arrival, key=self.arrival.__getitem__), len(self.pid))
+        if self._pid_index is not None:
+            self._pid_index[pid] = len(self.pid)
+        self.pid.append(pid)
+        self.arrival.append(arrival)
+        self.burst.append(burst)
+        self.priority.append(priority)
+
+    def update(self, pid, arrival, burst, priority=0):
+        row = self.index_of(pid)
+        if row is None:
+            raise KeyError(pid)
+        old_arrival = self.arrival[row]
+        self._before_write(min(arrival, old_arrival))
+        if self._order is not None and arrival != old_arrival:
+            del self._order[self._order_position(row, old_arrival)]
+            self.arrival[row] = arrival
+            self._order.insert(self._order_position(row, arrival), row)
+        self.arrival[row] = arrival
+        self.burst[row] = burst
+        self.priority[row] = priority
+
+    def remove(self, pid):
+        row = self.index_of(pid)
+        if row is None:
+            raise KeyError(pid)
+        self._before_write(self.arrival[row])
+        if self._order is not None:
+            del self._order[self._order_position(row, self.arrival[row])]
+            self._order = array("q", (i - 1 if i > row else i for i in self._order))
+        del self.pid[row], self.arrival[row], self.burst[row], self.priority[row]
+        self._pid_index = None
+
+    def clear(self):
+        self._before_write(0)
+        del self.pid[:], self.arrival[:], self.burst[:], self.priority[:]
+        self._order = None
+        self._pid_index = None
+        self._edits = None  # Nothing carries over to the next run
+
+    def fingerprint(self):
+        # Content hash of every row in order; row order matters for tie-breaking
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for column in (self.pid, self.arrival, self.burst, self.priority):
+                digest.update(column)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def arrival_order(self):
+        # Row indices sorted by arrival; ties keep insertion order
+        if self._order is None:
+            self._order = array("q", sorted(range(len(self.pid)), key=self.arrival.__getitem__))
+        return self._order
+
+
+def earliest_change(old, new):
+    # Earliest arrival touched by the edits between two snapshots of one table:
+    # inf if there were none, None if new doesn't descend from old that way
+    if old._edits is None or old._edits is not new._edits or old._revision > new._revision:
+        return None
+    earliest = float("inf")
+    for revision, arrival in reversed(new._edits):
+        if revision <= old._revision:
+            break
+        if revision <= new._revision:
+            earliest = min(earliest, arrival)
+    return earliest
+
+
+def as_table(processes):
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_dicts(processes)
@@ -0,0 +1,114 @@
+"""Recordings of completed runs, for instant replay and scrubbing.
+
+A Recording keeps a finished schedule as int64 columns (pid, start, end)
+per CPU lane instead of a list of Segment tuples, and indexes it by time:
+
+- running(t) bisects each lane's start column for the segment covering t.
+- ready(t) rebuilds the ready queue at t without re-simulating. A process
+  is alive from its arrival until its completion, so the recording keeps
+  those arrival/completion events sorted by time, plus a snapshot of the
+  alive set every so often. The alive set at t is the last snapshot before
+  t with the few events after it applied, and the ready queue is the alive
+  set minus whatever is running at t.
+
+The event index is built on the first ready() call, since most recordings
+are never scrubbed.
+"""
+from array import array
+from bisect import bisect_right
+
+from metrics import as_matrix
+from tracefile import IDLE_PID, MappedSegments
+
+KEYFRAME_INTERVAL = 1024  # Minimum events between snapshots of the alive set
+MAX_RECORDINGS = 8  # Completed runs the GUI keeps for replay
+
+
+def _lane(segments):
+    pid = array("q", (IDLE_PID if seg.pid is None else seg.pid for seg in segments))
+    start = array("q", (seg.start for seg in segments))
+    end = array("q", (seg.end for seg in segments))
+    return MappedSegments(pid, start, end)
+
+
+class Recording:
+    def __init__(self, name, lanes, metrics):
+        # lanes holds one segment list per CPU; metrics rows are (pid, arrival, burst, ct, ...)
+        self.name = name
+        self.lanes = [_lane(segments) for segments in lanes]
+        self.end = max((lane.end[-1] for lane in self.lanes if len(lane)), default=0)
+        rows = as_matrix(metrics)
+        self._pid = rows[:, 0].copy()
+        self._arrival = rows[:, 1].copy()
+        self._completion = rows[:, 3].copy()
+        self._times = None  # Event index, built by _index()
+
+    @classmethod
+    def of(cls, result, name=None):
+        # From an engine ScheduleResult or an smp.SmpResult
+        lanes = getattr(result, "lanes", None) or [result.segments]
+        return cls(name or result.algorithm, lanes, result.metrics)
+
+    def __len__(self):
+        return sum(map(len, self.lanes))
+
+    def running(self, t):
+        # The segment running on each lane at time t, or None when the lane is idle or done
+        found = []
+        for lane in self.lanes:
+            i = bisect_right(lane.start, t) - 1
+            if i >= 0 and t < lane.end[i] and lane.pid[i] != IDLE_PID:
+                found.append(lane[i])
+            else:
+                found.append(None)
+        return found
+
+    def _index(self):
+        import numpy as np
+        n = len(self._pid)
+        times = np.concatenate((self._arrival, self._completion))
+        # Arrivals sort before completions at the same time, so a zero-burst
+        # process still enters the alive set before it leaves
+        kinds = np.concatenate((np.zeros(n, dtype=np.int8), np.ones(n, dtype=np.int8)))
+        order = np.lexsort((kinds, times))
+        self._times = times[order]
+        self._events = np.concatenate((self._pid, self._pid))[order].tolist()
+        self._arrives = (kinds[order] == 0).tolist()
+
+        # Snapshot sizes grow with the alive set, so snapshots are spaced at
+        # least that many events apart and take O(events) memory in total
+        self._keyframe_at = [0]
+        self._keyframes = [array("q")]
+        alive = set()
+        next_keyframe = KEYFRAME_INTERVAL
+        for i, (pid, arrives) in enumerate(zip(self._events, self._arrives), 1):
+            if arrives:
+                alive.add(pid)
+            else:
+                alive.discard(pid)
+            if i >= next_keyframe:
+                self._keyframe_at.append(i)
+                self._keyframes.append(array("q", alive))
+                next_keyframe = i + max(KEYFRAME_INTERVAL, len(alive))
+
+    def alive(self, t):
+        # pids that have arrived by t and not yet completed
+        if self._times is None:
+            self._index()
+        position = int(self._times.searchsorted(t, side="right"))
+        k = bisect_right(self._keyframe_at, position) - 1
+        alive = set(self._keyframes[k])
+        for i in range(self._keyframe_at[k], position):
+            if self._arrives[i]:
+                alive.add(self._events[i])
+            else:
+                alive.discard(self._events[i])
+        return alive
+
+    def ready(self, t):
+        # pids waiting for a CPU at time t, in pid order
+        alive = self.alive(t)
+        for seg in self.running(t):
+            if seg is not None:
+                alive.discard(seg.pid)
+        return sorted(alive)
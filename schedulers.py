@@ -0,0 +1,291 @@
+"""Scheduling policies for the Schedulix engine.
+
+A policy is a Scheduler subclass added to REGISTRY with @register; the GUI,
+the CLI and comparisons list whatever is registered. The engine owns the
+clock, arrivals, idle time, segments, metrics and checkpoints, so a policy
+only keeps its ready queue: admit() new arrivals, pick() the next process,
+bound its time_slice() and requeue() it if it stops with work left.
+Preemptive policies are asked again at every arrival. Processes are named
+by arrival rank, which also breaks ties in arrival order. The same classes
+drive the multi-CPU simulator (smp.py), which moves processes between
+per-CPU queues with steal() and adopt(), and the online scheduler
+(online.py).
+
+Every queue operation is O(1) or O(log n). Aging in particular never
+rescans the queue: a process's effective priority falls steadily while it
+waits, so every waiting process's key is its priority on one shared clock
+(priority * AGING_INTERVAL + time it was queued) and heap order is
+effective-priority order at any later time.
+"""
+import heapq
+from collections import deque
+
+REGISTRY = {}
+
+AGING_INTERVAL = 10  # Waiting this long raises a process one priority level
+MLFQ_LEVELS = 3      # Level i runs slices of quantum * 2**i; the last level is Round Robin
+BOOST_INTERVAL = 200  # MLFQ moves every process back to the top level this often
+
+
+def register(cls):
+    REGISTRY[cls.name] = cls
+    return cls
+
+
+class Scheduler:
+    name = None
+    preemptive = False    # Re-decide at every arrival, not only when a slice ends
+    uses_quantum = False
+    runs_in_order = False  # pick() takes the longest-queued process; online.py reads ahead less
+
+    def __init__(self, table, order, quantum=None):
+        self.table = table
+        self.order = order  # Row index of each arrival rank
+        self.quantum = quantum
+
+    def __len__(self):
+        # Number of waiting processes
+        raise NotImplementedError
+
+    def admit(self, rank, now):
+        raise NotImplementedError
+
+    def pick(self, now):
+        # Removes and returns the rank to run next; only called with processes waiting
+        raise NotImplementedError
+
+    def time_slice(self, rank, remaining):
+        # How long rank may run before it goes back to the queue
+        return remaining
+
+    def requeue(self, rank, now, remaining):
+        # rank stopped with remaining work left, at a slice end or an arrival
+        raise NotImplementedError
+
+    def waiting(self):
+        # Ranks of the waiting processes, in any order
+        raise NotImplementedError
+
+    def steal(self):
+        # Removes and returns a waiting rank for another CPU, preferably one that would run late
+        raise NotImplementedError
+
+    def adopt(self, rank, now, remaining):
+        # Takes in a process stolen from another CPU's queue
+        self.requeue(rank, now, remaining)
+
+    def save(self):
+        # A copy of the queue state for a checkpoint, naming processes by rank only
+        raise NotImplementedError
+
+    def restore(self, state):
+        raise NotImplementedError
+
+
+class FifoScheduler(Scheduler):
+    def __init__(self, table, order, quantum=None):
+        super().__init__(table, order, quantum)
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def admit(self, rank, now):
+        self.queue.append(rank)
+
+    def pick(self, now):
+        return self.queue.popleft()
+
+    def requeue(self, rank, now, remaining):
+        self.queue.append(rank)
+
+    def waiting(self):
+        return iter(self.queue)
+
+    def steal(self):
+        return self.queue.pop()
+
+    def save(self):
+        return list(self.queue)
+
+    def restore(self, state):
+        self.queue = deque(state)
+
+
+class KeyedScheduler(Scheduler):
+    # Binary heap of (key, rank); the lowest key runs first
+    def __init__(self, table, order, quantum=None):
+        super().__init__(table, order, quantum)
+        self.heap = []
+
+    def key(self, rank, now, remaining):
+        raise NotImplementedError
+
+    def __len__(self):
+        return len(self.heap)
+
+    def admit(self, rank, now):
+        heapq.heappush(self.heap, (self.key(rank, now, self.table.burst[self.order[rank]]), rank))
+
+    def pick(self, now):
+        return heapq.heappop(self.heap)[1]
+
+    def requeue(self, rank, now, remaining):
+        heapq.heappush(self.heap, (self.key(rank, now, remaining), rank))
+
+    def waiting(self):
+        return (rank for _, rank in self.heap)
+
+    def steal(self):
+        # A leaf, so the heap stays valid
+        return self.heap.pop()[1]
+
+    def save(self):
+        return self.heap[:]
+
+    def restore(self, state):
+        self.heap = list(state)
+
+
+@register
+class FirstComeFirstServed(FifoScheduler):
+    name = "FCFS"
+    runs_in_order = True
+
+
+@register
+class ShortestJobFirst(KeyedScheduler):
+    name = "SJF (Non-preemptive)"
+
+    def key(self, rank, now, remaining):
+        return remaining
+
+
+@register
+class ShortestRemainingTime(ShortestJobFirst):
+    name = "SJF (Preemptive)"
+    preemptive = True
+
+
+@register
+class Priority(KeyedScheduler):
+    # Lower number = higher priority
+    name = "Priority"
+
+    def key(self, rank, now, remaining):
+        return self.table.priority[self.order[rank]]
+
+
+@register
+class RoundRobin(FifoScheduler):
+    name = "Round Robin"
+    uses_quantum = True
+    runs_in_order = True
+
+    def time_slice(self, rank, remaining):
+        return min(self.quantum, remaining)
+
+
+@register
+class PreemptivePriority(Priority):
+    name = "Priority (Preemptive)"
+    preemptive = True
+
+
+@register
+class AgingPriority(Priority):
+    # Preemptive priority whose waiting processes gain one level per AGING_INTERVAL
+    name = "Priority (Aging)"
+    preemptive = True
+
+    def key(self, rank, now, remaining):
+        return self.table.priority[self.order[rank]] * AGING_INTERVAL + now
+
+
+@register
+class MultilevelFeedbackQueue(Scheduler):
+    # New processes start at level 0. Using up a level's allotment moves a
+    # process down one level, and every BOOST_INTERVAL all of them return to
+    # level 0 so long jobs can't starve.
+    name = "MLFQ"
+    preemptive = True
+    uses_quantum = True
+
+    def __init__(self, table, order, quantum=None):
+        super().__init__(table, order, quantum)
+        self.levels = [deque() for _ in range(MLFQ_LEVELS)]
+        self.level = {}  # rank -> level, for processes below level 0
+        self.used = {}   # rank -> time used of its current level's allotment
+        self.next_boost = BOOST_INTERVAL
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def allotment(self, level):
+        return self.quantum << level
+
+    def admit(self, rank, now):
+        self.levels[0].append(rank)
+        self.count += 1
+
+    def pick(self, now):
+        if now >= self.next_boost:
+            self.boost()
+            self.next_boost = (now // BOOST_INTERVAL + 1) * BOOST_INTERVAL
+        self.count -= 1
+        for queue in self.levels:
+            if queue:
+                return queue.popleft()
+
+    def boost(self):
+        top = self.levels[0]
+        for queue in self.levels[1:]:
+            top.extend(queue)
+            queue.clear()
+        self.level.clear()
+        self.used.clear()
+
+    def time_slice(self, rank, remaining):
+        used = self.used.get(rank, 0)
+        # While it runs, used holds the time used plus the work it started
+        # with, so requeue() gets the time used by subtracting what is left
+        self.used[rank] = used + remaining
+        return min(self.allotment(self.level.get(rank, 0)) - used, remaining)
+
+    def requeue(self, rank, now, remaining):
+        level = self.level.get(rank, 0)
+        # A boost while it ran (on another CPU's pick) reset its allotment
+        used = self.used[rank] - remaining if rank in self.used else 0
+        self.count += 1
+        if used < self.allotment(level):
+            # Cut short by an arrival: keep its place at the head of its level
+            self.used[rank] = used
+            self.levels[level].appendleft(rank)
+            return
+        self.used.pop(rank, None)
+        level = min(level + 1, MLFQ_LEVELS - 1)
+        self.level[rank] = level
+        self.levels[level].append(rank)
+
+    def waiting(self):
+        return (rank for queue in self.levels for rank in queue)
+
+    def steal(self):
+        self.count -= 1
+        for queue in reversed(self.levels):
+            if queue:
+                return queue.pop()
+
+    def adopt(self, rank, now, remaining):
+        # Allotments are per queue, so a stolen process starts again at level 0
+        self.admit(rank, now)
+
+    def save(self):
+        return [list(queue) for queue in self.levels], dict(self.level), dict(self.used), self.next_boost
+
+    def restore(self, state):
+        levels, level, used, self.next_boost = state
+        self.levels = [deque(queue) for queue in levels]
+        self.level, self.used = dict(level), dict(used)
+        self.count = sum(map(len, self.levels))
@@ -0,0 +1,280 @@
+"""Multi-core (SMP) scheduling simulation for Schedulix.
+
+run() schedules a workload on N CPUs with any policy registered in
+schedulers.py, using the same Scheduler classes as engine.run.
+Ready processes live either in one global run queue or in per-CPU run
+queues (one Scheduler each). With per-CPU queues, arrivals are spread
+round-robin over the CPUs, an idle CPU can steal work from the longest
+queue, and queues can be rebalanced periodically.
+
+The simulation is event driven: a heap holds the end of every running slice
+and an arrival cursor supplies new processes, so each decision costs
+O(log n + cpus). Preemptive policies decide again whenever their queue
+gains an arrival: the CPUs it serves put their processes back and pick
+again, and a process picked again on its own CPU keeps running in the same
+segment. With one CPU the schedule matches engine.run.
+"""
+import heapq
+from array import array
+from collections import namedtuple
+
+from engine import ALGORITHMS, Segment, SimulationCancelled, _NEVER_CANCELLED
+from metrics import summarize
+from process_table import as_table
+
+RUN_QUEUE_MODES = ("global", "per-cpu")
+
+BALANCE_INTERVAL = 20  # Time units between periodic rebalances of per-CPU queues
+
+# Run queue setups offered in the GUI, as keyword arguments for run()
+QUEUE_POLICIES = {
+    "Global": {"queues": "global"},
+    "Per-CPU": {"queues": "per-cpu"},
+    "Per-CPU + Stealing": {"queues": "per-cpu", "stealing": True},
+    "Per-CPU + Balancing": {"queues": "per-cpu", "balance_interval": BALANCE_INTERVAL},
+}
+
+# lanes holds one list of segments per CPU; idle time is the gaps between them
+SmpResult = namedtuple("SmpResult", ["algorithm", "cpus", "lanes", "metrics", "migrations", "busy", "makespan"])
+
+_INF = float("inf")
+
+
+def run(algorithm, processes, cpus=2, quantum=4, queues="global", stealing=False,
+        balance_interval=0, cancel=None, stats=None):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if cpus <= 0:
+        raise ValueError("CPU count must be a positive integer.")
+    if queues not in RUN_QUEUE_MODES:
+        raise ValueError(f"Run queues must be one of {', '.join(RUN_QUEUE_MODES)}")
+    scheduler_class = ALGORITHMS[algorithm]
+    if scheduler_class.uses_quantum and quantum <= 0:
+        raise ValueError("Quantum must be a positive integer.")
+    preemptive = scheduler_class.preemptive
+    cancel = cancel or _NEVER_CANCELLED
+
+    table = as_table(processes)
+    arrival, burst, pid = table.arrival, table.burst, table.pid
+    order = table.arrival_order()
+    n = len(order)
+
+    per_cpu = queues == "per-cpu"
+    ready = [scheduler_class(table, order, quantum) for _ in range(cpus if per_cpu else 1)]
+    queue_of = list(range(cpus)) if per_cpu else [0] * cpus
+    remaining = array("q", burst)
+    first_run = array("q", [-1]) * len(table)
+    last_cpu = array("q", [-1]) * len(table)
+
+    running = [-1] * cpus  # Arrival rank running on each CPU
+    run_start = [0] * cpus  # Start of the CPU's open segment
+    charged = [0] * cpus    # Time up to which the running process's work is counted
+    version = [0] * cpus
+    lanes = [[] for _ in range(cpus)]
+    busy = [0] * cpus
+    slice_ends = []      # heap of (end time, cpu, version)
+    idle = set(range(cpus))
+    touched = set()      # Per-CPU queues: CPUs whose queue or state changed at t
+    gained = set()       # Queues that took in new processes at t
+    cut = {}             # Preemptive policies: cpu -> rank put back at t
+    metrics = []
+    migrations = 0
+    queued = 0
+    next_cpu = 0
+    balancing = per_cpu and balance_interval > 0
+    next_balance = balance_interval if balancing else _INF
+    cursor = 0
+    t = 0
+
+    def take(q):
+        nonlocal queued
+        queued -= 1
+        return ready[q].pick(t)
+
+    def requeue(q, rank):
+        nonlocal queued
+        ready[q].requeue(rank, t, remaining[order[rank]])
+        queued += 1
+        touched.add(q)
+
+    def charge(c):
+        # Counts the work done by c's process up to t
+        idx = order[running[c]]
+        ran = t - charged[c]
+        busy[c] += ran
+        remaining[idx] -= ran
+        charged[c] = t
+        return idx
+
+    def close(c, rank):
+        lanes[c].append(Segment(pid[order[rank]], run_start[c], t))
+
+    def dispatch(c, rank):
+        nonlocal migrations
+        idx = order[rank]
+        if cut.get(c) == rank:
+            del cut[c]  # Picked again on its own CPU: the segment goes on
+        else:
+            if c in cut:
+                close(c, cut.pop(c))
+                if stats is not None:
+                    stats.preempt()
+            run_start[c] = t
+            if first_run[idx] < 0:
+                first_run[idx] = t
+            if last_cpu[idx] >= 0 and last_cpu[idx] != c:
+                migrations += 1
+            last_cpu[idx] = c
+            if stats is not None:
+                stats.decision(t, queued, pid[idx])
+        running[c] = rank
+        charged[c] = t
+        version[c] += 1
+        heapq.heappush(slice_ends, (t + ready[queue_of[c]].time_slice(rank, remaining[idx]), c, version[c]))
+        idle.discard(c)
+
+    def rebalance():
+        # Evens out the per-CPU queues so their lengths differ by at most one
+        level = queued // cpus
+        pool = []
+        for q in ready:
+            while len(q) > level + 1:
+                pool.append(q.steal())
+        for fill in (level, level + 1):
+            for c, q in enumerate(ready):
+                while pool and len(q) < fill:
+                    rank = pool.pop()
+                    q.adopt(rank, t, remaining[order[rank]])
+                    touched.add(c)
+                    gained.add(c)
+
+    while len(metrics) < n:
+        if cancel.cancelled:
+            raise SimulationCancelled()
+
+        t = min(slice_ends[0][0] if slice_ends else _INF,
+                arrival[order[cursor]] if cursor < n else _INF,
+                next_balance if queued else _INF)
+        balance_now = t >= next_balance
+        if balance_now:
+            next_balance = (t // balance_interval + 1) * balance_interval
+        touched.clear()
+        gained.clear()
+
+        # Slices ending now
+        preempted = []
+        while slice_ends and slice_ends[0][0] <= t:
+            _, c, v = heapq.heappop(slice_ends)
+            if v != version[c]:
+                continue  # Cut short by a preemption
+            rank = running[c]
+            idx = charge(c)
+            close(c, rank)
+            running[c] = -1
+            version[c] += 1
+            touched.add(c)
+            idle.add(c)
+            if remaining[idx] == 0:
+                tat = t - arrival[idx]
+                metrics.append((pid[idx], arrival[idx], burst[idx], t, tat, tat - burst[idx],
+                                first_run[idx] - arrival[idx]))
+            else:
+                preempted.append((rank, c))
+                if stats is not None:
+                    stats.preempt()
+
+        # New arrivals queue up ahead of preempted processes, as on one CPU
+        while cursor < n and arrival[order[cursor]] <= t:
+            q = next_cpu if per_cpu else 0
+            ready[q].admit(cursor, t)
+            queued += 1
+            touched.add(q)
+            gained.add(q)
+            cursor += 1
+            if per_cpu:
+                next_cpu = (next_cpu + 1) % cpus
+        for rank, c in preempted:
+            requeue(queue_of[c], rank)
+
+        if balance_now and queued:
+            rebalance()
+
+        # Preemptive policies: CPUs whose queue gained processes put theirs back and pick again
+        if preemptive and gained:
+            for c in range(cpus):
+                if running[c] >= 0 and queue_of[c] in gained:
+                    rank = running[c]
+                    charge(c)
+                    running[c] = -1
+                    version[c] += 1
+                    cut[c] = rank
+                    requeue(queue_of[c], rank)
+                    idle.add(c)
+
+        # Idle CPUs pick up work, stealing from the longest queue if their own is empty
+        if per_cpu:
+            for c in sorted(touched):
+                if running[c] < 0 and ready[c]:
+                    dispatch(c, take(c))
+            if stealing and queued and idle:
+                sizes = [len(q) for q in ready]
+                for c in sorted(idle):
+                    victim = max(range(cpus), key=sizes.__getitem__)
+                    if not sizes[victim]:
+                        break
+                    sizes[victim] -= 1
+                    queued -= 1
+                    dispatch(c, ready[victim].steal())
+        elif cut:
+            picks = [take(0) for _ in range(min(len(idle), queued))]
+            # A process picked again goes back to its own CPU, the rest to the lowest free ones
+            back = {rank: c for c, rank in cut.items()}
+            for rank in picks:
+                if rank in back:
+                    dispatch(back[rank], rank)
+            for rank in picks:
+                if rank not in back:
+                    dispatch(min(idle), rank)
+        else:
+            while idle and queued:
+                dispatch(min(idle), take(0))
+        for c, rank in cut.items():
+            close(c, rank)  # Put back and not picked again
+            if stats is not None:
+                stats.preempt()
+        cut.clear()
+
+    makespan = max((lane[-1].end for lane in lanes if lane), default=0)
+    return SmpResult(algorithm, cpus, lanes, metrics, migrations, busy, makespan)
+
+
+def summarize_smp(result):
+    # Per-process stats from metrics.summarize, plus per-core utilization and migrations
+    summary = summarize(result.metrics)
+    makespan = result.makespan
+    capacity = makespan * result.cpus
+    switches = 0
+    for lane in result.lanes:
+        last_pid = None
+        for seg in lane:
+            if seg.end > seg.start:
+                if last_pid is not None and seg.pid != last_pid:
+                    switches += 1
+                last_pid = seg.pid
+    summary.update({
+        "CPUs": result.cpus,
+        "CPU Utilization": sum(result.busy) / capacity if capacity else 0.0,
+        "Idle Time": capacity - sum(result.busy),
+        "Context Switches": switches,
+        "Migrations": result.migrations,
+        "Per-CPU Utilization": [b / makespan if makespan else 0.0 for b in result.busy],
+    })
+    return summary
+
+
+def format_smp(summary):
+    per_cpu = summary["Per-CPU Utilization"]
+    return (
+        f"CPUs: {summary['CPUs']} | Migrations: {summary['Migrations']} | "
+        f"Per-CPU utilization min/avg/max: {min(per_cpu):.0%}/{sum(per_cpu) / len(per_cpu):.0%}/{max(per_cpu):.0%}"
+    )
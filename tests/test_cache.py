@@ -0,0 +1,97 @@
+"""ResultCache: LRU order, the size bound, the disk tier and code versioning."""
+import os
+
+import cache
+import engine
+import workload
+from cache import ResultCache, cache_key, entry_size
+
+
+def run(seed):
+    table = workload.generate(20, seed=seed)
+    return cache_key(table, "FCFS"), engine.run("FCFS", table)
+
+
+def test_least_recently_used_entry_is_evicted():
+    c = ResultCache(max_entries=2)
+    c.put("a", summary={"n": 1})
+    c.put("b", summary={"n": 2})
+    assert c.get("a") is not None  # "b" is now the least recently used
+    c.put("c", summary={"n": 3})
+    assert c.get("b") is None
+    assert c.get("a").summary == {"n": 1} and c.get("c").summary == {"n": 3}
+    assert (c.hits, c.misses) == (3, 1)
+
+
+def test_full_results_are_cut_down_to_summaries_oldest_first():
+    runs = [run(seed) for seed in range(3)]
+    full = [entry_size(cache.CacheEntry(result, {})) for _, result in runs]
+    # Room for the two newest full results and one summary
+    c = ResultCache(max_bytes=full[1] + full[2] + cache.SUMMARY_BYTES)
+    for key, result in runs:
+        c.put(key, result, summary={"key": key})
+    oldest, middle, newest = (key for key, _ in runs)
+    assert c.get(oldest).result is None and c.get(oldest).summary == {"key": oldest}
+    assert c.get(oldest, need_result=True) is None
+    assert c.get(middle, need_result=True).result == runs[1][1]
+    assert c.get(newest, need_result=True).result == runs[2][1]
+    assert c._bytes == sum(c._sizes.values()) <= c.max_bytes
+
+
+def test_results_without_a_summary_are_dropped_when_over_the_bound():
+    (key_a, a), (key_b, b) = run(0), run(1)
+    c = ResultCache(max_bytes=entry_size(cache.CacheEntry(b, None)))
+    c.put(key_a, a)
+    c.put(key_b, b)
+    assert len(c) == 1 and c.get(key_a) is None
+    assert c.get(key_b, need_result=True).result == b
+
+
+def test_the_newest_entry_stays_whole_over_the_bound():
+    key, result = run(0)
+    c = ResultCache(max_bytes=1)
+    c.put(key, result, summary={})
+    assert c.get(key, need_result=True).result == result
+
+
+def test_a_memory_miss_is_served_from_disk(tmp_path):
+    key, result = run(0)
+    c = ResultCache(directory=str(tmp_path))
+    c.put(key, result, summary={"WT": 1.5})
+    c.clear()
+    assert len(c) == 0
+    entry = c.get(key)
+    assert entry.result is None and entry.summary == {"WT": 1.5}
+    assert len(c) == 1  # Remembered in memory again
+    # Only the summary goes to disk, so a replay still misses
+    assert c.get(key, need_result=True) is None
+    # A second cache on the same directory (a restart) hits too
+    assert ResultCache(directory=str(tmp_path)).get(key).summary == {"WT": 1.5}
+
+
+def test_another_code_version_never_hits(tmp_path, monkeypatch):
+    table = workload.generate(20, seed=0)
+    key = cache_key(table, "FCFS")
+    ResultCache(directory=str(tmp_path)).put(key, summary={"WT": 1.5})
+    monkeypatch.setattr(cache, "CODE_VERSION", "0123456789ab")
+    new_key = cache_key(table, "FCFS")
+    assert new_key != key
+    c = ResultCache(directory=str(tmp_path))
+    assert c.get(new_key) is None
+    # The next store clears out the other build's file
+    c.put(new_key, summary={"WT": 2.5})
+    assert [name.split("-")[0] for name in os.listdir(tmp_path)] == ["0123456789ab"]
+
+
+def test_disk_tier_keeps_the_most_recently_used_files_within_its_bound(tmp_path):
+    c = ResultCache(directory=str(tmp_path))
+    c.put("key0", summary={"n": 0})
+    size = os.path.getsize(c._path("key0"))
+    c = ResultCache(directory=str(tmp_path), max_disk_bytes=3 * size)
+    for n, key in enumerate(["key1", "key2", "key3"], start=1):
+        # Distinct, increasing use times regardless of the file system's clock resolution
+        for i, name in enumerate(sorted(os.listdir(tmp_path), key=lambda name: os.path.getmtime(tmp_path / name))):
+            os.utime(tmp_path / name, (1000 + i, 1000 + i))
+        c.put(key, summary={"n": n})
+    kept = [key for key in ["key0", "key1", "key2", "key3"] if os.path.exists(c._path(key))]
+    assert kept == ["key1", "key2", "key3"]
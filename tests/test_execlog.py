@@ -0,0 +1,106 @@
+"""ExecutionLog batching, trimming and file streaming, with a fake Text widget."""
+import execlog
+from execlog import DETAIL, INFO, WARNING, ExecutionLog
+
+
+class FakeRoot:
+    # Runs after() callbacks only when run() is called
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, fn):
+        self.next_id += 1
+        self.pending[self.next_id] = fn
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run(self):
+        while self.pending:
+            self.pending.pop(min(self.pending))()
+
+
+class FakeText:
+    # The parts of tk.Text the log uses, holding whole lines
+    def __init__(self):
+        self.lines = []
+
+    def insert(self, index, text):
+        assert index == "end"
+        self.lines.extend(text.split("\n")[:-1])
+
+    def delete(self, first, last):
+        # "1.0" up to "N.0" removes lines 1..N-1; "end" clears everything
+        end = len(self.lines) if last == "end" else int(last.split(".")[0]) - 1
+        del self.lines[:end]
+
+    def see(self, index):
+        pass
+
+
+def make_log(capacity=10, verbosity=DETAIL):
+    root, text = FakeRoot(), FakeText()
+    return root, text, ExecutionLog(root, text, capacity=capacity, verbosity=verbosity)
+
+
+def test_lines_are_batched_until_the_flush():
+    root, text, log = make_log()
+    log.write("one")
+    log.write("two")
+    assert text.lines == []
+    root.run()
+    assert text.lines == ["one", "two"]
+
+
+def test_widget_keeps_the_newest_capacity_lines():
+    root, text, log = make_log(capacity=10)
+    for i in range(6):
+        log.write(f"a{i}")
+    root.run()
+    for i in range(6):
+        log.write(f"b{i}")
+    root.run()
+    assert text.lines == ["a2", "a3", "a4", "a5"] + [f"b{i}" for i in range(6)]
+
+
+def test_skipped_notice_survives_an_overflow():
+    root, text, log = make_log(capacity=10)
+    log.write("old")
+    root.run()
+    for i in range(25):
+        log.write(f"line {i}")
+    root.run()
+    assert len(text.lines) == 10
+    assert text.lines[0] == "... 16 lines skipped ..."
+    assert text.lines[1:] == [f"line {i}" for i in range(16, 25)]
+
+
+def test_verbosity_filters_the_widget_only(tmp_path):
+    root, text, log = make_log(verbosity=WARNING)
+    path = tmp_path / "run.log"
+    log.stream_to(str(path))
+    log.write("shown", WARNING)
+    log.write("hidden", INFO)
+    assert log.enabled(DETAIL)  # Everything is formatted while streaming
+    root.run()
+    assert text.lines == ["shown"]
+    assert path.read_text() == "shown\nhidden\n"
+    log.stop_streaming()
+
+
+def test_file_flushes_without_the_widget(tmp_path, monkeypatch):
+    monkeypatch.setattr(execlog, "FILE_FLUSH_LINES", 3)
+    root, text, log = make_log(verbosity=WARNING)
+    path = tmp_path / "run.log"
+    log.stream_to(str(path))
+    for i in range(3):
+        log.write(f"detail {i}", DETAIL)
+    # Nothing reached the widget, yet the line count flushed the file
+    assert path.read_text() == "detail 0\ndetail 1\ndetail 2\n"
+    log.write("late", DETAIL)
+    root.run()  # The file's own timer
+    assert path.read_text().endswith("late\n")
+    assert text.lines == []
+    log.stop_streaming()
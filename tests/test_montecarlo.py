@@ -0,0 +1,89 @@
+"""Running means, their merging, and Monte Carlo rankings across workers."""
+import json
+import math
+import random
+
+import pytest
+
+import cli
+import montecarlo
+from montecarlo import RunningMean
+
+SPEC = {"n": 30, "arrival_rate": 0.2, "burst": "pareto", "mean_burst": 4.0}
+
+
+def accumulate(values):
+    mean = RunningMean()
+    for value in values:
+        mean.add(value)
+    return mean
+
+
+def test_running_mean_matches_the_textbook_formulas():
+    values = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+    mean = accumulate(values)
+    average = sum(values) / len(values)
+    stdev = math.sqrt(sum((v - average) ** 2 for v in values) / (len(values) - 1))
+    assert mean.count == len(values)
+    assert mean.mean == pytest.approx(average)
+    assert mean.stdev() == pytest.approx(stdev)
+    assert mean.half_width(0.95) == pytest.approx(1.959964 * stdev / math.sqrt(len(values)))
+    assert accumulate([3.0]).stdev() == accumulate([3.0]).half_width() == 0.0
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 50])
+def test_merged_partial_means_equal_a_single_pass(parts):
+    rng = random.Random(parts)
+    values = [rng.paretovariate(1.5) * 10 for _ in range(500)]
+    cuts = sorted(rng.randint(0, len(values)) for _ in range(parts - 1))
+    chunks = [values[i:j] for i, j in zip([0] + cuts, cuts + [len(values)])]  # Some may be empty
+    merged = RunningMean()
+    for chunk in chunks:
+        merged.merge(accumulate(chunk))
+    single = accumulate(values)
+    assert merged.count == single.count
+    assert merged.mean == pytest.approx(single.mean, rel=1e-12)
+    assert merged.m2 == pytest.approx(single.m2, rel=1e-9)
+    assert merged.half_width(0.99) == pytest.approx(single.half_width(0.99), rel=1e-9)
+
+
+def test_ranks_share_places_on_ties():
+    assert montecarlo._ranks([3, 1, 3, 2]) == [3.5, 1.0, 3.5, 2.0]
+    assert montecarlo._ranks([3, 1, 3, 2], higher_is_better=True) == [1.5, 4.0, 1.5, 3.0]
+
+
+def test_one_worker_and_several_workers_rank_alike():
+    seen = []
+    serial = montecarlo.evaluate(16, SPEC, seed=7, max_workers=1, progress=lambda done, total: seen.append(done))
+    parallel = montecarlo.evaluate(16, SPEC, seed=7, max_workers=2)
+    assert serial.trials == parallel.trials == 16
+    assert seen[-1] == 16
+    for metric in (None, montecarlo.RANK, "TAT"):
+        one, many = montecarlo.ranking(serial, metric), montecarlo.ranking(parallel, metric)
+        assert [row[0] for row in one] == [row[0] for row in many]
+        assert [v for row in one for v in row[1:]] == pytest.approx([v for row in many for v in row[1:]])
+    for means in serial.stats.values():
+        assert all(mean.count == 16 for mean in means.values())
+
+
+def test_cli_jobs_do_not_change_the_ranking(tmp_path):
+    outputs = []
+    for jobs in ("1", "3"):
+        path = tmp_path / f"jobs{jobs}.json"
+        argv = ["montecarlo", "--trials", "12", "--processes", "30", "--seed", "3", "--jobs", jobs,
+                "--quiet", "--output", str(path)]
+        assert cli.main(argv) == 0
+        outputs.append(json.loads(path.read_text()))
+    one, many = (output["algorithms"] for output in outputs)
+    for metric in ("WT", montecarlo.RANK):
+        assert sorted(one, key=lambda a: one[a][metric]["mean"]) == sorted(many, key=lambda a: many[a][metric]["mean"])
+    for algorithm, metrics in one.items():
+        for metric, values in metrics.items():
+            assert values["mean"] == pytest.approx(many[algorithm][metric]["mean"])
+            assert values["ci"] == pytest.approx(many[algorithm][metric]["ci"])
+
+
+def test_another_seed_gives_other_workloads():
+    a = montecarlo.evaluate(4, SPEC, algorithms=["FCFS"], seed=0, max_workers=1)
+    b = montecarlo.evaluate(4, SPEC, algorithms=["FCFS"], seed=100, max_workers=1)
+    assert a.stats["FCFS"]["WT"].mean != b.stats["FCFS"]["WT"].mean
@@ -0,0 +1,173 @@
+"""The Scheduler policies against straightforward reference schedules.
+
+reference() is the original list-scanning implementation of the first five
+algorithms: rescan the arrived processes at every decision and take the
+minimum. engine.run must reproduce its segments and metrics exactly, and
+smp.run on one CPU and online.stream must reproduce engine.run for every
+registered policy.
+"""
+import random
+
+import pytest
+
+import engine
+import online
+import smp
+import workload
+from process_table import ProcessTable
+from schedulers import FifoScheduler
+
+
+def random_processes(n, seed):
+    rng = random.Random(seed)
+    processes = []
+    for pid in range(1, n + 1):
+        burst = rng.randint(1, 10)
+        processes.append({"pid": pid, "arrival": rng.randint(0, 3 * n), "burst": burst,
+                          "priority": rng.randint(0, 5)})
+    rng.shuffle(processes)
+    return processes
+
+
+def reference(algorithm, processes, quantum):
+    # (segments, metrics) as [(pid or None, start, end)] and metric rows
+    waiting = sorted((dict(p, remaining=p["burst"]) for p in processes), key=lambda p: p["arrival"])
+    for rank, p in enumerate(waiting):
+        p["rank"] = rank  # Ties go to the earliest arrival
+    key = {"SJF (Non-preemptive)": "burst", "SJF (Preemptive)": "remaining", "Priority": "priority"}.get(algorithm)
+    segments, metrics, first_run, queue = [], [], {}, []
+    t = 0
+
+    def arrive():
+        while waiting and waiting[0]["arrival"] <= t:
+            queue.append(waiting.pop(0))
+
+    while waiting or queue:
+        arrive()
+        if not queue:
+            segments.append((None, t, waiting[0]["arrival"]))
+            t = waiting[0]["arrival"]
+            continue
+        p = queue.pop(0) if key is None else queue.pop(queue.index(min(queue, key=lambda p: (p[key], p["rank"]))))
+        first_run.setdefault(p["pid"], t)
+        run = p["remaining"]
+        if algorithm == "Round Robin":
+            run = min(quantum, run)
+        elif algorithm == "SJF (Preemptive)" and waiting:
+            run = min(run, waiting[0]["arrival"] - t)
+        segments.append((p["pid"], t, t + run))
+        t += run
+        p["remaining"] -= run
+        arrive()
+        if p["remaining"]:
+            queue.append(p)
+        else:
+            tat = t - p["arrival"]
+            metrics.append((p["pid"], p["arrival"], p["burst"], t, tat, tat - p["burst"],
+                            first_run[p["pid"]] - p["arrival"]))
+    return segments, metrics
+
+
+def merged(segments):
+    # Busy segments with back-to-back runs of one process joined
+    out = []
+    for pid, start, end in segments:
+        if pid is None or end == start:
+            continue
+        if out and out[-1][0] == pid and out[-1][2] == start:
+            out[-1][2] = end
+        else:
+            out.append([pid, start, end])
+    return out
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "SJF (Non-preemptive)", "SJF (Preemptive)", "Priority", "Round Robin"])
+def test_engine_matches_reference(algorithm):
+    for seed in range(150):
+        processes = random_processes(1 + seed % 25, seed)
+        for quantum in ((1, 2, 3, 5) if algorithm == "Round Robin" else (4,)):
+            result = engine.run(algorithm, processes, quantum)
+            assert (list(result.segments), result.metrics) == reference(algorithm, processes, quantum)
+
+
+@pytest.mark.parametrize("algorithm", list(engine.ALGORITHMS))
+def test_smp_on_one_cpu_matches_engine(algorithm):
+    for seed in range(60):
+        table = ProcessTable.from_dicts(random_processes(1 + seed % 30, seed))
+        expected = engine.run(algorithm, table, 3)
+        for queues in smp.RUN_QUEUE_MODES:
+            result = smp.run(algorithm, table, cpus=1, quantum=3, queues=queues)
+            assert sorted(result.metrics) == sorted(expected.metrics)
+            assert merged(result.lanes[0]) == merged(expected.segments)
+
+
+@pytest.mark.parametrize("algorithm", list(engine.ALGORITHMS))
+@pytest.mark.parametrize("policy", list(smp.QUEUE_POLICIES))
+def test_smp_schedules_every_process_once(algorithm, policy):
+    for seed in range(20):
+        table = workload.generate(60, seed=seed, arrival_rate=0.8)
+        result = smp.run(algorithm, table, cpus=4, quantum=2, **smp.QUEUE_POLICIES[policy])
+        ran = {}
+        for lane in result.lanes:
+            for i in range(1, len(lane)):
+                assert lane[i - 1].end <= lane[i].start
+            for seg in lane:
+                ran[seg.pid] = ran.get(seg.pid, 0) + seg.end - seg.start
+        assert sorted(row[0] for row in result.metrics) == sorted(table.pid)
+        assert all(ran.get(row[0], 0) == row[2] for row in result.metrics)
+        # No process runs on two CPUs at once
+        spans = sorted((seg.start, seg.end, seg.pid) for lane in result.lanes for seg in lane if seg.end > seg.start)
+        last_end = {}
+        for start, end, pid in spans:
+            assert last_end.get(pid, start) <= start
+            last_end[pid] = end
+
+
+@pytest.mark.parametrize("algorithm", list(engine.ALGORITHMS))
+def test_online_matches_engine(algorithm):
+    for seed in range(60):
+        table = workload.generate(random.Random(seed).randint(0, 60), seed=seed)
+        rows = [(table.pid[i], table.arrival[i], table.burst[i], table.priority[i]) for i in table.arrival_order()]
+        for quantum in (1, 3):
+            expected = engine.run(algorithm, table, quantum)
+            events = list(online.stream(algorithm, iter(rows), quantum))
+            assert [seg for kind, seg in events if kind == "segment"] == expected.segments
+            assert [row for kind, row in events if kind == "completed"] == expected.metrics
+
+
+class LastComeFirstServed(FifoScheduler):
+    # A plugin policy that reuses the FIFO queue but doesn't run it in order
+    name = "LCFS"
+
+    def pick(self, now):
+        return self.queue.pop()
+
+
+def test_online_matches_engine_for_a_fifo_subclass_out_of_order(monkeypatch):
+    monkeypatch.setitem(engine.ALGORITHMS, LastComeFirstServed.name, LastComeFirstServed)
+    assert not LastComeFirstServed.runs_in_order
+    for seed in range(40):
+        table = workload.generate(random.Random(seed).randint(0, 60), seed=seed)
+        rows = [(table.pid[i], table.arrival[i], table.burst[i], table.priority[i]) for i in table.arrival_order()]
+        expected = engine.run("LCFS", table)
+        events = list(online.stream("LCFS", iter(rows)))
+        assert [seg for kind, seg in events if kind == "segment"] == expected.segments
+        assert [row for kind, row in events if kind == "completed"] == expected.metrics
+
+
+def test_only_fcfs_and_round_robin_run_in_order():
+    assert sorted(name for name, cls in engine.ALGORITHMS.items() if cls.runs_in_order) == ["FCFS", "Round Robin"]
+
+
+def test_online_fcfs_emits_each_process_before_reading_the_next():
+    read = []
+
+    def processes():
+        for row in [(1, 0, 5), (2, 1, 3), (3, 2, 4)]:
+            read.append(row[0])
+            yield row
+
+    for kind, payload in online.stream("FCFS", processes()):
+        if kind == "completed":
+            # Nothing after the completed process has been read yet
+            assert read[-1] == payload[0]
@@ -0,0 +1,93 @@
+"""Binary trace files: round trips and rejection of damaged files."""
+import struct
+
+import pytest
+
+import engine
+import tracefile
+import workload
+from process_table import ProcessTable
+from tracefile import TraceError
+
+
+def rows(table):
+    return [table.row(i) for i in range(len(table))]
+
+
+@pytest.fixture
+def table():
+    return workload.generate(500, seed=3, arrival_rate=0.1)  # Sparse enough to leave idle gaps
+
+
+def test_process_trace_round_trip(tmp_path, table):
+    path = str(tmp_path / "w.trace")
+    workload.save(table, path)
+    loaded = workload.load(path)
+    assert rows(loaded) == rows(table)
+    assert list(loaded.arrival_order()) == list(table.arrival_order())
+
+
+def test_saving_a_mapped_table_over_its_own_trace(tmp_path, table):
+    path = str(tmp_path / "w.trace")
+    workload.save(table, path)
+    loaded = workload.load(path)
+    workload.save(loaded, path)
+    # The loaded table still reads the file it was mapped from
+    assert rows(loaded) == rows(table)
+    assert rows(workload.load(path)) == rows(table)
+    assert [p.name for p in tmp_path.iterdir()] == ["w.trace"]
+
+
+def test_empty_process_trace(tmp_path):
+    path = str(tmp_path / "empty.trace")
+    workload.save(ProcessTable(), path)
+    assert len(workload.load(path)) == 0
+
+
+def test_schedule_trace_round_trip(tmp_path, table):
+    path = str(tmp_path / "s.trace")
+    result = engine.run("Round Robin", table, 3)
+    tracefile.write_schedule(result, path)
+    loaded = tracefile.load_schedule(path)
+    assert loaded.algorithm == "Round Robin"
+    assert list(loaded.segments) == result.segments
+    assert loaded.segments[:5] == result.segments[:5]
+    assert any(seg.pid is None for seg in loaded.segments)
+    assert list(loaded.metrics) == result.metrics
+    assert loaded.metrics[-1] == result.metrics[-1]
+    assert loaded.metrics.matrix.tolist() == [list(row) for row in result.metrics]
+
+
+def test_round_trip_through_the_byte_swapping_path(tmp_path, table, monkeypatch):
+    # What a big-endian host does: swap on write and copy and swap back on read
+    monkeypatch.setattr(tracefile, "_LITTLE_ENDIAN", False)
+    path = str(tmp_path / "w.trace")
+    tracefile.write_processes(table, path)
+    assert rows(tracefile.load_processes(path)) == rows(table)
+
+
+def header(magic=tracefile.MAGIC, version=tracefile.VERSION, kind=tracefile.PROCESSES, count=0, extra=0):
+    return tracefile.HEADER.pack(magic, version, kind, count, extra, 0)
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"", "empty"),
+    (b"SCHX", "too short"),
+    (header(magic=b"NOPE"), "not a Schedulix trace"),
+    (header(version=99), "version 99"),
+    (header(kind=tracefile.SCHEDULE), "holds a schedule"),
+    (header(count=10) + struct.pack("<4q", 1, 2, 3, 4), "truncated"),
+])
+def test_damaged_process_traces_are_rejected(tmp_path, data, message):
+    path = tmp_path / "bad.trace"
+    path.write_bytes(data)
+    with pytest.raises(TraceError, match=message):
+        workload.load(str(path))
+
+
+def test_truncated_schedule_trace_is_rejected(tmp_path, table):
+    path = tmp_path / "s.trace"
+    tracefile.write_schedule(engine.run("FCFS", table), str(path))
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(TraceError, match="truncated"):
+        tracefile.load_schedule(str(path))
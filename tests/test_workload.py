@@ -0,0 +1,58 @@
+"""CSV, JSON-lines and JSON array workloads: round trips and rejected input."""
+import pytest
+
+import workload
+from workload import WorkloadError
+
+
+def rows(table):
+    return list(zip(table.pid, table.arrival, table.burst, table.priority))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".ndjson", ".json"])
+def test_round_trip(tmp_path, suffix):
+    table = workload.generate(200, seed=5)
+    path = str(tmp_path / f"w{suffix}")
+    workload.save(table, path)
+    assert rows(workload.load(path)) == rows(table)
+
+
+def test_json_array_file(tmp_path):
+    path = tmp_path / "w.json"
+    path.write_text('[{"pid": 1, "arrival": 0, "burst": 5, "priority": 2},\n {"pid": 2, "arrival": 3, "burst": 4}]')
+    assert rows(workload.load(str(path))) == [(1, 0, 5, 2), (2, 3, 4, 0)]
+
+
+def test_csv_priority_is_optional_and_columns_can_be_reordered(tmp_path):
+    path = tmp_path / "w.csv"
+    path.write_text("burst, PID ,arrival\n5,1,0\n\n4,2,3\n")
+    assert rows(workload.load(str(path))) == [(1, 0, 5, 0), (2, 3, 4, 0)]
+
+
+@pytest.mark.parametrize("name, text, message", [
+    ("w.csv", "pid,arrival,burst\n1,0,5\n1,2,3\n", "Line 3: duplicate PID 1"),
+    ("w.csv", "pid,arrival,burst\n1,0,-5\n", "Line 2: arrival and burst must not be negative"),
+    ("w.csv", "pid,arrival,burst\n1,-1,5\n", "Line 2: arrival and burst must not be negative"),
+    ("w.csv", "pid,burst\n1,5\n", "must name pid, arrival and burst"),
+    ("w.csv", "", "must name pid, arrival and burst"),
+    ("w.csv", "pid,arrival,burst\n1,0,five\n", "Line 2: expected integer"),
+    ("w.csv", "pid,arrival,burst\n1,0\n", "Line 2: expected integer"),
+    ("w.jsonl", '{"pid": 1, "arrival": 0, "burst": 5}\n{"pid": 1, "arrival": 2, "burst": 3}\n',
+     "Line 2: duplicate PID 1"),
+    ("w.jsonl", '{"pid": 1, "arrival": 0, "burst": -1}\n', "Line 1: arrival and burst must not be negative"),
+    ("w.jsonl", '\n{"pid": 1, "arrival": 0}\n', "Line 2: expected an object"),
+    ("w.jsonl", '[1, 0, 5]\n', "Line 1: expected an object"),
+    ("w.jsonl", '{"pid": 1, "arrival": 0, "burst": \n', "Line 1: expected an object"),
+    ("w.json", '[{"pid": 1, "arrival": 0, "burst": 5}, {"pid": 1, "arrival": 2, "burst": 3}]',
+     "Item 2: duplicate PID 1"),
+    ("w.json", '[{"pid": 1, "arrival": -3, "burst": 5}]', "Item 1: arrival and burst must not be negative"),
+    ("w.json", '[{"pid": 1, "burst": 5}]', "Item 1: expected an object"),
+    ("w.json", '{"pid": 1, "arrival": 0, "burst": 5}', "must hold an array"),
+    ("w.json", '[{"pid": 1, "arrival": 0, "burst": 5}', "Not a valid JSON file"),
+    ("w.txt", "", "Unsupported workload file"),
+])
+def test_bad_workloads_are_rejected(tmp_path, name, text, message):
+    path = tmp_path / name
+    path.write_text(text)
+    with pytest.raises(WorkloadError, match=message):
+        workload.load(str(path))
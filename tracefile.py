@@ -0,0 +1,189 @@
+"""Binary trace files for Schedulix.
+
+A trace is a fixed 32-byte header followed by little-endian int64 columns:
+
+    magic "SCHX" | version u16 | kind u16 | rows u64 | extra u64 | name length u64
+
+A process trace (kind 1) holds the pid, arrival, burst and priority
+columns, then, when extra is 1, the arrival order, so loading needs no
+sort. A schedule trace (kind 2) holds the name of the algorithm, padded to
+8 bytes, then the segment pid, start and end columns (rows long, idle time
+has pid IDLE_PID) and extra metric rows of seven values each.
+
+load_processes() memory-maps the file and hands the columns to a
+ProcessTable as memoryviews, so even a multi-million-process trace loads in
+constant time and the schedulers read it straight from the page cache.
+Worker processes that receive such a table map the same file instead of
+copying it. Traces are written to a temporary file that then replaces the
+target, so saving a mapped table over its own trace leaves the mapping
+reading the old file rather than truncating it.
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Sequence
+from contextlib import contextmanager
+from itertools import chain
+
+from engine import ScheduleResult, Segment
+from process_table import ProcessTable
+from workload import WorkloadError
+
+MAGIC = b"SCHX"
+VERSION = 1
+PROCESSES, SCHEDULE = 1, 2
+HEADER = struct.Struct("<4sHHQQQ")
+IDLE_PID = -(2 ** 63)  # Stands in for None in the segment pid column
+METRIC_WIDTH = 7  # (pid, arrival, burst, ct, tat, wt, rt)
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class TraceError(WorkloadError):
+    pass
+
+
+def _column(values):
+    # int64 little-endian bytes of any integer column
+    col = values if isinstance(values, array) and values.typecode == "q" else array("q", values)
+    if not _LITTLE_ENDIAN:
+        col = array("q", col)
+        col.byteswap()
+    return col
+
+
+def _padded(name):
+    data = name.encode("utf-8")
+    return data + bytes(-len(data) % 8)
+
+
+@contextmanager
+def _replacing(path):
+    # Yields a temporary file next to path and moves it over path once written
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.chmod(tmp, os.stat(path).st_mode if os.path.exists(path) else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_processes(table, path):
+    order = table.arrival_order()
+    with _replacing(path) as f:
+        f.write(HEADER.pack(MAGIC, VERSION, PROCESSES, len(table), 1, 0))
+        for column in (table.pid, table.arrival, table.burst, table.priority, order):
+            _column(column).tofile(f)
+
+
+def write_schedule(result, path):
+    name = _padded(result.algorithm)
+    segments, metrics = result.segments, result.metrics
+    with _replacing(path) as f:
+        f.write(HEADER.pack(MAGIC, VERSION, SCHEDULE, len(segments), len(metrics), len(name)))
+        f.write(name)
+        _column(IDLE_PID if seg.pid is None else seg.pid for seg in segments).tofile(f)
+        _column(seg.start for seg in segments).tofile(f)
+        _column(seg.end for seg in segments).tofile(f)
+        _column(chain.from_iterable(metrics)).tofile(f)
+
+
+def _open(path, kind):
+    # Maps path read-only and checks its header; returns (view, rows, extra, name)
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise TraceError(f"{path} is empty")
+    view = memoryview(mapped)
+    if len(view) < HEADER.size:
+        raise TraceError(f"{path} is too short to be a trace")
+    magic, version, found, rows, extra, name_length = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise TraceError(f"{path} is not a Schedulix trace")
+    if version != VERSION:
+        raise TraceError(f"{path} is trace version {version}, this build reads version {VERSION}")
+    if found != kind:
+        raise TraceError(f"{path} holds a {'schedule' if found == SCHEDULE else 'process list'}, not a "
+                         f"{'schedule' if kind == SCHEDULE else 'process list'}")
+    name = bytes(view[HEADER.size:HEADER.size + name_length]).rstrip(b"\0").decode("utf-8")
+    return view[HEADER.size + name_length:], rows, extra, name
+
+
+def _columns(view, rows, count, path):
+    # count int64 columns of rows values each, as memoryviews over the map
+    size = 8 * rows
+    if len(view) < size * count:
+        raise TraceError(f"{path} is truncated")
+    columns = []
+    for i in range(count):
+        column = view[i * size:(i + 1) * size]
+        if _LITTLE_ENDIAN:
+            columns.append(column.cast("q"))
+        else:
+            swapped = array("q", bytes(column))
+            swapped.byteswap()
+            columns.append(swapped)
+    return columns
+
+
+def load_processes(path):
+    view, rows, has_order, _ = _open(path, PROCESSES)
+    columns = _columns(view, rows, 5 if has_order else 4, path)
+    order = columns[4] if has_order else None
+    return ProcessTable.wrap(*columns[:4], order=order, source=path)
+
+
+class MappedSegments(Sequence):
+    # The segment columns of a schedule trace; Segments are built on access
+    def __init__(self, pid, start, end):
+        self.pid, self.start, self.end = pid, start, end
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        pid = self.pid[i]
+        return Segment(None if pid == IDLE_PID else pid, self.start[i], self.end[i])
+
+    def __iter__(self):
+        for pid, start, end in zip(self.pid, self.start, self.end):
+            yield Segment(None if pid == IDLE_PID else pid, start, end)
+
+
+class MappedMetrics(Sequence):
+    # The metric rows of a schedule trace; matrix is the (n, 7) int64 view that as_matrix uses
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows) // METRIC_WIDTH
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return tuple(self.rows[i * METRIC_WIDTH:(i + 1) * METRIC_WIDTH])
+
+    @property
+    def matrix(self):
+        import numpy as np
+        return np.frombuffer(self.rows, dtype=np.int64).reshape(len(self), METRIC_WIDTH)
+
+
+def load_schedule(path):
+    view, segments, metrics, name = _open(path, SCHEDULE)
+    pid, start, end = _columns(view, segments, 3, path)
+    (rows,) = _columns(view[3 * 8 * segments:], metrics * METRIC_WIDTH, 1, path)
+    return ScheduleResult(name, MappedSegments(pid, start, end), MappedMetrics(rows))
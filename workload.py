@@ -0,0 +1,235 @@
+"""Bulk workload import/export and synthetic workload generation.
+
+Files are read and written one row at a time straight into (or out of) the
+columns of a ProcessTable, so no per-process dicts are built. Supported
+formats are CSV with a pid,arrival,burst[,priority] header, JSON lines
+(.jsonl, .ndjson) with the same keys, a .json array of such objects (which
+is parsed whole), and binary .trace files, which are memory-mapped rather
+than read (see tracefile.py). iter_rows() and follow() stream (pid,
+arrival, burst, priority) tuples without building a table, for the online
+scheduler.
+"""
+import csv
+import json
+import time
+from array import array
+
+from process_table import FIELDS, ProcessTable
+
+
+class WorkloadError(ValueError):
+    pass
+
+
+def _format_of(path):
+    if path.endswith(".csv"):
+        return "csv"
+    if path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path.endswith(".json"):
+        return "json"
+    if path.endswith(".trace"):
+        return "trace"
+    raise WorkloadError(f"Unsupported workload file: {path} (use .csv, .jsonl, .json or .trace)")
+
+
+class _Builder:
+    # Collects rows into typed columns and rejects duplicate PIDs as they stream in
+    def __init__(self):
+        self.columns = {field: array("q") for field in FIELDS}
+        self.seen = set()
+
+    def add(self, where, pid, arrival, burst, priority):
+        # where names the row in errors, e.g. "Line 3" or "Item 3"
+        if pid in self.seen:
+            raise WorkloadError(f"{where}: duplicate PID {pid}")
+        if burst < 0 or arrival < 0:
+            raise WorkloadError(f"{where}: arrival and burst must not be negative")
+        self.seen.add(pid)
+        self.columns["pid"].append(pid)
+        self.columns["arrival"].append(arrival)
+        self.columns["burst"].append(burst)
+        self.columns["priority"].append(priority)
+
+    def table(self):
+        return ProcessTable(*(self.columns[field] for field in FIELDS))
+
+
+def iter_csv(lines):
+    # Yields (line_no, (pid, arrival, burst, priority)) from any iterable of CSV lines
+    reader = csv.reader(lines)
+    header = [name.strip().lower() for name in next(reader, [])]
+    try:
+        cols = [header.index(name) for name in ("pid", "arrival", "burst")]
+    except ValueError:
+        raise WorkloadError("CSV header must name pid, arrival and burst columns")
+    prio_col = header.index("priority") if "priority" in header else None
+
+    for line_no, row in enumerate(reader, start=2):
+        if not row:
+            continue
+        try:
+            pid, arrival, burst = (int(row[c]) for c in cols)
+            priority = int(row[prio_col]) if prio_col is not None and row[prio_col].strip() else 0
+        except (ValueError, IndexError):
+            raise WorkloadError(f"Line {line_no}: expected integer pid, arrival, burst and priority")
+        yield line_no, (pid, arrival, burst, priority)
+
+
+def _json_row(p):
+    return int(p["pid"]), int(p["arrival"]), int(p["burst"]), int(p.get("priority", 0))
+
+
+def iter_jsonl(lines):
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = _json_row(json.loads(line))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise WorkloadError(f"Line {line_no}: expected an object with integer pid, arrival and burst")
+        yield line_no, row
+
+
+def read_csv(f):
+    builder = _Builder()
+    for line_no, row in iter_csv(f):
+        builder.add(f"Line {line_no}", *row)
+    return builder.table()
+
+
+def read_jsonl(f):
+    builder = _Builder()
+    for line_no, row in iter_jsonl(f):
+        builder.add(f"Line {line_no}", *row)
+    return builder.table()
+
+
+def read_json(f):
+    # A whole-file JSON array of process objects
+    try:
+        processes = json.load(f)
+    except ValueError as e:
+        raise WorkloadError(f"Not a valid JSON file: {e}")
+    if not isinstance(processes, list):
+        raise WorkloadError("A .json workload must hold an array of process objects")
+    builder = _Builder()
+    for item_no, p in enumerate(processes, start=1):
+        try:
+            row = _json_row(p)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise WorkloadError(f"Item {item_no}: expected an object with integer pid, arrival and burst")
+        builder.add(f"Item {item_no}", *row)
+    return builder.table()
+
+
+def iter_rows(lines, fmt):
+    # Streams process tuples from lines in "csv" or "jsonl" format
+    rows = iter_csv(lines) if fmt == "csv" else iter_jsonl(lines)
+    for _, row in rows:
+        yield row
+
+
+def follow(f, poll_interval=0.5, cancel=None):
+    # Yields complete lines from a file that is still being written, like tail -f
+    partial = ""
+    while cancel is None or not cancel.cancelled:
+        line = f.readline()
+        if not line:
+            time.sleep(poll_interval)
+            continue
+        partial += line
+        if partial.endswith("\n"):
+            yield partial
+            partial = ""
+
+
+def write_csv(table, f):
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(FIELDS)
+    writer.writerows(zip(table.pid, table.arrival, table.burst, table.priority))
+
+
+def write_jsonl(table, f):
+    for pid, arrival, burst, priority in zip(table.pid, table.arrival, table.burst, table.priority):
+        f.write(f'{{"pid": {pid}, "arrival": {arrival}, "burst": {burst}, "priority": {priority}}}\n')
+
+
+def write_json(table, f):
+    separator = "\n  "
+    f.write("[")
+    for pid, arrival, burst, priority in zip(table.pid, table.arrival, table.burst, table.priority):
+        f.write(f'{separator}{{"pid": {pid}, "arrival": {arrival}, "burst": {burst}, "priority": {priority}}}')
+        separator = ",\n  "
+    f.write("\n]\n")
+
+
+def load(path):
+    fmt = _format_of(path)
+    if fmt == "trace":
+        import tracefile
+
+        return tracefile.load_processes(path)
+    with open(path, newline="") as f:
+        if fmt == "csv":
+            return read_csv(f)
+        if fmt == "json":
+            return read_json(f)
+        return read_jsonl(f)
+
+
+def save(table, path):
+    fmt = _format_of(path)
+    if fmt == "trace":
+        import tracefile
+
+        return tracefile.write_processes(table, path)
+    with open(path, "w", newline="") as f:
+        if fmt == "csv":
+            write_csv(table, f)
+        elif fmt == "json":
+            write_json(table, f)
+        else:
+            write_jsonl(table, f)
+
+
+BURST_DISTRIBUTIONS = ("exponential", "pareto", "uniform")
+PRIORITY_DISTRIBUTIONS = ("uniform", "geometric")
+
+
+def generate(n, seed=0, arrival_rate=1.0, burst="exponential", mean_burst=5.0,
+             pareto_shape=1.5, priority_levels=10, priority="uniform"):
+    # Poisson arrivals at arrival_rate per time unit; bursts are at least 1 unit.
+    # "pareto" gives heavy-tailed bursts, "geometric" priorities favour level 0.
+    if n < 0 or arrival_rate <= 0 or mean_burst <= 0 or priority_levels <= 0:
+        raise WorkloadError("n must be >= 0 and rate, mean burst and priority levels > 0")
+    import numpy as np
+    rng = np.random.default_rng(seed)
+
+    arrivals = np.floor(np.cumsum(rng.exponential(1.0 / arrival_rate, n)))
+
+    if burst == "exponential":
+        bursts = rng.exponential(mean_burst, n)
+    elif burst == "pareto":
+        # Scale the Lomax draw so the mean matches mean_burst when shape > 1
+        scale = mean_burst * (pareto_shape - 1) / pareto_shape if pareto_shape > 1 else mean_burst
+        bursts = (rng.pareto(pareto_shape, n) + 1) * scale
+    elif burst == "uniform":
+        bursts = rng.uniform(1, 2 * mean_burst, n)
+    else:
+        raise WorkloadError(f"Unknown burst distribution: {burst}")
+    bursts = np.maximum(np.ceil(bursts), 1)
+
+    if priority == "uniform":
+        priorities = rng.integers(0, priority_levels, n)
+    elif priority == "geometric":
+        priorities = np.minimum(rng.geometric(0.5, n) - 1, priority_levels - 1)
+    else:
+        raise WorkloadError(f"Unknown priority distribution: {priority}")
+
+    def column(values):
+        col = array("q")
+        col.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        return col
+
+    return ProcessTable(column(np.arange(1, n + 1)), column(arrivals), column(bursts), column(priorities))